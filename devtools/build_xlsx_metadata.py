@@ -0,0 +1,56 @@
+#!/usr/bin/env python
+"""Pickle the excel spreadsheet metadata of each dataset into its package.
+
+Parses the skiprows, tab map, file name map and column map CSVs of each of
+the requested datasets under pudl.package_data.meta.xlsx_maps, and writes
+the result into a metadata.pkl file alongside them, which is loaded instead
+of the CSVs as long as they don't change. Run this before building the PUDL
+package so that the metadata doesn't have to be parsed on every import.
+
+"""
+
+import argparse
+import logging
+import sys
+
+import coloredlogs
+
+import pudl
+
+logger = logging.getLogger(pudl.__name__)
+
+
+def parse_command_line(argv):
+    """
+    Parse command line arguments. See the -h option.
+
+    Args:
+        argv (list): Command line arguments, including caller filename.
+
+    Returns:
+        dict: Dictionary of command line arguments and their parsed values.
+
+    """
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument(
+        '-d',
+        '--datasets',
+        nargs='+',
+        help="""Datasets to pickle the metadata of. (default: %(default)s).""",
+        default=['eia860', 'eia861', 'eia923']
+    )
+    return parser.parse_args(argv[1:])
+
+
+def main():
+    """Pickle the excel metadata of the selected datasets."""
+    log_format = '%(asctime)s [%(levelname)8s] %(name)s:%(lineno)s %(message)s'
+    coloredlogs.install(fmt=log_format, level='INFO', logger=logger)
+    args = parse_command_line(sys.argv)
+    for dataset in args.datasets:
+        path = pudl.extract.excel.write_metadata_pickle(dataset)
+        logger.info(f"Wrote {dataset} excel metadata to {path}")
+
+
+if __name__ == "__main__":
+    sys.exit(main())
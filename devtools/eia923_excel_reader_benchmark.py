@@ -0,0 +1,89 @@
+#!/usr/bin/env python
+"""Compare the speed of the readers used to parse the EIA 923 spreadsheets.
+
+Parses each of the requested EIA 923 pages for a single year from the excel
+files in the local PUDL datastore, both with pd.read_excel() (which is how all
+of the pages used to be read) and with pudl.extract.excel.read_sheet_streaming()
+(which reads the rows of one sheet at a time in read-only mode). Reports the
+wall time each reader takes, and checks that both readers produce the same
+DataFrame for every page.
+
+"""
+
+import argparse
+import logging
+import sys
+import time
+
+import coloredlogs
+import pandas as pd
+
+import pudl
+import pudl.constants as pc
+
+logger = logging.getLogger(pudl.__name__)
+
+
+def parse_command_line(argv):
+    """
+    Parse command line arguments. See the -h option.
+
+    Args:
+        argv (list): Command line arguments, including caller filename.
+
+    Returns:
+        dict: Dictionary of command line arguments and their parsed values.
+
+    """
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument(
+        '-y',
+        '--year',
+        type=int,
+        help="""Year of EIA 923 data to read. (default: %(default)s).""",
+        default=max(pc.working_years['eia923'])
+    )
+    parser.add_argument(
+        '-p',
+        '--pages',
+        nargs='+',
+        help="""EIA 923 pages to read. (default: %(default)s).""",
+        default=pudl.extract.eia923.Extractor.STREAMING_PAGES
+    )
+    return parser.parse_args(argv[1:])
+
+
+def main():
+    """Time both excel readers on the selected EIA 923 pages."""
+    log_format = '%(asctime)s [%(levelname)8s] %(name)s:%(lineno)s %(message)s'
+    coloredlogs.install(fmt=log_format, level='WARNING', logger=logger)
+    args = parse_command_line(sys.argv)
+    data_dir = pudl.workspace.setup.get_defaults()["data_dir"]
+    extractor = pudl.extract.eia923.Extractor(data_dir, use_cache=False)
+
+    results = []
+    for page in args.pages:
+        file_path = extractor._get_file_path(args.year, page)
+        read_kwargs = extractor.get_read_kwargs(args.year, page)
+        dfs = {}
+        for reader, read in [
+            ("read_excel", pd.read_excel),
+            ("streaming", pudl.extract.excel.read_sheet_streaming),
+        ]:
+            start = time.perf_counter()
+            dfs[reader] = read(file_path, **read_kwargs)
+            results.append({
+                "page": page,
+                "reader": reader,
+                "seconds": time.perf_counter() - start,
+            })
+        pd.testing.assert_frame_equal(dfs["read_excel"], dfs["streaming"])
+
+    results = pd.DataFrame(results).pivot(
+        index="page", columns="reader", values="seconds")
+    results["speedup"] = results.read_excel / results.streaming
+    print(results.to_string())
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,109 @@
+#!/usr/bin/env python
+"""Compare the throughput of the pandas and pyarrow EPA CEMS CSV readers.
+
+Reads all twelve monthly zipped CSV files for each of the requested state-years
+from the local PUDL datastore using each of the available readers, checks that
+they produce the same data, and reports the wall time and number of records
+read per second.
+
+"""
+
+import argparse
+import logging
+import pathlib
+import sys
+import time
+
+import coloredlogs
+import pandas as pd
+
+import pudl
+import pudl.constants as pc
+import pudl.workspace.datastore as datastore
+
+logger = logging.getLogger(pudl.__name__)
+
+
+def parse_command_line(argv):
+    """
+    Parse command line arguments. See the -h option.
+
+    Args:
+        argv (list): Command line arguments, including caller filename.
+
+    Returns:
+        dict: Dictionary of command line arguments and their parsed values.
+
+    """
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument(
+        '-y',
+        '--years',
+        nargs='+',
+        type=int,
+        help="""Years of EPA CEMS data to read. (default: %(default)s).""",
+        default=[max(pc.data_years['epacems'])]
+    )
+    parser.add_argument(
+        '-s',
+        '--states',
+        nargs='+',
+        type=str.upper,
+        help="""States of EPA CEMS data to read. (default: %(default)s).""",
+        default=['ID']
+    )
+    parser.add_argument(
+        '-r',
+        '--repeat',
+        type=int,
+        help="""Number of times to read each state-year with each reader.
+        The fastest time is reported. (default: %(default)s).""",
+        default=3
+    )
+    return parser.parse_args(argv[1:])
+
+
+def main():
+    """Time the EPA CEMS CSV readers on the selected state-years."""
+    log_format = '%(asctime)s [%(levelname)8s] %(name)s:%(lineno)s %(message)s'
+    coloredlogs.install(fmt=log_format, level='WARNING', logger=logger)
+    args = parse_command_line(sys.argv)
+    data_dir = pudl.workspace.setup.get_defaults()["data_dir"]
+
+    results = []
+    for year in args.years:
+        for state in args.states:
+            dfs = {}
+            for reader in pc.epacems_readers:
+                times = []
+                for _ in range(args.repeat):
+                    start = time.perf_counter()
+                    raw_dfs = pudl.extract.epacems.extract(
+                        epacems_years=[year], states=[state],
+                        data_dir=data_dir, reader=reader)
+                    df = list(next(raw_dfs).values())[0]
+                    times.append(time.perf_counter() - start)
+                dfs[reader] = df
+                results.append({
+                    "year": year,
+                    "state": state,
+                    "reader": reader,
+                    "records": len(df),
+                    "seconds": min(times),
+                    "records_per_second": len(df) / min(times),
+                    "zipped_mb": sum(
+                        pathlib.Path(datastore.path(
+                            'epacems', year=year, month=month, state=state,
+                            data_dir=data_dir)).stat().st_size
+                        for month in range(1, 13)) / 2**20,
+                })
+            baseline = dfs["pandas"]
+            for reader, df in dfs.items():
+                pd.testing.assert_frame_equal(
+                    baseline, df[baseline.columns], check_like=True)
+
+    print(pd.DataFrame(results).to_string(index=False))
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,127 @@
+#!/usr/bin/env python
+"""Score the FERC plant classifier over a grid of feature weights.
+
+Reads the large steam plant and fuel tables from the PUDL database, and scores
+a FERC plant classifier for every combination of the requested feature weights
+and minimum cosine similarities, against a set of FERC plant record groups
+which have been classified by hand. Each of the features is only calculated
+once. Reports the score, the fraction of records that were assigned to a
+group, and the wall time each combination takes.
+
+The hand classified groups are read from a text file, which has one group per
+line. Each group is a comma separated list of the FERC record IDs which belong
+to the same plant.
+
+"""
+
+import argparse
+import logging
+import sys
+
+import coloredlogs
+import pandas as pd
+import sqlalchemy as sa
+
+import pudl
+
+logger = logging.getLogger(pudl.__name__)
+
+
+def parse_weights(arg):
+    """Parse a feature=weight,weight,... command line argument."""
+    try:
+        name, weights = arg.split('=')
+        return name, [float(wt) for wt in weights.split(',')]
+    except ValueError:
+        raise argparse.ArgumentTypeError(
+            f"Expected feature=weight,weight,... but got {arg}")
+
+
+def parse_command_line(argv):
+    """
+    Parse command line arguments. See the -h option.
+
+    Args:
+        argv (list): Command line arguments, including caller filename.
+
+    Returns:
+        dict: Dictionary of command line arguments and their parsed values.
+
+    """
+    parser = argparse.ArgumentParser(
+        description=__doc__,
+        formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument(
+        'groups',
+        type=str,
+        help="""Path to a file of hand classified FERC plant record groups.""",
+    )
+    parser.add_argument(
+        '-w',
+        '--weights',
+        nargs='+',
+        type=parse_weights,
+        help="""Weights to try for each feature, e.g.
+        plant_name_ferc1=1,2,4. Features which aren't listed use the default
+        weights of pudl.transform.ferc1.make_ferc1_clf.""",
+        default=[]
+    )
+    parser.add_argument(
+        '-s',
+        '--min-sims',
+        nargs='+',
+        type=float,
+        help="""Minimum cosine similarities to try. (default: %(default)s).""",
+        default=[0.75]
+    )
+    parser.add_argument(
+        '--ngram-max',
+        type=int,
+        help="""Maximum length of the plant name n-grams.
+        (default: %(default)s).""",
+        default=10
+    )
+    parser.add_argument(
+        '--workers',
+        type=int,
+        help="""Number of worker processes to use for scoring.
+        (default: %(default)s).""",
+        default=1
+    )
+    parser.add_argument(
+        '-o',
+        '--output',
+        type=str,
+        help="""Path to a CSV file in which to save all of the scores.""",
+        default=None
+    )
+    return parser.parse_args(argv[1:])
+
+
+def main():
+    """Score the FERC plant classifier over a grid of parameters."""
+    log_format = '%(asctime)s [%(levelname)8s] %(name)s:%(lineno)s %(message)s'
+    coloredlogs.install(fmt=log_format, level='INFO', logger=logger)
+    args = parse_command_line(sys.argv)
+    pudl_settings = pudl.workspace.setup.get_defaults()
+
+    with open(args.groups) as f:
+        true_groups = [line.strip() for line in f if line.strip()]
+
+    pudl_engine = sa.create_engine(pudl_settings["pudl_db"])
+    plants_df = pudl.transform.ferc1._plants_steam_clf_input(
+        pd.read_sql("plants_steam_ferc1", pudl_engine),
+        pd.read_sql("fuel_ferc1", pudl_engine),
+    )
+
+    results = pudl.transform.ferc1.sweep_ferc1_clf(
+        plants_df, true_groups, weights=dict(args.weights),
+        min_sims=args.min_sims, ngram_max=args.ngram_max,
+        workers=args.workers)
+    if args.output is not None:
+        results.to_csv(args.output, index=False)
+    print(results.to_string(index=False))
+
+
+if __name__ == "__main__":
+    sys.exit(main())
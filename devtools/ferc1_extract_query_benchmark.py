@@ -0,0 +1,142 @@
+#!/usr/bin/env python
+"""Time the FERC Form 1 extract queries with and without the SQLite indexes.
+
+Copies the cloned FERC Form 1 SQLite database from the default PUDL workspace
+into a temporary directory, and removes any of the indexes defined in
+pudl.constants.ferc1_sqlite_indexes from the copy. Then runs each of the FERC
+Form 1 extract queries, and the plant query used for FERC to EIA plant
+mapping, both before and after creating the indexes, and reports the wall time
+each query takes.
+
+"""
+
+import argparse
+import logging
+import pathlib
+import shutil
+import sys
+import tempfile
+import time
+
+import coloredlogs
+import pandas as pd
+import sqlalchemy as sa
+
+import pudl
+import pudl.constants as pc
+
+logger = logging.getLogger(pudl.__name__)
+
+
+def parse_command_line(argv):
+    """
+    Parse command line arguments. See the -h option.
+
+    Args:
+        argv (list): Command line arguments, including caller filename.
+
+    Returns:
+        dict: Dictionary of command line arguments and their parsed values.
+
+    """
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument(
+        '-y',
+        '--years',
+        nargs='+',
+        type=int,
+        help="""Years of FERC Form 1 data to query. (default: %(default)s).""",
+        default=[max(pc.working_years['ferc1'])]
+    )
+    parser.add_argument(
+        '-r',
+        '--repeat',
+        type=int,
+        help="""Number of times to run each query. The fastest time is
+        reported. (default: %(default)s).""",
+        default=3
+    )
+    return parser.parse_args(argv[1:])
+
+
+def time_queries(pudl_settings, years, repeat):
+    """Time each of the FERC Form 1 queries, returning the fastest times."""
+    ferc1_meta = pudl.extract.ferc1.get_ferc1_meta(
+        sa.create_engine(pudl_settings["ferc1_db"]))
+    queries = {
+        ferc1_table: (
+            lambda func=func, ferc1_table=ferc1_table:
+            func(ferc1_meta, ferc1_table, years)
+        )
+        for ferc1_table, func in [
+            ("f1_fuel", pudl.extract.ferc1.fuel),
+            ("f1_steam", pudl.extract.ferc1.plants_steam),
+            ("f1_gnrt_plant", pudl.extract.ferc1.plants_small),
+            ("f1_hydro", pudl.extract.ferc1.plants_hydro),
+            ("f1_pumped_storage", pudl.extract.ferc1.plants_pumped_storage),
+            ("f1_plant_in_srvce", pudl.extract.ferc1.plant_in_service),
+            ("f1_purchased_pwr", pudl.extract.ferc1.purchased_power),
+            ("f1_accumdepr_prvsn", pudl.extract.ferc1.accumulated_depreciation),
+        ]
+    }
+    queries["glue_plants_ferc1"] = (
+        lambda: pudl.glue.ferc1_eia.get_db_plants_ferc1(pudl_settings, years))
+
+    times = {}
+    for name, query in queries.items():
+        elapsed = []
+        for _ in range(repeat):
+            start = time.perf_counter()
+            query()
+            elapsed.append(time.perf_counter() - start)
+        times[name] = min(elapsed)
+    ferc1_meta.bind.dispose()
+    return times
+
+
+def main():
+    """Time the FERC Form 1 extract queries with and without indexes."""
+    log_format = '%(asctime)s [%(levelname)8s] %(name)s:%(lineno)s %(message)s'
+    coloredlogs.install(fmt=log_format, level='WARNING', logger=logger)
+    args = parse_command_line(sys.argv)
+    pudl_settings = pudl.workspace.setup.get_defaults()
+
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        db_path = pathlib.Path(tmp_dir, "ferc1.sqlite")
+        shutil.copy(
+            pathlib.Path(pudl_settings["sqlite_dir"], "ferc1.sqlite"), db_path)
+        pudl_settings = dict(pudl_settings, ferc1_db=f"sqlite:///{db_path}")
+
+        ferc1_engine = sa.create_engine(pudl_settings["ferc1_db"])
+        ferc1_meta = sa.MetaData(bind=ferc1_engine)
+        ferc1_meta.reflect()
+        index_names = {
+            f"ix_{table}_{'_'.join(columns)}"
+            for table, column_sets in pc.ferc1_sqlite_indexes.items()
+            for columns in column_sets
+        }
+        for table in ferc1_meta.tables.values():
+            for index in list(table.indexes):
+                if index.name in index_names:
+                    index.drop(bind=ferc1_engine)
+
+        before = time_queries(pudl_settings, args.years, args.repeat)
+        ferc1_meta = sa.MetaData(bind=ferc1_engine)
+        ferc1_meta.reflect()
+        start = time.perf_counter()
+        pudl.extract.ferc1.create_sqlite_indexes(ferc1_meta)
+        index_seconds = time.perf_counter() - start
+        after = time_queries(pudl_settings, args.years, args.repeat)
+        ferc1_engine.dispose()
+
+    results = pd.DataFrame({
+        "without_indexes": pd.Series(before),
+        "with_indexes": pd.Series(after),
+    })
+    results["speedup"] = results.without_indexes / results.with_indexes
+    print(results.to_string())
+    print(f"Creating the indexes took {index_seconds:.1f} seconds.")
+
+
+if __name__ == "__main__":
+    sys.exit(main())
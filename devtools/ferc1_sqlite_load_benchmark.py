@@ -0,0 +1,133 @@
+#!/usr/bin/env python
+"""Compare the speed of loading FERC Form 1 tables into SQLite in bulk.
+
+Reads the requested FERC Form 1 tables from the DBF files in the local PUDL
+datastore, and then loads them into a fresh SQLite database using each of the
+available loading methods: pandas.DataFrame.to_sql (the default), and a bulk
+load using sqlite3's executemany with journaling and disk syncing turned off.
+Reports the wall time each method takes, and checks that both databases end up
+with the same number of records in each table.
+
+"""
+
+import argparse
+import logging
+import pathlib
+import sys
+import tempfile
+import time
+
+import coloredlogs
+import pandas as pd
+import sqlalchemy as sa
+
+import pudl
+import pudl.constants as pc
+
+logger = logging.getLogger(pudl.__name__)
+
+
+def parse_command_line(argv):
+    """
+    Parse command line arguments. See the -h option.
+
+    Args:
+        argv (list): Command line arguments, including caller filename.
+
+    Returns:
+        dict: Dictionary of command line arguments and their parsed values.
+
+    """
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument(
+        '-t',
+        '--tables',
+        nargs='+',
+        help="""FERC Form 1 tables to load. (default: %(default)s).""",
+        default=['f1_respondent_id', 'f1_fuel', 'f1_steam',
+                 'f1_plant_in_srvce', 'f1_purchased_pwr']
+    )
+    parser.add_argument(
+        '-y',
+        '--years',
+        nargs='+',
+        type=int,
+        help="""Years of FERC Form 1 data to load. (default: %(default)s).""",
+        default=list(pc.working_years['ferc1'])
+    )
+    parser.add_argument(
+        '-r',
+        '--refyear',
+        type=int,
+        help="""Year of the FERC Form 1 DB to use as a template.
+        (default: %(default)s).""",
+        default=max(pc.working_years['ferc1'])
+    )
+    return parser.parse_args(argv[1:])
+
+
+def main():
+    """Time the FERC Form 1 SQLite loading methods on the selected tables."""
+    log_format = '%(asctime)s [%(levelname)8s] %(name)s:%(lineno)s %(message)s'
+    coloredlogs.install(fmt=log_format, level='WARNING', logger=logger)
+    args = parse_command_line(sys.argv)
+    data_dir = pudl.workspace.setup.get_defaults()["data_dir"]
+
+    dbc_map = pudl.extract.ferc1.get_dbc_map(args.refyear, data_dir=data_dir)
+    raw_dfs = {
+        table: pudl.extract.ferc1.get_raw_df(
+            table, dbc_map, data_dir=data_dir, years=args.years)
+        for table in args.tables
+    }
+
+    results = []
+    counts = {}
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        for bulk_load in (False, True):
+            method = "bulk" if bulk_load else "to_sql"
+            db_path = pathlib.Path(tmp_dir, f"ferc1_{method}.sqlite")
+            sqlite_engine = sa.create_engine(f"sqlite:///{db_path}")
+            sqlite_meta = sa.MetaData(bind=sqlite_engine)
+            pudl.extract.ferc1.define_sqlite_db(
+                sqlite_meta, dbc_map, data_dir=data_dir, tables=args.tables,
+                refyear=args.refyear)
+
+            dbapi_conn = None
+            start = time.perf_counter()
+            if bulk_load:
+                dbapi_conn = sqlite_engine.raw_connection()
+                cursor = dbapi_conn.cursor()
+                cursor.execute("PRAGMA journal_mode = OFF")
+                cursor.execute("PRAGMA synchronous = OFF")
+                cursor.close()
+            for table, df in raw_dfs.items():
+                pudl.extract.ferc1._load_sqlite_table(
+                    table, df, sqlite_engine, sqlite_meta,
+                    dbapi_conn=dbapi_conn)
+            if dbapi_conn is not None:
+                dbapi_conn.close()
+            seconds = time.perf_counter() - start
+
+            counts[method] = {
+                table: sqlite_engine.execute(
+                    f'SELECT COUNT(*) FROM "{table}"').scalar()
+                for table in args.tables
+            }
+            n_records = sum(counts[method].values())
+            results.append({
+                "method": method,
+                "records": n_records,
+                "seconds": seconds,
+                "records_per_second": n_records / seconds,
+                "db_mb": db_path.stat().st_size / 2**20,
+            })
+            sqlite_engine.dispose()
+
+    if counts["to_sql"] != counts["bulk"]:
+        raise AssertionError(
+            f"Record counts differ between loading methods: {counts}")
+    print(pd.DataFrame(results).to_string(index=False))
+
+
+if __name__ == "__main__":
+    sys.exit(main())
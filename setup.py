@@ -16,8 +16,9 @@ install_requires = [
     "matplotlib",
     "networkx>=2.2",
     "numpy",
+    "openpyxl>=2.6",
     "pandas>=1.0",
-    "pyarrow>=0.16",
+    "pyarrow>=1.0",
     "pyyaml",
     "scikit-learn>=0.20",
     "scipy",
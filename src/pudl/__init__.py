@@ -25,9 +25,11 @@ import pudl.glue.ferc1_eia
 import pudl.helpers
 import pudl.load.csv
 import pudl.load.metadata
+import pudl.load.parquet
 # Output modules by data source:
 import pudl.output.eia860
 import pudl.output.eia923
+import pudl.output.epacems
 import pudl.output.ferc1
 import pudl.output.glue
 import pudl.output.pudltabl
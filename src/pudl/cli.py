@@ -55,6 +55,14 @@ def parse_command_line(argv):
         will fail. Either the datapkg_bundle_name in the settings_file needs to
         be unique or you need to include --clobber""",
         default=False)
+    parser.add_argument(
+        '-w',
+        '--epacems-workers',
+        type=int,
+        help="""Number of worker processes to use for the EPA CEMS ETL. Each
+        state-year is extracted, transformed and loaded independently. If set,
+        this overrides any epacems_workers found in the settings_file.""",
+        default=None)
     arguments = parser.parse_args(argv[1:])
     return arguments
 
@@ -105,6 +113,13 @@ def main():
     except KeyError:
         datapkg_bundle_doi = None
 
+    if args.epacems_workers is not None:
+        for datapkg_settings in script_settings['datapkg_bundle_settings']:
+            for dataset_dict in datapkg_settings['datasets']:
+                if dataset_dict.get('epacems'):
+                    dataset_dict['epacems']['epacems_workers'] = (
+                        args.epacems_workers)
+
     _ = pudl.etl.generate_datapkg_bundle(
         script_settings['datapkg_bundle_settings'],
         pudl_settings,
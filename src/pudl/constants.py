@@ -935,6 +935,11 @@ ferc1_tbl2dbf = {v: k for k, v in ferc1_dbf2tbl.items()}
     files(w / o .DBF file extension) (values).
 """
 
+ferc1_dbf_readers = ("dbfread", "numpy")
+"""tuple: Ways of reading the FERC Form 1 DBF files. See
+:func:`pudl.extract.ferc1.read_dbf`.
+"""
+
 # This dictionary maps the strings which are used to denote field types in the
 # DBF objects to the corresponding generic SQLAlchemy Column types:
 # These definitions come from a combination of the dbfread example program
@@ -1005,6 +1010,28 @@ table_map_ferc1_pudl = {
     Form 1 DBF table names.
 """
 
+ferc1_sqlite_indexes = {
+    # Every extract query selects records by report_year, and most also
+    # require a non-empty plant_name. The plant tables are also searched for
+    # the distinct respondent, plant name and capacity combinations by
+    # pudl.glue.ferc1_eia, which these indexes cover entirely.
+    'f1_fuel': (('report_year', 'plant_name', 'respondent_id'),),
+    'f1_steam': (
+        ('report_year', 'plant_name', 'respondent_id', 'tot_capacity'),),
+    'f1_gnrt_plant': (
+        ('report_year', 'plant_name', 'respondent_id', 'capacity_rating'),),
+    'f1_hydro': (
+        ('report_year', 'plant_name', 'respondent_id', 'tot_capacity'),),
+    'f1_pumped_storage': (
+        ('report_year', 'plant_name', 'respondent_id', 'tot_capacity'),),
+    'f1_plant_in_srvce': (('report_year', 'respondent_id'),),
+    'f1_purchased_pwr': (('report_year', 'respondent_id'),),
+    'f1_accumdepr_prvsn': (('report_year', 'respondent_id'),),
+}
+"""dict: FERC Form 1 DBF table names (keys) and the columns of each of the
+    indexes to create on that table in the cloned SQLite database (values).
+"""
+
 # This is the list of EIA923 tables that can be successfully pulled into PUDL
 eia923_pudl_tables = ('generation_fuel_eia923',
                       'boiler_fuel_eia923',
@@ -2070,10 +2097,72 @@ epacems_csv_dtypes = {
 for EPA CEMS.
 """
 
+epacems_measurement_codes = (
+    "LME",
+    "Measured",
+    "Measured and Substitute",
+    "Other",
+    "Substitute",
+    "Undetermined",
+    "Unknown Code",
+    "",
+)
+"""tuple: Codes describing how the EPA CEMS SO2 and CO2 emissions were measured.
+"""
+
+epacems_nox_measurement_codes = epacems_measurement_codes + ("Calculated",)
+"""tuple: Codes describing how the EPA CEMS NOx emissions were measured.
+"""
+
 epacems_tables = ("hourly_emissions_epacems")
 """tuple: A tuple containing tables of EPA CEMS data to pull into PUDL.
 """
 
+epacems_output_formats = ("csv", "parquet")
+"""tuple: Formats the transformed EPA CEMS data can be written out in.
+"""
+
+epacems_readers = ("pandas", "pyarrow")
+"""tuple: Backends which can be used to read the raw EPA CEMS CSV files.
+"""
+
+epacems_csv_bytes_per_record = 100
+"""int: A lower bound on the size of a record in the raw EPA CEMS CSV files,
+used to pick the block size when they are streamed in chunks with pyarrow.
+"""
+
+epacems_csv_min_block_size = 1 << 16
+"""int: The smallest block size in bytes used to stream the raw EPA CEMS CSV
+files with pyarrow, which must be larger than any single record.
+"""
+
+epacems_rollup_freqs = {
+    "daily": "datetime64[D]",
+    "monthly": "datetime64[M]",
+}
+"""dict: Frequencies at which the EPA CEMS hourly data is rolled up (keys) and
+the numpy datetime units its UTC timestamps are truncated to (values).
+"""
+
+epacems_rollup_levels = {
+    "unit": ("plant_id_eia", "unitid"),
+    "plant": ("plant_id_eia",),
+}
+"""dict: Levels at which the EPA CEMS hourly data is rolled up (keys) and the
+columns identifying each group of records (values).
+"""
+
+epacems_rollup_columns = (
+    "operating_time_hours",
+    "gross_load_mwh",
+    "heat_content_mmbtu",
+    "so2_mass_lbs",
+    "nox_mass_lbs",
+    "co2_mass_tons",
+)
+"""tuple: Quantities which are summed when rolling up the EPA CEMS hourly data.
+"""
+
 epacems_additional_plant_info_file = importlib.resources.open_text(
     'pudl.package_data.epa.cems', 'plant_info_for_additional_cems_plants.csv')
 """typing.TextIO:
@@ -2518,25 +2607,32 @@ column_dtypes = {
         "peak_demand_summer_mw": float,
         "peak_demand_winter_mw": float,
     },
+    # EPA CEMS is huge, so we use the most compact types possible. float32
+    # can accurately hold integers up to 16,777,216, and the reported values
+    # have at most 3 decimal places, so float64 isn't needed.
     "epacems": {
-        'state': pd.StringDtype(),
-        'plant_id_eia': pd.Int64Dtype(),  # Nullable Integer
-        'unitid': pd.StringDtype(),
+        'state': pd.CategoricalDtype(categories=cems_states.keys()),
+        'plant_id_eia': "uint32",
+        'unitid': pd.CategoricalDtype(),
         'operating_datetime_utc': "datetime64[ns]",
-        'operating_time_hours': float,
-        'gross_load_mw': float,
-        'steam_load_1000_lbs': float,
-        'so2_mass_lbs': float,
-        'so2_mass_measurement_code': pd.StringDtype(),
-        'nox_rate_lbs_mmbtu': float,
-        'nox_rate_measurement_code': pd.StringDtype(),
-        'nox_mass_lbs': float,
-        'nox_mass_measurement_code': pd.StringDtype(),
-        'co2_mass_tons': float,
-        'co2_mass_measurement_code': pd.StringDtype(),
-        'heat_content_mmbtu': float,
-        'facility_id': pd.Int64Dtype(),  # Nullable Integer
-        'unit_id_epa': pd.Int64Dtype(),  # Nullable Integer
+        'operating_time_hours': "float32",
+        'gross_load_mw': "float32",
+        'steam_load_1000_lbs': "float32",
+        'so2_mass_lbs': "float32",
+        'so2_mass_measurement_code': pd.CategoricalDtype(
+            categories=epacems_measurement_codes),
+        'nox_rate_lbs_mmbtu': "float32",
+        'nox_rate_measurement_code': pd.CategoricalDtype(
+            categories=epacems_nox_measurement_codes),
+        'nox_mass_lbs': "float32",
+        'nox_mass_measurement_code': pd.CategoricalDtype(
+            categories=epacems_nox_measurement_codes),
+        'co2_mass_tons': "float32",
+        'co2_mass_measurement_code': pd.CategoricalDtype(
+            categories=epacems_measurement_codes),
+        'heat_content_mmbtu': "float32",
+        'facility_id': pd.Int32Dtype(),  # Nullable Integer
+        'unit_id_epa': pd.Int32Dtype(),  # Nullable Integer
     },
     "eia": {
         'ash_content_pct': float,
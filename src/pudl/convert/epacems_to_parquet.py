@@ -20,6 +20,7 @@ interactive cloud computing environment like `Pangeo <https://pangeo.io>`__.
 """
 
 import argparse
+import concurrent.futures
 import logging
 import pathlib
 import sys
@@ -28,7 +29,6 @@ from functools import partial
 import coloredlogs
 import pandas as pd
 import pyarrow as pa
-import pyarrow.parquet as pq
 
 import pudl
 import pudl.constants as pc
@@ -43,49 +43,20 @@ def create_in_dtypes():
     Create a dictionary of input data types.
 
     This specifies the dtypes of the input columns, which is necessary for some
-    cases where, e.g., a column is always NaN.
+    cases where, e.g., a column is always NaN. These are the same compact types
+    used in the transform step (see :mod:`pudl.constants` ``column_dtypes``)
+    except that the timestamps are parsed separately, and the unitid column is
+    read as a string, since it is stored as a plain string in Parquet.
 
     Returns:
         dict: mapping columns names to :mod:`pandas` data types.
 
     """
-    # These measurement codes are used by all four of our measurement variables
-    common_codes = (
-        "LME",
-        "Measured",
-        "Measured and Substitute",
-        "Other",
-        "Substitute",
-        "Undetermined",
-        "Unknown Code",
-        "",
-    )
-    co2_so2_cats = pd.CategoricalDtype(categories=common_codes, ordered=False)
-    nox_cats = pd.CategoricalDtype(
-        categories=common_codes + ("Calculated",), ordered=False
-    )
-    state_cats = pd.CategoricalDtype(
-        categories=pc.cems_states.keys(), ordered=False)
     in_dtypes = {
-        "state": state_cats,
-        "plant_id_eia": "int32",
-        "unitid": pd.StringDtype(),
-        # "operating_datetime_utc": "datetime",
-        "operating_time_hours": "float32",
-        "gross_load_mw": "float32",
-        "steam_load_1000_lbs": "float32",
-        "so2_mass_lbs": "float32",
-        "so2_mass_measurement_code": co2_so2_cats,
-        "nox_rate_lbs_mmbtu": "float32",
-        "nox_rate_measurement_code": nox_cats,
-        "nox_mass_lbs": "float32",
-        "nox_mass_measurement_code": nox_cats,
-        "co2_mass_tons": "float32",
-        "co2_mass_measurement_code": co2_so2_cats,
-        "heat_content_mmbtu": "float32",
-        "facility_id": pd.Int32Dtype(),
-        "unit_id_epa": pd.Int32Dtype(),
+        col: dtype for col, dtype in pc.column_dtypes["epacems"].items()
+        if col != "operating_datetime_utc"
     }
+    in_dtypes["unitid"] = pd.StringDtype()
     return in_dtypes
 
 
@@ -141,13 +112,37 @@ def create_cems_schema():
     ])
 
 
+def _convert_partition(csv_path, year, out_dir, **kwargs):
+    """
+    Convert a single EPA CEMS state-year CSV into a Parquet dataset partition.
+
+    Args:
+        csv_path (path-like): The gzipped CSV file to convert.
+        year (int): The year of the data in the CSV file.
+        out_dir (path-like): The root directory of the Parquet dataset.
+        kwargs: Additional arguments passed through to
+            :func:`pudl.load.parquet.epacems_dump`.
+
+    Returns:
+        int: The number of records converted.
+
+    """
+    df = pd.read_csv(csv_path, dtype=create_in_dtypes(),
+                     parse_dates=["operating_datetime_utc"])
+    pudl.load.parquet.epacems_dump(df, year=year, root_path=out_dir, **kwargs)
+    return len(df)
+
+
 def epacems_to_parquet(datapkg_path,
                        epacems_years,
                        epacems_states,
                        out_dir,
                        compression='snappy',
                        partition_cols=('year', 'state'),
-                       clobber=False):
+                       clobber=False,
+                       jobs=1,
+                       row_group_size=None,
+                       use_dictionary=True):
     """Take transformed EPA CEMS dataframes and output them as Parquet files.
 
     We need to do a few additional manipulations of the dataframes after they
@@ -173,6 +168,11 @@ def epacems_to_parquet(datapkg_path,
         clobber (bool): If True and there is already a directory with out_dirs
             name, the existing parquet files will be deleted and new ones will
             be generated in their place.
+        jobs (int): Number of worker processes to use. Each state-year is
+            converted independently, and written to its own partition.
+        row_group_size (int): Maximum number of records in each Parquet row
+            group. If None, use the pyarrow default.
+        use_dictionary (bool): Whether to dictionary encode the columns.
 
     Raises:
         AssertionError: Raised if an output directory is not specified.
@@ -183,6 +183,8 @@ def epacems_to_parquet(datapkg_path,
     """
     if not out_dir:
         raise AssertionError("Required output directory not specified.")
+    if jobs < 1:
+        raise AssertionError(f"jobs must be a positive integer, not {jobs}.")
     out_dir = pudl.helpers.prep_dir(out_dir, clobber=clobber)
     data_dir = pathlib.Path(datapkg_path).parent / "data"
 
@@ -202,24 +204,32 @@ def epacems_to_parquet(datapkg_path,
     # TODO: Rather than going directly to the data directory, we should really
     # use the metadata inside the datapackage to find the appropriate file
     # paths pertaining to the CEMS years/states of interest.
-    in_types = create_in_dtypes()
-    schema = create_cems_schema()
-    for year in epacems_years:
-        for state in epacems_states:
-            newpath = pathlib.Path(
-                data_dir,
-                f"hourly_emissions_epacems_{year}_{state.lower()}.csv.gz")
-            df = (
-                pd.read_csv(newpath, dtype=in_types,
-                            parse_dates=["operating_datetime_utc"])
-                .assign(year=year)
-            )
-            logger.info(f"{year}-{state}: {len(df)} records")
-            pq.write_to_dataset(
-                pa.Table.from_pandas(
-                    df, preserve_index=False, schema=schema),
-                root_path=str(out_dir), partition_cols=list(partition_cols),
-                compression=compression)
+    partitions = [
+        (year, state, pathlib.Path(
+            data_dir, f"hourly_emissions_epacems_{year}_{state.lower()}.csv.gz"))
+        for year in epacems_years
+        for state in epacems_states
+    ]
+    dump_kwargs = {
+        "compression": compression,
+        "partition_cols": partition_cols,
+        "row_group_size": row_group_size,
+        "use_dictionary": use_dictionary,
+    }
+    if jobs == 1:
+        for year, state, csv_path in partitions:
+            nrows = _convert_partition(csv_path, year, out_dir, **dump_kwargs)
+            logger.info(f"{year}-{state}: {nrows} records")
+    else:
+        with concurrent.futures.ProcessPoolExecutor(
+                max_workers=jobs) as executor:
+            futures = [
+                executor.submit(
+                    _convert_partition, csv_path, year, out_dir, **dump_kwargs)
+                for year, state, csv_path in partitions
+            ]
+            for (year, state, _), future in zip(partitions, futures):
+                logger.info(f"{year}-{state}: {future.result()} records")
 
 
 def parse_command_line(argv):
@@ -286,6 +296,28 @@ def parse_command_line(argv):
         is everything: all 48 continental US states plus Washington DC.""",
         default=pc.cems_states.keys()
     )
+    parser.add_argument(
+        '-j',
+        '--jobs',
+        type=int,
+        help="""Number of worker processes to use. Each state-year is
+        converted independently. (default: %(default)s).""",
+        default=1
+    )
+    parser.add_argument(
+        '--row-group-size',
+        type=int,
+        help="""Maximum number of records in each Parquet row group. Smaller
+        row groups allow more selective reads, at the cost of larger files.
+        (default: pyarrow's default).""",
+        default=None
+    )
+    parser.add_argument(
+        '--no-dictionary',
+        action='store_false',
+        dest='use_dictionary',
+        help="""Don't dictionary encode the columns of the Parquet files.""",
+    )
     parser.add_argument(
         '-c',
         '--clobber',
@@ -317,7 +349,10 @@ def main():
                            pudl_settings['parquet_dir'], "epacems"),
                        compression=args.compression,
                        partition_cols=('year', 'state'),
-                       clobber=args.clobber)
+                       clobber=args.clobber,
+                       jobs=args.jobs,
+                       row_group_size=args.row_group_size,
+                       use_dictionary=args.use_dictionary)
 
 
 if __name__ == '__main__':
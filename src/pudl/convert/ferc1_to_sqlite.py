@@ -44,6 +44,39 @@ def parse_command_line(argv):
         not included but the sqlite databse already exists the _build will
         fail.""",
         default=False)
+    parser.add_argument(
+        '-w',
+        '--workers',
+        type=int,
+        help="""Number of worker processes to use for reading the FERC Form 1
+        DBF files. Each table-year is read independently, while a single
+        process writes all of the data to the SQLite database.
+        (default: %(default)s).""",
+        default=1)
+    parser.add_argument(
+        '--reader',
+        choices=pc.ferc1_dbf_readers,
+        help="""How to read the FERC Form 1 DBF files. dbfread parses them
+        one record at a time, while numpy parses whole columns at once, and
+        is much faster. (default: %(default)s).""",
+        default='dbfread')
+    parser.add_argument(
+        '--bulk-load',
+        action='store_true',
+        help="""Load each table into SQLite in a single transaction, with
+        journaling and disk syncing turned off, and create any indexes after
+        all the data has been loaded. This is much faster, but an interrupted
+        load will leave a corrupt database behind.""",
+        default=False)
+    parser.add_argument(
+        '-u',
+        '--update',
+        action='store_true',
+        help="""Load only the ferc1_to_sqlite_years into an existing
+        database, replacing any records it already has for those years,
+        rather than re-creating the whole database. The existing database
+        must have the schema inferred from ferc1_to_sqlite_refyear.""",
+        default=False)
     arguments = parser.parse_args(argv[1:])
     return arguments
 
@@ -109,6 +142,9 @@ def main():  # noqa: C901
         bad_cols = script_settings['ferc1_to_sqlite_bad_cols']
     except KeyError:
         bad_cols = ()
+    # Also optional. Defaults to the indexes used by the PUDL extract queries.
+    indexes = script_settings.get(
+        'ferc1_to_sqlite_indexes', pc.ferc1_sqlite_indexes)
 
     pudl.extract.ferc1.dbf2sqlite(
         tables=script_settings['ferc1_to_sqlite_tables'],
@@ -116,7 +152,12 @@ def main():  # noqa: C901
         refyear=script_settings['ferc1_to_sqlite_refyear'],
         pudl_settings=pudl_settings,
         bad_cols=bad_cols,
-        clobber=args.clobber)
+        clobber=args.clobber,
+        workers=args.workers,
+        reader=args.reader,
+        bulk_load=args.bulk_load,
+        update=args.update,
+        indexes=indexes)
 
 
 if __name__ == '__main__':
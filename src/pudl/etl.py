@@ -17,6 +17,8 @@ data from:
 
 """
 
+import concurrent.futures
+import hashlib
 import logging
 import pathlib
 import time
@@ -93,6 +95,26 @@ def _validate_params_eia(etl_params):  # noqa: C901
     if not eia_input_dict['eia860_years'] and eia_input_dict['eia923_years']:
         eia_input_dict['eia860_years'] = eia_input_dict['eia923_years']
 
+    # The number of worker processes used to parse the EIA spreadsheets. A
+    # single worker parses them all serially in-process.
+    try:
+        eia_input_dict['eia_workers'] = int(etl_params['eia_workers'])
+    except KeyError:
+        eia_input_dict['eia_workers'] = 1
+    if eia_input_dict['eia_workers'] < 1:
+        raise AssertionError(
+            f"eia_workers must be a positive integer, but got "
+            f"{eia_input_dict['eia_workers']}."
+        )
+
+    # Whether to cache the parsed EIA spreadsheets in the data directory, so
+    # that they don't have to be parsed again by later runs.
+    try:
+        eia_input_dict['eia_sheet_cache'] = bool(
+            etl_params['eia_sheet_cache'])
+    except KeyError:
+        eia_input_dict['eia_sheet_cache'] = False
+
     # Validate the etl_params
     if eia_input_dict['eia860_tables']:
         for table in eia_input_dict['eia860_tables']:
@@ -203,9 +225,11 @@ def _etl_eia(etl_params, datapkg_dir, pudl_settings):
     # Extract EIA forms 923, 860
     data_dir = pudl_settings["data_dir"]
     eia923_raw_dfs = pudl.extract.eia923.Extractor(
-        data_dir).extract(eia923_years)
+        data_dir, workers=eia_inputs['eia_workers'],
+        use_cache=eia_inputs['eia_sheet_cache']).extract(eia923_years)
     eia860_raw_dfs = pudl.extract.eia860.Extractor(
-        data_dir).extract(eia860_years)
+        data_dir, workers=eia_inputs['eia_workers'],
+        use_cache=eia_inputs['eia_sheet_cache']).extract(eia860_years)
     # Transform EIA forms 923, 860
     eia923_transformed_dfs = pudl.transform.eia923.transform(
         eia923_raw_dfs, eia923_tables=eia923_tables)
@@ -386,15 +410,253 @@ def _validate_params_epacems(etl_params):
                              'EPA CEMS requires either states or years as a partion'
                              )
 
+    # The formats the transformed CEMS data should be written out in. CSVs
+    # become part of the datapackage, while the Parquet files are written
+    # directly into the year/state partitioned dataset in parquet_dir.
+    try:
+        epacems_dict['epacems_output_formats'] = list(
+            etl_params['epacems_output_formats'])
+    except KeyError:
+        epacems_dict['epacems_output_formats'] = ['csv']
+    for output_format in epacems_dict['epacems_output_formats']:
+        if output_format not in pc.epacems_output_formats:
+            raise AssertionError(
+                f"Unrecognized EPA CEMS output format: {output_format}. "
+                f"Valid formats are {pc.epacems_output_formats}."
+            )
+    if not epacems_dict['epacems_output_formats']:
+        raise AssertionError('No output formats found for EPA CEMS.')
+
+    # Which CSV reader to use when extracting the raw CEMS data.
+    try:
+        epacems_dict['epacems_reader'] = etl_params['epacems_reader']
+    except KeyError:
+        epacems_dict['epacems_reader'] = 'pandas'
+    if epacems_dict['epacems_reader'] not in pc.epacems_readers:
+        raise AssertionError(
+            f"Unrecognized EPA CEMS reader: {epacems_dict['epacems_reader']}. "
+            f"Valid readers are {pc.epacems_readers}."
+        )
+
+    # The maximum number of records to process at a time within each
+    # state-year, which bounds the memory used by each worker. If None, each
+    # state-year is processed all at once.
+    try:
+        epacems_dict['epacems_chunksize'] = etl_params['epacems_chunksize']
+    except KeyError:
+        epacems_dict['epacems_chunksize'] = None
+    if epacems_dict['epacems_chunksize'] is not None:
+        epacems_dict['epacems_chunksize'] = int(
+            epacems_dict['epacems_chunksize'])
+        if epacems_dict['epacems_chunksize'] < 1:
+            raise AssertionError(
+                f"epacems_chunksize must be a positive integer, but got "
+                f"{epacems_dict['epacems_chunksize']}."
+            )
+
+    # In incremental mode, state-years whose inputs haven't changed since they
+    # were last written to the Parquet dataset are skipped. The CSV outputs
+    # live in a datapackage which is always regenerated from scratch, so they
+    # can't be reused.
+    try:
+        epacems_dict['epacems_incremental'] = bool(
+            etl_params['epacems_incremental'])
+    except KeyError:
+        epacems_dict['epacems_incremental'] = False
+    if (epacems_dict['epacems_incremental']
+            and epacems_dict['epacems_output_formats'] != ['parquet']):
+        raise AssertionError(
+            "Incremental EPA CEMS ETL requires epacems_output_formats to be "
+            "[parquet], since the CSV outputs are always regenerated."
+        )
+
+    # Whether to also write daily and monthly rollups of the hourly data by
+    # unit and by plant. These are only written as Parquet datasets.
+    try:
+        epacems_dict['epacems_rollups'] = bool(etl_params['epacems_rollups'])
+    except KeyError:
+        epacems_dict['epacems_rollups'] = False
+    if (epacems_dict['epacems_rollups']
+            and "parquet" not in epacems_dict['epacems_output_formats']):
+        raise AssertionError(
+            "EPA CEMS rollups are only written as Parquet datasets, so "
+            "epacems_output_formats must include parquet."
+        )
+
+    # The number of worker processes used to run the state-year partitions
+    # through the ETL. A single worker runs everything serially in-process.
+    try:
+        epacems_dict['epacems_workers'] = int(etl_params['epacems_workers'])
+    except KeyError:
+        epacems_dict['epacems_workers'] = 1
+    if epacems_dict['epacems_workers'] < 1:
+        raise AssertionError(
+            f"epacems_workers must be a positive integer, but got "
+            f"{epacems_dict['epacems_workers']}."
+        )
+
     if not epacems_dict['epacems_years'] or not epacems_dict['epacems_states']:
         return None
     else:
         return epacems_dict
 
 
+def _epacems_file_fingerprint(path, previous=None):
+    """
+    Describe a raw EPA CEMS file, for detecting changes between ETL runs.
+
+    Hashing the contents of every file is slow, so if the size and
+    modification time of the file match a previous fingerprint, that
+    fingerprint is reused rather than re-hashing the file.
+
+    Args:
+        path (path-like): The file to fingerprint.
+        previous (dict): A previous fingerprint of the same file, if any.
+
+    Returns:
+        dict: The size, modification time and SHA-256 hash of the file.
+
+    """
+    stat = pathlib.Path(path).stat()
+    if (previous is not None
+            and previous["size"] == stat.st_size
+            and previous["mtime"] == stat.st_mtime):
+        return previous
+    return {
+        "size": stat.st_size,
+        "mtime": stat.st_mtime,
+        "sha256": pudl.load.metadata.hash_csv(path),
+    }
+
+
+def _epacems_partition_fingerprint(year, state, data_dir, utc_offset_hash,
+                                   epacems_dict, previous=None):
+    """
+    Describe all the inputs that determine a single EPA CEMS partition.
+
+    Args:
+        year (int): The year of the partition.
+        state (str): The 2-letter US state code of the partition.
+        data_dir (path-like): Path to the top directory of the PUDL datastore.
+        utc_offset_hash (str): A hash of the plant UTC offsets which are used
+            in the transform step.
+        epacems_dict (dict): Validated EPA CEMS ETL parameters, as returned
+            by :func:`_validate_params_epacems`. The ones which affect the
+            outputs of the partition are included in the fingerprint.
+        previous (dict): A previous fingerprint of the same partition, if
+            any. Used to avoid re-hashing unchanged files.
+
+    Returns:
+        dict: The PUDL version, the hash of the plant UTC offsets, the ETL
+        parameters which affect the outputs, and the fingerprints of each of
+        the monthly raw input files.
+
+    """
+    previous_files = {} if previous is None else previous.get("files", {})
+    files = {}
+    for month in range(1, 13):
+        path = pudl.workspace.datastore.path(
+            'epacems', year=year, month=month, state=state, data_dir=data_dir)
+        name = pathlib.Path(path).name
+        files[name] = _epacems_file_fingerprint(
+            path, previous=previous_files.get(name))
+    return {
+        "pudl_version": pudl.__version__,
+        "utc_offset_hash": utc_offset_hash,
+        "settings": {
+            name: epacems_dict[name]
+            for name in ("epacems_reader", "epacems_chunksize",
+                         "epacems_rollups")
+        },
+        "files": files,
+    }
+
+
+def _etl_epacems_partition(year, state, epacems_dict, datapkg_dir,
+                           pudl_settings, plant_utc_offset):
+    """
+    Extract, transform and load a single state-year of EPA CEMS data.
+
+    Every EPA CEMS state-year is independent of all the others, and is written
+    out to its own CSV file, so this function can be run in a separate worker
+    process for each partition.
+
+    Args:
+        year (int): The year of CEMS data to process.
+        state (str): The 2-letter US state code of the CEMS data to process.
+        epacems_dict (dict): Validated EPA CEMS ETL parameters, as returned
+            by :func:`_validate_params_epacems`.
+        datapkg_dir (path-like): The location of the directory for this
+            package, which will contain a datapackage.json file and a data
+            directory in which the CSV file are stored.
+        pudl_settings (dict) : a dictionary filled with settings that mostly
+            describe paths to various resources and outputs.
+        plant_utc_offset (pandas.DataFrame): A dataframe of plants' UTC
+            offsets, as returned by
+            :func:`pudl.transform.epacems._load_plant_utc_offset`.
+
+    Returns:
+        list: Names of the tabular data resources that were output as CSVs.
+        Parquet outputs are not part of the datapackage.
+
+    """
+    output_formats = epacems_dict['epacems_output_formats']
+    parquet_dir = pathlib.Path(pudl_settings["parquet_dir"], "epacems")
+    epacems_raw_dfs = pudl.extract.epacems.extract(
+        epacems_years=[year],
+        states=[state],
+        data_dir=pudl_settings["data_dir"],
+        reader=epacems_dict['epacems_reader'],
+        chunksize=epacems_dict['epacems_chunksize'])
+    epacems_transformed_dfs = pudl.transform.epacems.transform(
+        epacems_raw_dfs=epacems_raw_dfs,
+        datapkg_dir=datapkg_dir,
+        plant_utc_offset=plant_utc_offset)
+    rollup_dirs = {}
+    if epacems_dict['epacems_rollups']:
+        rollup_dirs = {
+            (freq, level): pudl.load.parquet.epacems_rollup_path(
+                pudl_settings["parquet_dir"], freq, level)
+            for freq in pc.epacems_rollup_freqs
+            for level in pc.epacems_rollup_levels
+        }
+    if "parquet" in output_formats:
+        # Any old rollups no longer match the new hourly data, so they are
+        # removed even if new ones aren't being written.
+        old_dirs = [parquet_dir] + [
+            pudl.load.parquet.epacems_rollup_path(
+                pudl_settings["parquet_dir"], freq, level)
+            for freq in pc.epacems_rollup_freqs
+            for level in pc.epacems_rollup_levels
+        ]
+        for root_path in old_dirs:
+            pudl.load.parquet.remove_epacems_partition(root_path, year, state)
+    epacems_tables = []
+    # When the data is processed in chunks, each chunk is appended to the
+    # same output files, and has the same resource name.
+    for transformed_df_dict in epacems_transformed_dfs:
+        if "parquet" in output_formats:
+            pudl.load.parquet.dict_dump(transformed_df_dict,
+                                        "EPA CEMS",
+                                        root_path=parquet_dir)
+            for (freq, level), root_path in rollup_dirs.items():
+                for df in transformed_df_dict.values():
+                    pudl.load.parquet.epacems_rollup_dump(
+                        pudl.transform.epacems.rollup(df, freq, level),
+                        year=year, root_path=root_path)
+        if "csv" in output_formats:
+            pudl.load.csv.dict_dump(transformed_df_dict,
+                                    "EPA CEMS",
+                                    datapkg_dir=datapkg_dir)
+            epacems_tables.extend(
+                name for name in transformed_df_dict
+                if name not in epacems_tables)
+    return epacems_tables
+
+
 def _etl_epacems(etl_params, datapkg_dir, pudl_settings):
     """
-    Extracts, transforms and loads CSVs for EPA CEMS.
+    Extracts, transforms and loads CSVs and/or Parquet files for EPA CEMS.
 
     Args:
         etl_params (dict): ETL parameters required by this data source.
@@ -416,26 +678,85 @@ def _etl_epacems(etl_params, datapkg_dir, pudl_settings):
     if not epacems_states or not epacems_years:
         logger.info('Not ingesting EPA CEMS.')
 
-    # NOTE: This a generator for raw dataframes
-    epacems_raw_dfs = pudl.extract.epacems.extract(
-        epacems_years=epacems_years,
-        states=epacems_states,
-        data_dir=pudl_settings["data_dir"])
-    # NOTE: This is a generator for transformed dataframes
-    epacems_transformed_dfs = pudl.transform.epacems.transform(
-        epacems_raw_dfs=epacems_raw_dfs,
-        datapkg_dir=datapkg_dir)
+    epacems_workers = epacems_dict['epacems_workers']
+    plant_utc_offset = pudl.transform.epacems._load_plant_utc_offset(
+        datapkg_dir)
 
     logger.info("Loading tables from EPA CEMS into PUDL:")
     if logger.isEnabledFor(logging.INFO):
         start_time = time.monotonic()
+    # The order in which the partitions are processed determines the order of
+    # the tables in the returned list, and so in the datapackage metadata.
+    partitions = [(year, state)
+                  for year in epacems_years for state in epacems_states]
+
+    # Keep track of which inputs each Parquet partition was generated from.
+    manifest = None
+    if "parquet" in epacems_dict['epacems_output_formats']:
+        parquet_dir = pathlib.Path(pudl_settings["parquet_dir"], "epacems")
+        manifest = pudl.load.parquet.read_epacems_manifest(parquet_dir)
+        utc_offset_hash = hashlib.sha256(
+            plant_utc_offset.to_csv(index=False).encode()).hexdigest()
+        fingerprints = {
+            (year, state): _epacems_partition_fingerprint(
+                year, state, pudl_settings["data_dir"], utc_offset_hash,
+                epacems_dict, previous=manifest.get(f"{year}-{state}"))
+            for year, state in partitions
+        }
+        if epacems_dict['epacems_incremental']:
+            # If rollups were requested, they must also have been written.
+            output_dirs = [parquet_dir]
+            if epacems_dict['epacems_rollups']:
+                output_dirs.extend(
+                    pudl.load.parquet.epacems_rollup_path(
+                        pudl_settings["parquet_dir"], freq, level)
+                    for freq in pc.epacems_rollup_freqs
+                    for level in pc.epacems_rollup_levels)
+            unchanged = [
+                (year, state) for year, state in partitions
+                if manifest.get(f"{year}-{state}") == fingerprints[(year, state)]
+                and all(pudl.load.parquet.epacems_partition_exists(
+                    output_dir, year, state) for output_dir in output_dirs)
+            ]
+            logger.info(
+                f"Skipping {len(unchanged)} of {len(partitions)} EPA CEMS "
+                f"state-years whose inputs have not changed.")
+            partitions = [p for p in partitions if p not in unchanged]
+        # Forget about the partitions we're about to overwrite, so that an
+        # interrupted run can't leave a partial partition that looks complete.
+        for year, state in partitions:
+            manifest.pop(f"{year}-{state}", None)
+        pudl.load.parquet.write_epacems_manifest(manifest, parquet_dir)
+
+    def _record_partition(year, state):
+        if manifest is not None:
+            manifest[f"{year}-{state}"] = fingerprints[(year, state)]
+            pudl.load.parquet.write_epacems_manifest(manifest, parquet_dir)
+
     epacems_tables = []
-    # run the cems generator dfs through the load step
-    for transformed_df_dict in epacems_transformed_dfs:
-        pudl.load.csv.dict_dump(transformed_df_dict,
-                                "EPA CEMS",
-                                datapkg_dir=datapkg_dir)
-        epacems_tables.append(list(transformed_df_dict.keys())[0])
+    if epacems_workers == 1:
+        for year, state in partitions:
+            epacems_tables.extend(_etl_epacems_partition(
+                year, state, epacems_dict, datapkg_dir, pudl_settings,
+                plant_utc_offset))
+            _record_partition(year, state)
+    else:
+        logger.info(
+            f"Running EPA CEMS ETL for {len(partitions)} state-years "
+            f"using {epacems_workers} worker processes.")
+        with concurrent.futures.ProcessPoolExecutor(
+                max_workers=epacems_workers) as executor:
+            futures = [
+                executor.submit(
+                    _etl_epacems_partition, year, state, epacems_dict,
+                    datapkg_dir, pudl_settings, plant_utc_offset)
+                for year, state in partitions
+            ]
+            # Collect results in submission order, not completion order, so
+            # the list of tables is the same regardless of the worker count.
+            for (year, state), future in zip(partitions, futures):
+                epacems_tables.extend(future.result())
+                _record_partition(year, state)
     if logger.isEnabledFor(logging.INFO):
         time_message = "    Loading    EPA CEMS took {}".format(
             time.strftime("%H:%M:%S",
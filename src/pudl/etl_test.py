@@ -0,0 +1,190 @@
+"""Unit tests for the EPA CEMS partition handling in pudl.etl."""
+import os
+import pathlib
+import tempfile
+import unittest
+import unittest.mock as mock
+
+import pandas as pd
+
+import pudl
+import pudl.constants as pc
+import pudl.etl
+import pudl.extract.epacems
+import pudl.load.parquet
+import pudl.transform.epacems
+import pudl.workspace.datastore
+
+
+class TestEtlEpacemsIncremental(unittest.TestCase):
+    """Tests which EPA CEMS state-years are skipped in incremental mode."""
+
+    def setUp(self):
+        """Creates raw CEMS files and stubs out the partition ETL."""
+        self._dir = tempfile.TemporaryDirectory()
+        self.data_dir = pathlib.Path(self._dir.name, "data")
+        self.data_dir.mkdir()
+        self.pudl_settings = {
+            "data_dir": str(self.data_dir),
+            "parquet_dir": os.path.join(self._dir.name, "parquet"),
+        }
+        self.parquet_dir = pathlib.Path(
+            self.pudl_settings["parquet_dir"], "epacems")
+        for state in ("id", "ri"):
+            for month in range(1, 13):
+                self._raw_path(2018, month, state).write_text("raw")
+        self.etl_params = {
+            "epacems_years": [2018],
+            "epacems_states": ["ID", "RI"],
+            "epacems_output_formats": ["parquet"],
+            "epacems_incremental": True,
+        }
+        # Manifest entries found on disk when each partition is rewritten.
+        self.manifests = {}
+        patches = [
+            mock.patch.object(
+                pudl.workspace.datastore, "path",
+                lambda dataset, year, month, state, data_dir:
+                    str(self._raw_path(year, month, state))),
+            mock.patch.object(
+                pudl.transform.epacems, "_load_plant_utc_offset",
+                lambda datapkg_dir: pd.DataFrame({
+                    "plant_id_eia": [3], "utc_offset": ["-5h"]})),
+            mock.patch.object(
+                pudl.etl, "_etl_epacems_partition",
+                side_effect=self._fake_partition_etl),
+        ]
+        for patch in patches:
+            patch.start()
+            self.addCleanup(patch.stop)
+
+    def tearDown(self):
+        """Removes the raw files and outputs."""
+        self._dir.cleanup()
+
+    def _raw_path(self, year, month, state):
+        return self.data_dir / f"epacems{year}{state.lower()}{month:02}.zip"
+
+    def _fake_partition_etl(self, year, state, epacems_dict, datapkg_dir,
+                            pudl_settings, plant_utc_offset):
+        """Records the manifest and writes an empty partition."""
+        manifest = pudl.load.parquet.read_epacems_manifest(self.parquet_dir)
+        self.manifests[(year, state)] = manifest
+        root_paths = [self.parquet_dir]
+        if epacems_dict["epacems_rollups"]:
+            root_paths.extend(
+                pudl.load.parquet.epacems_rollup_path(
+                    pudl_settings["parquet_dir"], freq, level)
+                for freq in pc.epacems_rollup_freqs
+                for level in pc.epacems_rollup_levels)
+        for root_path in root_paths:
+            partition_dir = pathlib.Path(
+                root_path, f"year={year}", f"state={state}")
+            partition_dir.mkdir(parents=True, exist_ok=True)
+            (partition_dir / "part.parquet").write_text("")
+        return []
+
+    def _run(self, **etl_params):
+        """Runs the EPA CEMS ETL, returning the state-years that were run."""
+        self.manifests = {}
+        pudl.etl._etl_epacems(
+            dict(self.etl_params, **etl_params), None, self.pudl_settings)
+        return sorted(self.manifests)
+
+    def test_unchanged_skipped(self):
+        """State-years with matching fingerprints aren't run again."""
+        self.assertEqual([(2018, "ID"), (2018, "RI")], self._run())
+        self.assertEqual([], self._run())
+
+    def test_changed_file(self):
+        """A changed raw file only re-runs its own state-year."""
+        self._run()
+        self._raw_path(2018, 3, "ri").write_text("changed")
+        self.assertEqual([(2018, "RI")], self._run())
+        self.assertEqual([], self._run())
+
+    def test_changed_settings(self):
+        """Changed settings or PUDL version re-run every state-year."""
+        self._run()
+        everything = [(2018, "ID"), (2018, "RI")]
+        self.assertEqual(everything, self._run(epacems_reader="pyarrow"))
+        self.assertEqual(everything, self._run(epacems_chunksize=1000))
+        self.assertEqual(everything, self._run(epacems_rollups=True))
+        self.assertEqual([], self._run(epacems_rollups=True))
+        with mock.patch.object(pudl, "__version__", "0.0.0"):
+            self.assertEqual(everything, self._run(epacems_rollups=True))
+
+    def test_missing_output(self):
+        """A state-year whose outputs were removed is run again."""
+        self._run(epacems_rollups=True)
+        pudl.load.parquet.remove_epacems_partition(
+            pudl.load.parquet.epacems_rollup_path(
+                self.pudl_settings["parquet_dir"], "daily", "unit"),
+            2018, "ID")
+        self.assertEqual([(2018, "ID")], self._run(epacems_rollups=True))
+
+    def test_manifest_entries_dropped(self):
+        """Entries are dropped before a rewrite, and kept if it fails."""
+        self._run()
+        self._raw_path(2018, 1, "id").write_text("changed")
+        self._run()
+        self.assertNotIn("2018-ID", self.manifests[(2018, "ID")])
+
+        self._raw_path(2018, 2, "id").write_text("changed again")
+        pudl.etl._etl_epacems_partition.side_effect = RuntimeError
+        with self.assertRaises(RuntimeError):
+            self._run()
+        manifest = pudl.load.parquet.read_epacems_manifest(self.parquet_dir)
+        self.assertEqual(["2018-RI"], list(manifest))
+
+
+class TestEtlEpacemsPartition(unittest.TestCase):
+    """Tests the outputs removed when an EPA CEMS state-year is rewritten."""
+
+    def setUp(self):
+        """Stubs out the extract and transform steps."""
+        self._dir = tempfile.TemporaryDirectory()
+        self.pudl_settings = {
+            "data_dir": os.path.join(self._dir.name, "data"),
+            "parquet_dir": os.path.join(self._dir.name, "parquet"),
+        }
+        self.root_paths = [pathlib.Path(self._dir.name, "parquet", "epacems")]
+        self.root_paths.extend(
+            pudl.load.parquet.epacems_rollup_path(
+                self.pudl_settings["parquet_dir"], freq, level)
+            for freq in pc.epacems_rollup_freqs
+            for level in pc.epacems_rollup_levels)
+        for module, func in ((pudl.extract.epacems, "extract"),
+                             (pudl.transform.epacems, "transform")):
+            patch = mock.patch.object(module, func, return_value=iter([]))
+            patch.start()
+            self.addCleanup(patch.stop)
+
+    def tearDown(self):
+        """Removes the outputs."""
+        self._dir.cleanup()
+
+    def _write_partitions(self):
+        for root_path in self.root_paths:
+            for state in ("ID", "RI"):
+                partition_dir = root_path / "year=2018" / f"state={state}"
+                partition_dir.mkdir(parents=True, exist_ok=True)
+                (partition_dir / "part.parquet").write_text("")
+
+    def test_old_rollups_removed(self):
+        """Rollups are removed with the hourly data, even if not rewritten."""
+        for rollups in (True, False):
+            self._write_partitions()
+            epacems_dict = {
+                "epacems_output_formats": ["parquet"],
+                "epacems_reader": "pandas",
+                "epacems_chunksize": None,
+                "epacems_rollups": rollups,
+            }
+            pudl.etl._etl_epacems_partition(
+                2018, "ID", epacems_dict, None, self.pudl_settings, None)
+            for root_path in self.root_paths:
+                self.assertFalse(pudl.load.parquet.epacems_partition_exists(
+                    root_path, 2018, "ID"))
+                self.assertTrue(pudl.load.parquet.epacems_partition_exists(
+                    root_path, 2018, "RI"))
@@ -21,6 +21,7 @@ class Extractor(excel.GenericExtractor):
 
     METADATA = excel.Metadata('eia923')
     BLACKLISTED_PAGES = ['plant_frame']
+    STREAMING_PAGES = ['generation_fuel', 'fuel_receipts_costs']
 
     # Pages not supported by the metadata:
     # puerto_rico, github issue #457
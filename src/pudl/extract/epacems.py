@@ -3,9 +3,13 @@ Retrieve data from EPA CEMS hourly zipped CSVs.
 
 This modules pulls data from EPA's published CSV files.
 """
+import io
 import logging
+import zipfile
 
 import pandas as pd
+import pyarrow as pa
+import pyarrow.csv
 
 import pudl.constants as pc
 import pudl.workspace.datastore as datastore
@@ -39,7 +43,176 @@ def read_cems_csv(filename):
     return df
 
 
-def extract(epacems_years, states, data_dir):
+def _arrow_type(dtype):
+    """Map one of the pandas dtypes used in epacems_csv_dtypes to Arrow."""
+    if dtype == pd.StringDtype():
+        return pa.string()
+    if dtype == pd.Int64Dtype():
+        return pa.int64()
+    return pa.float64()
+
+
+def _read_cems_zip_bytes(filename):
+    """Read the single CSV contained in a CEMS zip file into memory."""
+    with zipfile.ZipFile(filename) as zf:
+        csv_name = zf.namelist()[0]
+        return zf.read(csv_name)
+
+
+def _arrow_csv_options(col_names):
+    """Arrow CSV conversion options for a CEMS CSV with the given header."""
+    include_cols = [col for col in col_names
+                    if col not in pc.epacems_columns_to_ignore]
+    column_types = {col: _arrow_type(pc.epacems_csv_dtypes[col])
+                    for col in include_cols
+                    if col in pc.epacems_csv_dtypes}
+    return pa.csv.ConvertOptions(
+        column_types=column_types,
+        include_columns=include_cols,
+        strings_can_be_null=True,
+    )
+
+
+def read_cems_csv_arrow(filename):
+    """
+    Read a zipped CEMS CSV file into a :class:`pyarrow.Table`.
+
+    Uses the multithreaded :mod:`pyarrow.csv` parser, only converting the
+    columns which are not listed in
+    :mod:`pudl.constants.epacems_columns_to_ignore`. Arrow types are derived
+    from the data types in :mod:`pudl.constants.epacems_csv_dtypes`. Unlike
+    :func:`read_cems_csv` the columns are not renamed.
+
+    Args:
+        filename (str): The name of the zipped CEMS CSV file to be read.
+
+    Returns:
+        pyarrow.Table: A table containing the contents of the CSV file.
+
+    """
+    raw_csv = _read_cems_zip_bytes(filename)
+    # The set of columns varies over the years, so we need to look at the
+    # header to know which ones to project and how to type them.
+    col_names = pd.read_csv(io.BytesIO(raw_csv), nrows=0).columns
+    return pa.csv.read_csv(
+        pa.BufferReader(raw_csv),
+        read_options=pa.csv.ReadOptions(use_threads=True),
+        convert_options=_arrow_csv_options(col_names),
+    )
+
+
+def read_cems_csv_arrow_chunks(filename, chunksize):
+    """
+    Stream a zipped CEMS CSV file as :class:`pyarrow.Table` chunks.
+
+    The CSV is decompressed and parsed incrementally with
+    :func:`pyarrow.csv.open_csv`, in blocks of roughly chunksize records, so
+    that neither the raw CSV nor the parsed table for the whole file is ever
+    held in memory.
+
+    Args:
+        filename (str): The name of the zipped CEMS CSV file to be read.
+        chunksize (int): The maximum number of records in each chunk.
+
+    Yields:
+        pyarrow.Table: Consecutive chunks of the CSV file, each with at most
+        chunksize records, typed as in :func:`read_cems_csv_arrow`.
+
+    """
+    block_size = max(chunksize * pc.epacems_csv_bytes_per_record,
+                     pc.epacems_csv_min_block_size)
+    with zipfile.ZipFile(filename) as zf:
+        csv_name = zf.namelist()[0]
+        with zf.open(csv_name) as csv_file:
+            col_names = pd.read_csv(csv_file, nrows=0).columns
+        with zf.open(csv_name) as csv_file:
+            batches = pa.csv.open_csv(
+                csv_file,
+                read_options=pa.csv.ReadOptions(block_size=block_size),
+                convert_options=_arrow_csv_options(col_names),
+            )
+            pending = []
+            n_pending = 0
+            for batch in batches:
+                pending.append(batch)
+                n_pending += batch.num_rows
+                if n_pending < chunksize:
+                    continue
+                table = pa.Table.from_batches(pending)
+                offset = 0
+                while n_pending - offset >= chunksize:
+                    yield table.slice(offset, chunksize)
+                    offset += chunksize
+                pending = table.slice(offset).to_batches()
+                n_pending -= offset
+            if n_pending:
+                yield pa.Table.from_batches(pending, schema=batches.schema)
+
+
+def read_cems_state_year_arrow(filenames):
+    """
+    Read all the monthly CEMS CSVs for a state-year into one DataFrame.
+
+    The monthly files are parsed into Arrow tables and concatenated, and only
+    then converted to pandas, with the same column names and data types as
+    the output of :func:`read_cems_csv`.
+
+    Args:
+        filenames (iterable): The zipped CEMS CSV files to be read.
+
+    Returns:
+        pandas.DataFrame: The contents of all the CSV files.
+
+    """
+    tables = [read_cems_csv_arrow(filename) for filename in filenames]
+    try:
+        table = pa.concat_tables(tables)
+    except pa.ArrowInvalid:
+        # The columns changed partway through the year, so fall back to
+        # letting pandas align them.
+        return pd.concat([_arrow_to_cems_df(t) for t in tables],
+                         sort=True, copy=False, ignore_index=True)
+    return _arrow_to_cems_df(table)
+
+
+def _arrow_to_cems_df(table):
+    """Convert a raw CEMS Arrow table to a typed, renamed DataFrame."""
+    df = table.to_pandas()
+    dtypes = {col: pc.epacems_csv_dtypes[col] for col in df.columns
+              if col in pc.epacems_csv_dtypes}
+    return df.astype(dtypes).rename(columns=pc.epacems_rename_dict)
+
+
+def read_cems_csv_chunks(filename, chunksize, reader="pandas"):
+    """
+    Read a zipped CEMS CSV file in chunks of a bounded number of records.
+
+    Args:
+        filename (str): The name of the file to be read.
+        chunksize (int): The maximum number of records in each chunk.
+        reader (str): Which CSV reader to use, either "pandas" or "pyarrow".
+
+    Yields:
+        pandas.DataFrame: Consecutive chunks of the CSV file, with the same
+        column names and data types as the output of :func:`read_cems_csv`.
+
+    """
+    if reader == "pyarrow":
+        for table in read_cems_csv_arrow_chunks(filename, chunksize):
+            yield _arrow_to_cems_df(table)
+    else:
+        chunks = pd.read_csv(
+            filename,
+            index_col=False,
+            usecols=lambda col: col not in pc.epacems_columns_to_ignore,
+            dtype=pc.epacems_csv_dtypes,
+            chunksize=chunksize,
+        )
+        for chunk in chunks:
+            yield chunk.rename(columns=pc.epacems_rename_dict)
+
+
+def extract(epacems_years, states, data_dir, reader="pandas", chunksize=None):
     """
     Coordinate the extraction of EPA CEMS hourly DataFrames.
 
@@ -49,30 +222,48 @@ def extract(epacems_years, states, data_dir):
         states (list): The states whose CEMS data we want to extract, indicated
             by 2-letter US state codes.
         data_dir (path-like): Path to the top directory of the PUDL datastore.
+        reader (str): Which CSV reader to use. "pandas" reads each monthly
+            file with :func:`read_cems_csv` and concatenates the results,
+            while "pyarrow" uses :func:`read_cems_state_year_arrow`.
+        chunksize (int or None): If None, all the data for each state-year is
+            yielded at once. Otherwise, the data is yielded in chunks of at
+            most chunksize records (which never span more than one month) to
+            bound the amount of memory used.
 
     Yields:
         dict: a dictionary with a single EPA CEMS tabular data resource name as
         the key, having the form "hourly_emissions_epacems_YEAR_STATE" where
         YEAR is a 4 digit number and STATE is a lower case 2-letter code for a
         US state. The value is a :class:`pandas.DataFrame` containing all the
-        raw EPA CEMS hourly emissions data for the indicated state and year.
+        raw EPA CEMS hourly emissions data for the indicated state and year,
+        or one chunk of it, in which case the same key is yielded repeatedly.
 
     """
     for year in epacems_years:
         # The keys of the us_states dictionary are the state abbrevs
         for state in states:
-            dfs = []
             logger.info(f"Performing ETL for EPA CEMS hourly {state}-{year}")
-            for month in range(1, 13):
-                filename = datastore.path('epacems',
-                                          year=year, month=month, state=state,
-                                          data_dir=data_dir)
-                dfs.append(read_cems_csv(filename))
+            filenames = [
+                datastore.path('epacems',
+                               year=year, month=month, state=state,
+                               data_dir=data_dir)
+                for month in range(1, 13)
+            ]
+            resource_name = (
+                "hourly_emissions_epacems_" + str(year) + "_" + state.lower())
+            if chunksize is not None:
+                for filename in filenames:
+                    for chunk in read_cems_csv_chunks(
+                            filename, chunksize=chunksize, reader=reader):
+                        yield {resource_name: chunk}
+                continue
+            if reader == "pyarrow":
+                df = read_cems_state_year_arrow(filenames)
+            else:
+                df = pd.concat([read_cems_csv(f) for f in filenames],
+                               sort=True, copy=False, ignore_index=True)
             # Return a dictionary where the key identifies this dataset
             # (just like the other extract functions), but unlike the
             # others, this is yielded as a generator (and it's a one-item
             # dictionary).
-            yield {
-                ("hourly_emissions_epacems_" + str(year) + "_" + state.lower()):
-                    pd.concat(dfs, sort=True, copy=False, ignore_index=True)
-            }
+            yield {resource_name: df}
@@ -0,0 +1,138 @@
+"""Unit tests for pudl.extract.epacems module."""
+import os
+import tempfile
+import unittest
+import unittest.mock as mock
+import zipfile
+
+import numpy as np
+import pandas as pd
+
+import pudl.extract.epacems as epacems
+
+
+def write_cems_zip(path, n_records, seed=0, drop_columns=()):
+    """Write a zipped CEMS CSV with messy values in the columns PUDL reads.
+
+    Args:
+        path (str): Where to write the zip file.
+        n_records (int): How many hourly records to write.
+        seed (int): Seed for the random values.
+        drop_columns (iterable): Columns to leave out of the CSV, as in
+            some years of the CEMS data.
+
+    """
+    rng = np.random.default_rng(seed)
+    flags = np.array(["", "Measured", "Substituted", "LME"])
+    hours = np.arange(n_records)
+    df = pd.DataFrame({
+        "STATE": "ID",
+        "FACILITY_NAME": "Some Plant, Inc.",
+        "ORISPL_CODE": 7000 + hours // 500,
+        "UNITID": np.where(hours % 3 == 0, "CT1", "2"),
+        "OP_DATE": [f"01-{1 + h // 24 % 28:02}-2018" for h in hours],
+        "OP_HOUR": hours % 24,
+        "OP_TIME": rng.choice([0.0, 0.25, 1.0], n_records),
+        "GLOAD (MW)": np.where(hours % 5 == 0, np.nan,
+                               rng.uniform(0, 500, n_records).round(2)),
+        "SO2_MASS (lbs)": rng.uniform(0, 10, n_records).round(3),
+        "SO2_MASS_MEASURE_FLG": rng.choice(flags, n_records),
+        "SO2_RATE (lbs/mmBtu)": 0.1,
+        "HEAT_INPUT (mmBtu)": rng.uniform(0, 5000, n_records).round(1),
+        "FAC_ID": 100 + hours // 500,
+        "UNIT_ID": 1000 + hours % 3,
+    }).drop(columns=list(drop_columns))
+    with zipfile.ZipFile(path, "w", zipfile.ZIP_DEFLATED) as zf:
+        zf.writestr(os.path.basename(path)[:-4] + ".csv",
+                    df.to_csv(index=False))
+
+
+class TestReadCemsCsvChunks(unittest.TestCase):
+    """Tests that reading a CEMS file in chunks gives the same records."""
+
+    def setUp(self):
+        """Writes a zipped CEMS CSV that spans several pyarrow blocks."""
+        self._dir = tempfile.TemporaryDirectory()
+        self.path = os.path.join(self._dir.name, "2018id01.zip")
+        write_cems_zip(self.path, 2000)
+
+    def tearDown(self):
+        """Removes the test CSV."""
+        self._dir.cleanup()
+
+    def test_same_as_unchunked(self):
+        """Chunks are bounded, and add up to the whole file for both readers."""
+        unchunked = {
+            "pandas": epacems.read_cems_csv(self.path),
+            "pyarrow": epacems.read_cems_state_year_arrow([self.path]),
+        }
+        for reader, expected in unchunked.items():
+            for chunksize in (7, 333, 2000, 5000):
+                chunks = list(epacems.read_cems_csv_chunks(
+                    self.path, chunksize=chunksize, reader=reader))
+                self.assertEqual(
+                    [min(chunksize, 2000 - offset)
+                     for offset in range(0, 2000, chunksize)],
+                    [len(chunk) for chunk in chunks])
+                pd.testing.assert_frame_equal(
+                    expected, pd.concat(chunks, ignore_index=True))
+
+    def test_pyarrow_streams_blocks(self):
+        """The pyarrow reader parses the file in blocks smaller than it."""
+        with mock.patch.object(
+                epacems.pa.csv, "open_csv",
+                wraps=epacems.pa.csv.open_csv) as open_csv:
+            chunks = list(epacems.read_cems_csv_chunks(
+                self.path, chunksize=10, reader="pyarrow"))
+        self.assertEqual(200, len(chunks))
+        with zipfile.ZipFile(self.path) as zf:
+            csv_size = zf.infolist()[0].file_size
+        self.assertLess(
+            open_csv.call_args.kwargs["read_options"].block_size, csv_size)
+
+
+class TestExtract(unittest.TestCase):
+    """Tests that the pandas and pyarrow readers extract the same records."""
+
+    def setUp(self):
+        """Writes a year of small monthly CEMS files."""
+        self._dir = tempfile.TemporaryDirectory()
+        patch = mock.patch.object(
+            epacems.datastore, "path",
+            lambda dataset, year, month, state, data_dir: os.path.join(
+                data_dir, f"{year}{state.lower()}{month:02}.zip"))
+        patch.start()
+        self.addCleanup(patch.stop)
+
+    def tearDown(self):
+        """Removes the test CSVs."""
+        self._dir.cleanup()
+
+    def _extract(self, reader):
+        dfs = list(epacems.extract(
+            [2018], ["ID"], self._dir.name, reader=reader))
+        self.assertEqual(["hourly_emissions_epacems_2018_id"],
+                         [name for df in dfs for name in df])
+        return dfs[0]["hourly_emissions_epacems_2018_id"]
+
+    def test_same_as_pandas(self):
+        """Both readers give the same columns, types and values."""
+        for month in range(1, 13):
+            write_cems_zip(
+                os.path.join(self._dir.name, f"2018id{month:02}.zip"),
+                n_records=50 * month, seed=month)
+        pd.testing.assert_frame_equal(
+            self._extract("pandas"), self._extract("pyarrow"),
+            check_like=True)
+
+    def test_changed_columns(self):
+        """Both readers handle columns which change partway through a year."""
+        for month in range(1, 13):
+            write_cems_zip(
+                os.path.join(self._dir.name, f"2018id{month:02}.zip"),
+                n_records=30, seed=month,
+                drop_columns=["FAC_ID", "UNIT_ID"] if month < 6 else [])
+        df = self._extract("pyarrow")
+        self.assertEqual(150, df["facility_id"].isna().sum())
+        pd.testing.assert_frame_equal(
+            self._extract("pandas"), df, check_like=True)
@@ -1,11 +1,20 @@
 """Load excel metadata CSV files form a python data package."""
 
+import concurrent.futures
+import functools
 import glob
+import hashlib
 import importlib.resources
 import logging
+import os
 import os.path
+import pathlib
+import pickle
 
+import numpy as np
+import openpyxl
 import pandas as pd
+from pandas.io.parsers import TextParser
 
 import pudl
 import pudl.constants as pc
@@ -34,7 +43,11 @@ class Metadata(object):
     when loading data for given (year, page)
     - column_map/${page}.csv currently informs us how to translate input column
     names to standardized pudl names for given (year, input_col_name). Relevant
-    page is encoded in the filename.
+    page is encoded in the filename. If the file contains integers rather than
+    input column names, they are the positions of the input columns, and -1
+    marks the columns which are missing in a given year.
+    - file_name_map.csv is optional, and tells us the name of the excel file
+    which contains the data for given (year, page).
     """
 
     # TODO: we could validate whether metadata is valid for all year. We should have
@@ -42,25 +55,23 @@ class Metadata(object):
     # and for all (year, page) -> column map
 
     def __init__(self, dataset_name):
-        """Create Metadata object and load metadata from python package.
+        """Create Metadata object for the metadata in a python package.
+
+        The metadata is only loaded when it is first used, and only once per
+        process for each dataset, see load_metadata(). Metadata objects are
+        created when the extractor modules are imported, before the pudl
+        package has been fully initialized, so nothing is loaded here.
 
         Args:
             dataset_name: Name of the package/dataset to load the metadata from.
             Files will be loaded from pudl.package_data.meta.xlsx_meta.${dataset_name}.
         """
-        pkg = f'pudl.package_data.meta.xlsx_maps.{dataset_name}'
         self._dataset_name = dataset_name
-        self._skiprows = self._load_csv(pkg, 'skiprows.csv')
-        self._sheet_name = self._load_csv(pkg, 'tab_map.csv')
-        column_map_pkg = pkg + '.column_maps'
-        self._column_map = {}
-        for res in importlib.resources.contents(column_map_pkg):
-            # res is expected to be ${page}.csv
-            parts = res.split('.')
-            if len(parts) != 2 or parts[1] != 'csv':
-                continue
-            column_map = self._load_csv(column_map_pkg, res)
-            self._column_map[parts[0]] = column_map
+
+    @property
+    def _meta(self):
+        """The metadata of the dataset, loaded on first use."""
+        return load_metadata(self._dataset_name)
 
     def get_dataset_name(self):
         """Returns the name of the dataset described by this metadata."""
@@ -68,29 +79,286 @@ class Metadata(object):
 
     def get_sheet_name(self, year, page):
         """Returns name of the excel sheet that contains the data for given year and page."""
-        return self._sheet_name.at[year, page]
+        return self._meta['sheet_name'][page][year]
 
     def get_skiprows(self, year, page):
         """Returns number of initial rows to skip when loading given year and page."""
-        return self._skiprows.at[year, page]
+        return self._meta['skiprows'][page][year]
+
+    def get_file_name(self, year, page):
+        """Returns name of the excel file that contains the data for given year and page."""
+        if self._meta['file_name'] is None:
+            raise KeyError(
+                f'{self._dataset_name} metadata has no file_name_map.csv.')
+        return self._meta['file_name'][page][year]
 
     def get_column_map(self, year, page):
         """Returns the dictionary mapping input columns to pudl columns for given year and page."""
-        return {v: k for k, v in self._column_map[page].loc[year].to_dict().items()}
+        return dict(self._meta['column_map'][page][year])
+
+    def uses_column_positions(self, page):
+        """Returns True if input columns of given page are identified by position."""
+        return self._meta['column_positions'][page]
 
     def get_all_columns(self, page):
         """Returns list of all pudl (standardized) columns for a given page (across all years)."""
-        return sorted(self._column_map[page].columns)
+        return list(self._meta['all_columns'][page])
 
     def get_all_pages(self):
         """Returns list of all known pages."""
-        return sorted(self._column_map.keys())
+        return sorted(self._meta['column_map'].keys())
+
+
+METADATA_PICKLE = 'metadata.pkl'
+"""Name of the pickled metadata written into a dataset package at build time."""
+
+
+def _metadata_csvs(dataset_name):
+    """Returns (package, filename) of every metadata CSV of a dataset."""
+    pkg = f'pudl.package_data.meta.xlsx_maps.{dataset_name}'
+    csvs = [(pkg, res) for res in importlib.resources.contents(pkg)
+            if res.endswith('.csv')]
+    column_map_pkg = pkg + '.column_maps'
+    csvs.extend((column_map_pkg, res)
+                for res in importlib.resources.contents(column_map_pkg)
+                if res.endswith('.csv'))
+    return sorted(csvs)
+
+
+def _load_csv(package, filename):
+    """Load metadata from a filename that is found in a package."""
+    return pd.read_csv(importlib.resources.open_text(package, filename),
+                       index_col=0, comment='#')
+
+
+def _by_page(df):
+    """Converts a (year x page) metadata table into {page: {year: value}}."""
+    return {page: col.astype(object).to_dict() for page, col in df.items()}
+
+
+def _parse_metadata(dataset_name):
+    """Parses the metadata CSVs of a dataset into plain python structures."""
+    pkg = f'pudl.package_data.meta.xlsx_maps.{dataset_name}'
+    meta = {
+        'skiprows': _by_page(_load_csv(pkg, 'skiprows.csv')),
+        'sheet_name': _by_page(_load_csv(pkg, 'tab_map.csv')),
+        'file_name': None,
+        'column_map': {},
+        'column_positions': {},
+        'all_columns': {},
+    }
+    if 'file_name_map.csv' in importlib.resources.contents(pkg):
+        meta['file_name'] = _by_page(_load_csv(pkg, 'file_name_map.csv'))
+
+    column_map_pkg = pkg + '.column_maps'
+    for res in importlib.resources.contents(column_map_pkg):
+        # res is expected to be ${page}.csv
+        parts = res.split('.')
+        if len(parts) != 2 or parts[1] != 'csv':
+            continue
+        page = parts[0]
+        column_map = _load_csv(column_map_pkg, res)
+        positions = all(pd.api.types.is_integer_dtype(dtype)
+                        for dtype in column_map.dtypes)
+        meta['column_map'][page] = {
+            year: {
+                input_col: pudl_col
+                for pudl_col, input_col in row.items()
+                if (input_col >= 0 if positions else pd.notna(input_col))
+            }
+            for year, row in column_map.astype(object).iterrows()
+        }
+        meta['column_positions'][page] = positions
+        meta['all_columns'][page] = sorted(column_map.columns)
+    return meta
+
+
+@functools.lru_cache(maxsize=None)
+def load_metadata(dataset_name):
+    """Loads the excel metadata of a dataset, once per process.
+
+    The metadata CSVs are parsed into plain python structures, with the
+    column maps of every (year, page) already inverted into the dictionaries
+    used to rename the columns. If the dataset package contains the pickled
+    metadata written by write_metadata_pickle(), and it was built from the
+    same CSVs by the same version of PUDL, it is loaded instead, which is
+    much faster than parsing them.
+
+    Args:
+        dataset_name: Name of the package/dataset to load the metadata from.
+
+    Returns:
+        dict: the metadata of the dataset. It is shared by all Metadata
+        objects for the dataset, and must not be modified.
 
-    @staticmethod
-    def _load_csv(package, filename):
-        """Load metadata from a filename that is found in a package."""
-        return pd.read_csv(importlib.resources.open_text(package, filename),
-                           index_col=0, comment='#')
+    """
+    pkg = f'pudl.package_data.meta.xlsx_maps.{dataset_name}'
+    source_hash = hashlib.sha256(pudl.__version__.encode())
+    for package, filename in _metadata_csvs(dataset_name):
+        source_hash.update(filename.encode())
+        source_hash.update(importlib.resources.read_binary(package, filename))
+    source_hash = source_hash.hexdigest()
+
+    if METADATA_PICKLE in importlib.resources.contents(pkg):
+        meta = pickle.loads(
+            importlib.resources.read_binary(pkg, METADATA_PICKLE))
+        if meta.get('source_hash') == source_hash:
+            return meta
+        logger.info(
+            f'{dataset_name} {METADATA_PICKLE} is out of date, '
+            f'parsing the metadata CSVs instead.')
+
+    meta = _parse_metadata(dataset_name)
+    meta['source_hash'] = source_hash
+    return meta
+
+
+def write_metadata_pickle(dataset_name):
+    """Writes the parsed excel metadata of a dataset into its package.
+
+    This is meant to be run when building the package, so that the metadata
+    doesn't have to be parsed from the CSVs every time PUDL is imported.
+
+    Args:
+        dataset_name: Name of the package/dataset to pickle the metadata of.
+
+    Returns:
+        pathlib.Path: path to the pickle file.
+
+    """
+    pkg = importlib.import_module(
+        f'pudl.package_data.meta.xlsx_maps.{dataset_name}')
+    path = pathlib.Path(pkg.__file__).parent / METADATA_PICKLE
+    with open(path, 'wb') as f:
+        pickle.dump(load_metadata(dataset_name), f,
+                    protocol=pickle.HIGHEST_PROTOCOL)
+    return path
+
+
+class SheetCache(object):
+    """On-disk cache of DataFrames parsed from excel spreadsheets.
+
+    Parsing large excel spreadsheets is slow, and the original EIA
+    spreadsheets never change, so the raw DataFrames returned by
+    pd.read_excel() are pickled in the cache directory. Each cached sheet is
+    identified by a hash of the contents of the spreadsheet file, the
+    arguments that were used to read it, and the versions of PUDL and pandas,
+    so changing any of them means the sheet is parsed again.
+    """
+
+    def __init__(self, cache_dir):
+        """Create a cache which stores sheets in the given directory.
+
+        Args:
+            cache_dir: Path to the directory in which to store parsed sheets.
+        """
+        self._cache_dir = pathlib.Path(cache_dir)
+        self._file_hashes = {}
+
+    def file_hash(self, file_path):
+        """Returns the SHA-256 hash of a file's contents, computed only once."""
+        file_path = str(file_path)
+        if file_path not in self._file_hashes:
+            sha = hashlib.sha256()
+            with open(file_path, 'rb') as f:
+                for block in iter(lambda: f.read(2**20), b''):
+                    sha.update(block)
+            self._file_hashes[file_path] = sha.hexdigest()
+        return self._file_hashes[file_path]
+
+    def get_path(self, file_path, **read_kwargs):
+        """Returns the path to the cached sheet read from file_path."""
+        key = hashlib.sha256(repr((
+            self.file_hash(file_path),
+            sorted(read_kwargs.items()),
+            pudl.__version__,
+            pd.__version__,
+        )).encode()).hexdigest()
+        return self._cache_dir / f'{pathlib.Path(file_path).stem}_{key[:16]}.pkl'
+
+    def read(self, file_path, **read_kwargs):
+        """Returns the cached sheet, or None if it hasn't been cached."""
+        cache_path = self.get_path(file_path, **read_kwargs)
+        if not cache_path.exists():
+            return None
+        try:
+            return pd.read_pickle(cache_path)
+        # Unpickling a damaged file can raise almost anything.
+        except Exception as err:
+            logger.warning(
+                f'Ignoring unreadable cached sheet {cache_path}: {err}')
+            return None
+
+    def write(self, df, file_path, **read_kwargs):
+        """Caches a sheet, warning rather than failing on errors."""
+        cache_path = self.get_path(file_path, **read_kwargs)
+        tmp_path = cache_path.with_suffix('.pkl.tmp')
+        try:
+            cache_path.parent.mkdir(parents=True, exist_ok=True)
+            df.to_pickle(tmp_path)
+            os.replace(tmp_path, cache_path)
+        except OSError as err:
+            logger.warning(f'Unable to cache parsed sheet {cache_path}: {err}')
+
+
+def _convert_cell_value(value):
+    """Converts an openpyxl cell value the same way pd.read_excel() does."""
+    if value is None:
+        return ''
+    if isinstance(value, float) and value.is_integer():
+        return int(value)
+    if isinstance(value, str) and value in openpyxl.cell.cell.ERROR_CODES:
+        return np.nan
+    return value
+
+
+def read_sheet_streaming(file_path, sheet_name=0, skiprows=0, dtype=None):
+    """Reads a single sheet of an xlsx file, streaming its rows.
+
+    The workbook is opened in read-only mode, and the values of the rows in
+    the requested sheet are read one at a time, without creating a cell
+    object for each of them. The rows are then parsed into typed columns just
+    like pd.read_excel() parses them, so the two produce the same DataFrame.
+    This is much faster and uses much less memory for the biggest sheets.
+
+    Args:
+        file_path: Path to the xlsx file.
+        sheet_name: Name or position of the sheet to read.
+        skiprows: Number of initial rows to skip before the header row.
+        dtype: Dictionary of {column_name: dtype} to use for the columns.
+
+    Returns:
+        pandas.DataFrame: the contents of the sheet.
+    """
+    book = openpyxl.load_workbook(
+        file_path, read_only=True, data_only=True, keep_links=False)
+    try:
+        if isinstance(sheet_name, str):
+            sheet = book[sheet_name]
+        else:
+            sheet = book.worksheets[sheet_name]
+        # The dimensions recorded in the file aren't always right.
+        sheet.reset_dimensions()
+
+        data = []
+        last_row_with_data = -1
+        for row_number, row in enumerate(sheet.iter_rows(values_only=True)):
+            row = [_convert_cell_value(value) for value in row]
+            while row and row[-1] == '':
+                row.pop()
+            if row:
+                last_row_with_data = row_number
+            data.append(row)
+    finally:
+        book.close()
+
+    data = data[:last_row_with_data + 1]
+    if not data:
+        return pd.DataFrame()
+    width = max(len(row) for row in data)
+    data = [row + [''] * (width - len(row)) for row in data]
+    return TextParser(data, header=0, skiprows=skiprows, dtype=dtype,
+                      skip_blank_lines=False).read()
 
 
 class GenericExtractor(object):
@@ -111,13 +379,17 @@ class GenericExtractor(object):
     available. This can be used for experimental/new code that should not be
     run yet.
 
-    3. file_basename_glob() tells us what is the basename of the excel file
+    3. STREAMING_PAGES class attribute lists the pages which are big enough
+    that they should be read with read_sheet_streaming() rather than with
+    pd.read_excel(). Only pages stored in xlsx files can be streamed.
+
+    4. file_basename_glob() tells us what is the basename of the excel file
     that contains the data for a given (year, page).
 
-    4. dtypes() should return dict with {column_name: pandas_datatype} if you
+    5. dtypes() should return dict with {column_name: pandas_datatype} if you
     need to specify which datatypes should be uded upon loading.
 
-    5. If data cleanup is necessary, you can apply custom logic by overriding
+    6. If data cleanup is necessary, you can apply custom logic by overriding
     one of the following functions (they all return the modified dataframe):
     - process_raw() is applied right after loading the excel DataFrame
     from the disk.
@@ -133,19 +405,42 @@ class GenericExtractor(object):
     BLACKLISTED_PAGES = []
     """List of supported pages that should not be extracted."""
 
-    def __init__(self, data_dir, metadata=None):
+    STREAMING_PAGES = []
+    """List of pages to read with read_sheet_streaming()."""
+
+    def __init__(self, data_dir, metadata=None, workers=1, use_cache=False):
         """Create new extractor object and load metadata.
 
         Args:
             data_dir: Path to the data_dir to use when loading excel
               files from disk (passed to datastore).
+            workers: Number of worker processes to use for parsing the
+              excel spreadsheets. All the pages stored in the same file
+              are parsed by the same worker. If 1, all of them are parsed
+              in this process.
+            use_cache: Whether to read and write the parsed sheets from the
+              SheetCache in the cache/${dataset} directory of data_dir.
         """
+        if workers < 1:
+            raise ValueError(
+                f"workers must be a positive integer, but got {workers}.")
         self._data_dir = data_dir
+        self._workers = workers
         if not self.METADATA:
             raise NotImplementedError('self.METADATA must be set.')
         self._metadata = self.METADATA
         self._dataset_name = self._metadata.get_dataset_name()
         self._file_cache = {}
+        self._sheet_cache = None
+        if use_cache:
+            self._sheet_cache = SheetCache(
+                pathlib.Path(data_dir, 'cache', self._dataset_name))
+
+    def __getstate__(self):
+        """Drops any open excel files, which can't be sent to other processes."""
+        state = self.__dict__.copy()
+        state['_file_cache'] = {}
+        return state
 
     @staticmethod
     def process_raw(df, year, page):
@@ -176,39 +471,116 @@ class GenericExtractor(object):
         # TODO: should we run verify_years(?) here?
         if not years:
             logger.info(
-                f'No years given. Not extracting {self.DATSET} spreadsheet data.')
+                f'No years given. Not extracting {self._dataset_name} '
+                f'spreadsheet data.')
             return {}
 
-        raw_dfs = {}
+        pages = []
         for page in self._metadata.get_all_pages():
             if page in self.BLACKLISTED_PAGES:
                 logger.info(f'Skipping blacklisted page {page}.')
                 continue
-            df = pd.DataFrame()
-            for yr in years:
-                logger.info(
-                    f'Loading dataframe for {self._dataset_name} {page} {yr}')
-                newdata = pd.read_excel(
-                    self._load_excel_file(yr, page),
-                    sheet_name=self._metadata.get_sheet_name(yr, page),
-                    skiprows=self._metadata.get_skiprows(yr, page),
-                    dtype=self.get_dtypes(yr, page))
-
-                newdata = pudl.helpers.simplify_columns(newdata)
-                newdata = self.process_raw(newdata, yr, page)
-                newdata = newdata.rename(
-                    columns=self._metadata.get_column_map(yr, page))
-                newdata = self.process_renamed(newdata, yr, page)
-                df = df.append(newdata, sort=True, ignore_index=True)
+            pages.append(page)
+        sheets = [(page, yr) for page in pages for yr in years]
+        if self._sheet_cache is not None:
+            # Hash each file once here, rather than in every worker process.
+            for page, yr in sheets:
+                self._sheet_cache.file_hash(self._get_file_path(yr, page))
+
+        if self._workers == 1:
+            page_dfs = {
+                (page, yr): self._load_page(yr, page) for page, yr in sheets}
+        else:
+            # Several pages are often stored in the same file, so each worker
+            # loads all the pages from one file, which it only opens once.
+            file_sheets = {}
+            for page, yr in sheets:
+                file_sheets.setdefault(
+                    self._get_file_path(yr, page), []).append((page, yr))
+            logger.info(
+                f'Loading {len(sheets)} {self._dataset_name} spreadsheets '
+                f'from {len(file_sheets)} files using {self._workers} '
+                f'worker processes.')
+            with concurrent.futures.ProcessPoolExecutor(
+                    max_workers=self._workers) as executor:
+                futures = [
+                    executor.submit(self._load_pages, file_sheet)
+                    for file_sheet in file_sheets.values()
+                ]
+                page_dfs = {}
+                for future in futures:
+                    page_dfs.update(future.result())
+
+        raw_dfs = {}
+        for page in pages:
+            df = pd.concat(
+                [page_dfs.pop((page, yr)) for yr in years],
+                sort=True, ignore_index=True)
 
             # After all years are loaded, consolidate missing columns
             missing_cols = set(self._metadata.get_all_columns(
                 page)).difference(df.columns)
-            empty_cols = pd.DataFrame(columns=missing_cols)
+            empty_cols = pd.DataFrame(columns=sorted(missing_cols))
             df = pd.concat([df, empty_cols], sort=True)
             raw_dfs[page] = self.process_final_page(df, page)
         return raw_dfs
 
+    def _load_pages(self, sheets):
+        """Loads the DataFrames for a list of (page, year) sheets.
+
+        Returns a dict of DataFrames keyed by (page, year). This runs in a
+        worker process, so any excel files are opened there, and only
+        once each.
+        """
+        page_dfs = {
+            (page, yr): self._load_page(yr, page) for page, yr in sheets}
+        self._file_cache.clear()
+        return page_dfs
+
+    def _load_page(self, year, page):
+        """Loads the DataFrame for a given year and page, with renamed columns.
+
+        This may run in a worker process, in which case the excel file is
+        opened there.
+        """
+        logger.info(
+            f'Loading dataframe for {self._dataset_name} {page} {year}')
+        read_kwargs = self.get_read_kwargs(year, page)
+        newdata = None
+        if self._sheet_cache is not None:
+            file_path = self._get_file_path(year, page)
+            newdata = self._sheet_cache.read(file_path, **read_kwargs)
+        if newdata is None:
+            newdata = self._read_sheet(year, page, **read_kwargs)
+            if self._sheet_cache is not None:
+                self._sheet_cache.write(newdata, file_path, **read_kwargs)
+
+        newdata = pudl.helpers.simplify_columns(newdata)
+        newdata = self.process_raw(newdata, year, page)
+        column_map = self._metadata.get_column_map(year, page)
+        if self._metadata.uses_column_positions(page):
+            newdata.columns = [
+                column_map.get(pos, col)
+                for pos, col in enumerate(newdata.columns)]
+        else:
+            newdata = newdata.rename(columns=column_map)
+        return self.process_renamed(newdata, year, page)
+
+    def get_read_kwargs(self, year, page):
+        """Returns the arguments used to parse the sheet for (year, page)."""
+        return dict(
+            sheet_name=self._metadata.get_sheet_name(year, page),
+            skiprows=self._metadata.get_skiprows(year, page),
+            dtype=self.get_dtypes(year, page))
+
+    def _read_sheet(self, year, page, **read_kwargs):
+        """Parses the sheet for a given year and page from its excel file."""
+        if page in self.STREAMING_PAGES:
+            file_path = self._get_file_path(year, page)
+            if file_path.endswith('.xlsx'):
+                return read_sheet_streaming(file_path, **read_kwargs)
+        return pd.read_excel(self._load_excel_file(year, page), **read_kwargs)
+
     def _load_excel_file(self, year, page):
         """Returns ExcelFile object corresponding to given (year, page).
 
@@ -222,11 +594,16 @@ class GenericExtractor(object):
         return self._file_cache[full_path]
 
     def verify_years(self, years):
-        """Validate that all files are availabe.
+        """Validate that all years are supported and all files are availabe.
 
         Raises:
+            IndexError: when some of the years aren't supported.
             FileNotFoundError: when some files are not found in the datastore.
         """
+        bad_years = set(years).difference(pc.working_years[self._dataset_name])
+        if bad_years:
+            raise IndexError(
+                f"{self._dataset_name} doesn't support years {bad_years}")
         bad_years = set()
         for page in self._metadata.get_all_pages():
             if page in self.BLACKLISTED_PAGES:
@@ -239,10 +616,6 @@ class GenericExtractor(object):
         if bad_years:
             raise FileNotFoundError(
                 f'Missing {self._dataset_name} files for years {bad_years}.')
-        bad_years = set(years).difference(pc.working_years[self._dataset_name])
-        if bad_years:
-            raise IndexError(
-                f"{self._dataset_name} doesn't support years {bad_years}")
 
     @staticmethod
     def file_basename_glob(year, page):
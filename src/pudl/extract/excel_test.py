@@ -1,8 +1,13 @@
 """Unit tests for pudl.extract.excel module."""
+import concurrent.futures
+import datetime
+import os
+import tempfile
 import unittest
 import unittest.mock as mock
 from unittest.mock import patch
 
+import openpyxl
 import pandas as pd
 
 import pudl.extract.excel as excel
@@ -29,6 +34,27 @@ class TestMetadata(unittest.TestCase):
             self._metadata.get_column_map(2010, 'books'))
         self.assertEqual(10, self._metadata.get_skiprows(2011, 'boxes'))
         self.assertEqual(1, self._metadata.get_sheet_name(2011, 'boxes'))
+        self.assertFalse(self._metadata.uses_column_positions('books'))
+
+    def test_loaded_on_first_use(self):
+        """Test that creating Metadata doesn't load it, as is done on import."""
+        excel.load_metadata.cache_clear()
+        metadata = excel.Metadata('test')
+        self.assertEqual(0, excel.load_metadata.cache_info().currsize)
+        self.assertEqual(10, metadata.get_skiprows(2011, 'boxes'))
+        self.assertEqual(1, excel.load_metadata.cache_info().currsize)
+
+    def test_column_positions(self):
+        """Test that column maps can refer to the columns by position."""
+        metadata = excel.Metadata('eia861')
+        self.assertTrue(metadata.uses_column_positions('sales_eia861'))
+        column_map = metadata.get_column_map(1999, 'sales_eia861')
+        self.assertEqual('utility_id_eia', column_map[0])
+        self.assertEqual('total_customers', column_map[20])
+        self.assertNotIn(-1, column_map)
+        self.assertEqual(
+            'Sales_Ult_Cust_2018.xlsx',
+            metadata.get_file_name(2018, 'sales_eia861'))
 
 
 class FakeExtractor(excel.GenericExtractor):
@@ -59,6 +85,16 @@ def _fake_data_frames(page_name, **kwargs):
     return fake_data[page_name]
 
 
+class FakeSharedFileExtractor(FakeExtractor):
+    """Fake extractor which stores all the pages of a year in one file."""
+
+    def _get_file_path(self, year, page):
+        return f'/blah/{year}.xlsx'
+
+    def _read_sheet(self, year, page, **read_kwargs):
+        return _fake_data_frames(self._load_excel_file(year, page))
+
+
 class TestGenericExtractor(unittest.TestCase):
     """Test operation of the excel.GenericExtractor class."""
 
@@ -96,5 +132,117 @@ class TestGenericExtractor(unittest.TestCase):
             }),
             dfs['boxes'])
 
+    def test_invalid_workers(self):
+        """Checks that at least one worker is required."""
+        with self.assertRaises(ValueError):
+            FakeExtractor('/blah', workers=0)
+
+    def test_parallel_same_as_serial(self):
+        """Checks that worker processes give the same DataFrames."""
+        serial = FakeSharedFileExtractor('/blah').extract([2010, 2011])
+        with patch.object(
+                concurrent.futures.ProcessPoolExecutor, 'submit',
+                autospec=True,
+                side_effect=concurrent.futures.ProcessPoolExecutor.submit
+        ) as submit:
+            parallel = FakeSharedFileExtractor(
+                '/blah', workers=2).extract([2010, 2011])
+        # Both pages of each year are loaded from the same file.
+        self.assertEqual(2, submit.call_count)
+        self.assertEqual(set(serial), set(parallel))
+        for page in serial:
+            pd.testing.assert_frame_equal(serial[page], parallel[page])
+
     # TODO(rousik@gmail.com): need to figure out how to test process_$x methods.
     # TODO(rousik@gmail.com): we should test that empty columns are properly added.
+
+
+class FakeCachedExtractor(FakeExtractor):
+    """Fake extractor whose spreadsheets are empty files in data_dir."""
+
+    def __init__(self, data_dir):
+        super().__init__(data_dir, use_cache=True)
+
+    def _get_file_path(self, year, page):
+        path = os.path.join(self._data_dir, f'{page}-{year}.xlsx')
+        if not os.path.exists(path):
+            with open(path, 'w') as f:
+                f.write(path)
+        return path
+
+
+class TestSheetCache(unittest.TestCase):
+    """Test that parsed sheets are cached on disk."""
+
+    def setUp(self):
+        """Creates a temporary data directory."""
+        self._dir = tempfile.TemporaryDirectory()
+
+    def tearDown(self):
+        """Removes the temporary data directory."""
+        self._dir.cleanup()
+
+    def test_cached_sheets_are_not_parsed(self):
+        """Checks that a second extraction reads sheets from the cache."""
+        read_excel = mock.Mock(side_effect=_fake_data_frames)
+        with patch('pudl.extract.excel.pd.read_excel', read_excel):
+            first = FakeCachedExtractor(self._dir.name).extract([2010, 2011])
+            self.assertEqual(4, read_excel.call_count)
+            second = FakeCachedExtractor(self._dir.name).extract([2010, 2011])
+            self.assertEqual(4, read_excel.call_count)
+        for page in ['books', 'boxes']:
+            pd.testing.assert_frame_equal(first[page], second[page])
+
+    def test_changed_file_is_parsed(self):
+        """Checks that a sheet is parsed again if its file has changed."""
+        read_excel = mock.Mock(side_effect=_fake_data_frames)
+        with patch('pudl.extract.excel.pd.read_excel', read_excel):
+            FakeCachedExtractor(self._dir.name).extract([2010])
+            with open(os.path.join(self._dir.name, 'books-2010.xlsx'), 'a') as f:
+                f.write('changed')
+            FakeCachedExtractor(self._dir.name).extract([2010])
+        self.assertEqual(3, read_excel.call_count)
+
+    def test_pandas_version_in_key(self):
+        """Checks that sheets parsed by another version of pandas are ignored."""
+        cache = excel.SheetCache(self._dir.name)
+        path = FakeCachedExtractor(self._dir.name)._get_file_path(2010, 'books')
+        key = cache.get_path(path, sheet_name=0)
+        with patch('pudl.extract.excel.pd.__version__', '0.0.0'):
+            self.assertNotEqual(key, cache.get_path(path, sheet_name=0))
+
+
+class TestReadSheetStreaming(unittest.TestCase):
+    """Test that read_sheet_streaming() matches pd.read_excel()."""
+
+    def setUp(self):
+        """Writes a small workbook with a messy sheet to a temp directory."""
+        self._tmp_dir = tempfile.TemporaryDirectory()
+        self._path = os.path.join(self._tmp_dir.name, 'test.xlsx')
+        book = openpyxl.Workbook()
+        book.active.append(['Title of the page'])
+        sheet = book.create_sheet('data')
+        sheet.append(['Some notes about the data'])
+        sheet.append([])
+        sheet.append(['Plant Id', 'Name', None, 'Value', 'Value', 'Date'])
+        sheet.append([1, 'Alpha', None, 1.5, 3, datetime.datetime(2018, 1, 1)])
+        sheet.append([2.0, None, None, '.', 4, datetime.datetime(2018, 2, 1)])
+        sheet.append([])
+        sheet.append([3, 'Gamma', 'x', 2, None])
+        sheet.append([None, None, None])
+        book.save(self._path)
+
+    def tearDown(self):
+        """Removes the temp directory."""
+        self._tmp_dir.cleanup()
+
+    def test_same_as_read_excel(self):
+        """Test that both readers produce the same DataFrame."""
+        for kwargs in [
+            dict(sheet_name='data', skiprows=2),
+            dict(sheet_name=1, skiprows=2, dtype={'Plant Id': pd.Int64Dtype()}),
+            dict(sheet_name=0),
+        ]:
+            expected = pd.read_excel(self._path, engine='openpyxl', **kwargs)
+            pd.testing.assert_frame_equal(
+                expected, excel.read_sheet_streaming(self._path, **kwargs))
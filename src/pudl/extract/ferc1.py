@@ -49,12 +49,17 @@ for further processing and integration with other data sources like the EIA 860
 and EIA 923.
 
 """
+import concurrent.futures
+import hashlib
+import json
 import logging
-import os.path
+import os
+import pathlib
 import re
 import string
 
 import dbfread
+import numpy as np
 import pandas as pd
 import sqlalchemy as sa
 
@@ -176,7 +181,10 @@ def get_strings(filename, min_length=4):
 
     This routine is meant to emulate the Unix "strings" command, for the
     purposes of grabbing database table and column names from the F1_PUB.DBC
-    file that is distributed with the FERC Form 1 data.
+    file that is distributed with the FERC Form 1 data. The file is read as
+    text, silently dropping any bytes which can't be decoded, so printable
+    characters on either side of them form a single string. Runs of
+    printable characters are then found using a regular expression.
 
     Args:
         filename (path-like): the name of the DBC file from which to extract
@@ -190,20 +198,51 @@ def get_strings(filename, min_length=4):
         binary file.
 
     """
+    pattern = re.compile(
+        "[" + re.escape(string.printable) + "]{%d,}" % min_length)
     with open(filename, errors="ignore") as f:
-        result = ""
-        for c in f.read():
-            if c in string.printable:
-                result += c
-                continue
-            if len(result) >= min_length:
-                yield result
-            result = ""
-        if len(result) >= min_length:  # catch result at EOF
-            yield result
+        data = f.read()
+    for match in pattern.finditer(data):
+        yield match.group()
+
+
+def _dbc_map_cache_path(year, data_dir, dbc_hash, min_length):
+    """Path to the cached DBC map for a given year and DBC file hash."""
+    return pathlib.Path(
+        data_dir, "cache", "ferc1",
+        f"dbc_map_{year}_{min_length}_{dbc_hash[:16]}.json")
+
+
+def _read_dbc_map_cache(cache_path):
+    """Read a cached DBC map, or return None if it is missing or stale."""
+    if not cache_path.exists():
+        return None
+    try:
+        with cache_path.open() as f:
+            cached = json.load(f)
+    except (OSError, ValueError):
+        logger.warning(f"Ignoring unreadable DBC map cache {cache_path}.")
+        return None
+    # The way the DBC map is inferred may change between PUDL versions.
+    if cached.get("pudl_version") != pudl.__version__:
+        return None
+    return cached["dbc_map"]
+
+
+def _write_dbc_map_cache(dbc_map, cache_path):
+    """Write a DBC map to the cache, warning rather than failing on errors."""
+    tmp_path = cache_path.with_suffix(".json.tmp")
+    try:
+        cache_path.parent.mkdir(parents=True, exist_ok=True)
+        with tmp_path.open("w") as f:
+            json.dump({"pudl_version": pudl.__version__, "dbc_map": dbc_map},
+                      f, indent=2)
+        os.replace(tmp_path, cache_path)
+    except OSError as err:
+        logger.warning(f"Unable to cache the FERC Form 1 DBC map: {err}")
 
 
-def get_dbc_map(year, data_dir, min_length=4):
+def get_dbc_map(year, data_dir, min_length=4, use_cache=True):
     """
     Extract names of all tables and fields from a FERC Form 1 DBC file.
 
@@ -214,6 +253,11 @@ def get_dbc_map(year, data_dir, min_length=4):
     from the corresponding DBF files (those names are limited to having only 10
     characters in their names.)
 
+    Inferring the map requires parsing the whole DBC file and reading the
+    headers of all the DBF files, so the result is cached on disk in the
+    ``cache/ferc1`` directory of the datastore. Cached maps are identified by
+    the year and a hash of the DBC file, so a changed DBC file is re-parsed.
+
     Args:
         year (int): The year of data from which the database table and column
             names are to be extracted. Typically this is expected to be the
@@ -223,6 +267,8 @@ def get_dbc_map(year, data_dir, min_length=4):
         min_length (int): The minimum number of consecutive printable
             characters that should be considered a meaningful string and
             extracted.
+        use_cache (bool): Whether to read and write the on-disk cache of
+            previously inferred DBC maps.
 
     Returns:
         dict: a dictionary whose keys are the long table names extracted
@@ -232,6 +278,15 @@ def get_dbc_map(year, data_dir, min_length=4):
         (<=10 character) long name of that field as found in the DBF file.
 
     """
+    if use_cache:
+        with open(dbc_filename(year, data_dir), "rb") as f:
+            dbc_hash = hashlib.sha256(f.read()).hexdigest()
+        cache_path = _dbc_map_cache_path(year, data_dir, dbc_hash, min_length)
+        dbc_map = _read_dbc_map_cache(cache_path)
+        if dbc_map is not None:
+            logger.debug(f"Using cached FERC Form 1 DBC map {cache_path}.")
+            return dbc_map
+
     # Extract all the strings longer than "min" from the DBC file
     dbc_strings = list(
         get_strings(dbc_filename(year, data_dir), min_length=min_length)
@@ -295,6 +350,8 @@ def get_dbc_map(year, data_dir, min_length=4):
                     f"DBF field name mismatch: {ln[:8]} != {sn.lower()[:8]}"
                 )
 
+    if use_cache:
+        _write_dbc_map_cache(dbc_map, cache_path)
     return dbc_map
 
 
@@ -342,6 +399,138 @@ def define_sqlite_db(sqlite_meta, dbc_map, data_dir,
     sqlite_meta.create_all()
 
 
+def add_sqlite_indexes(sqlite_meta, indexes=pc.ferc1_sqlite_indexes):
+    """
+    Add indexes to the FERC Form 1 table definitions, without creating them.
+
+    Args:
+        sqlite_meta (sa.MetaData): SQLAlchemy MetaData describing the FERC
+            Form 1 database, either as defined by :func:`define_sqlite_db` or
+            as reflected from an existing database.
+        indexes (dict): FERC Form 1 table names (keys) and iterables of the
+            column names of each index to add to that table (values). Tables
+            which aren't in the database are ignored.
+
+    Returns:
+        list: The newly added :class:`sqlalchemy.Index` objects. Indexes
+        which already exist are not included.
+
+    """
+    new_indexes = []
+    for table, column_sets in indexes.items():
+        if table not in sqlite_meta.tables:
+            continue
+        sa_table = sqlite_meta.tables[table]
+        existing = {index.name for index in sa_table.indexes}
+        for columns in column_sets:
+            missing = [col for col in columns if col not in sa_table.c]
+            if missing:
+                logger.warning(
+                    f"Not indexing {table} on {columns}, since these columns "
+                    f"don't exist: {missing}")
+                continue
+            name = f"ix_{table}_{'_'.join(columns)}"
+            if name in existing:
+                continue
+            new_indexes.append(
+                sa.Index(name, *[sa_table.c[col] for col in columns]))
+    return new_indexes
+
+
+def create_sqlite_indexes(sqlite_meta, indexes=pc.ferc1_sqlite_indexes):
+    """
+    Create indexes on the tables of a FERC Form 1 SQLite database.
+
+    Indexes are much quicker to build once all the data has been loaded, so
+    :func:`dbf2sqlite` calls this after loading all the tables. It can also
+    be used to add indexes to a database cloned without them. The tables are
+    analyzed afterward so that SQLite knows when the indexes are worth using.
+
+    Args:
+        sqlite_meta (sa.MetaData): SQLAlchemy MetaData which is bound to the
+            FERC Form 1 SQLite database.
+        indexes (dict): FERC Form 1 table names (keys) and iterables of the
+            column names of each index to create on that table (values).
+
+    Returns:
+        None
+
+    """
+    for index in add_sqlite_indexes(sqlite_meta, indexes=indexes):
+        logger.info(f"SQLite: creating index {index.name}.")
+        index.create(bind=sqlite_meta.bind)
+    with sqlite_meta.bind.connect() as conn:
+        conn.execute("ANALYZE")
+
+
+def check_sqlite_schema(sqlite_meta, dbc_map, data_dir,
+                        tables=pc.ferc1_tbl2dbf,
+                        refyear=max(pc.working_years['ferc1']),
+                        bad_cols=()):
+    """
+    Check that an existing FERC Form 1 DB has the schema expected for refyear.
+
+    The expected schema is inferred in the same way as by
+    :func:`define_sqlite_db`, and compared to the one reflected from the
+    existing database. Records from another year can only be loaded into
+    the existing database if all of the tables to be loaded have the same
+    columns, with the same types, in the same order.
+
+    Args:
+        sqlite_meta (sa.MetaData): SQLAlchemy MetaData which has been
+            reflected from the existing FERC Form 1 SQLite database.
+        dbc_map (dict of dicts): A dictionary of dictionaries, of the kind
+            returned by get_dbc_map(), describing the table and column names
+            stored within the FERC Form 1 FoxPro database files.
+        data_dir (str): A string representing the full path to the top level of
+            the PUDL datastore containing the FERC Form 1 data to be used.
+        tables (iterable of strings): List or other iterable of FERC database
+            table names that should be checked.
+        refyear (integer): The year of the FERC Form 1 DB to use as a template
+            for the expected multi-year database schema.
+        bad_cols (iterable of 2-tuples): A list or other iterable containing
+            pairs of strings of the form (table_name, column_name), indicating
+            columns (and their parent tables) which were not cloned.
+
+    Returns:
+        None
+
+    Raises:
+        ValueError: If any of the tables are missing from the existing
+            database, or have different columns than expected.
+
+    """
+    expected_meta = sa.MetaData()
+    dialect = sqlite_meta.bind.dialect
+    for table in tables:
+        add_sqlite_table(table, expected_meta, dbc_map,
+                         refyear=refyear,
+                         bad_cols=bad_cols,
+                         data_dir=data_dir)
+        if table not in sqlite_meta.tables:
+            raise ValueError(
+                f"FERC Form 1 table {table} does not exist in the existing "
+                f"database. Re-create the whole database instead."
+            )
+        if table != 'f1_respondent_id' and \
+                'report_year' not in sqlite_meta.tables[table].c:
+            raise ValueError(
+                f"FERC Form 1 table {table} has no report_year column, so "
+                f"individual years of its records can't be replaced."
+            )
+        expected = [(col.name, col.type.compile(dialect=dialect))
+                    for col in expected_meta.tables[table].c]
+        existing = [(col.name, col.type.compile(dialect=dialect))
+                    for col in sqlite_meta.tables[table].c]
+        if expected != existing:
+            raise ValueError(
+                f"The columns of FERC Form 1 table {table} in the existing "
+                f"database don't match those inferred from {refyear}. "
+                f"Re-create the whole database instead.\n"
+                f"Expected: {expected}\nExisting: {existing}"
+            )
+
+
 def get_dbf_path(table, year, data_dir):
     """Given a year and table name, returns the path to its datastore DBF file.
 
@@ -393,7 +582,183 @@ class FERC1FieldParser(dbfread.FieldParser):
         return super(FERC1FieldParser, self).parseN(field, data)
 
 
-def get_raw_df(table, dbc_map, data_dir, years=pc.data_years['ferc1']):
+def _clean_ferc1_numeric(values):
+    """Vectorized equivalent of the cleanup done by FERC1FieldParser.parseN.
+
+    Args:
+        values (numpy.ndarray): Fixed-width byte strings of numeric DBF field
+            values.
+
+    Returns:
+        numpy.ndarray: The cleaned byte strings. Empty strings are nulls.
+
+    """
+    values = np.char.lstrip(np.char.strip(np.char.strip(values), b'*\x00'),
+                            b'0')
+    values = np.where(values == b'.', b'0', values)
+    # The remaining steps are those of dbfread.FieldParser.parseN
+    values = np.char.strip(np.char.strip(values), b'*')
+    return np.char.replace(values, b',', b'.')
+
+
+def _parse_dbf_column(field, values, parser):
+    """
+    Parse a whole column of fixed-width DBF field values at once.
+
+    The results are the same as those produced by dbfread, using the
+    :class:`FERC1FieldParser`, for each of the field types that we handle.
+
+    Args:
+        field (DBFField): The field descriptor, as found in the
+            ``fields`` attribute of a :class:`dbfread.DBF` object.
+        values (numpy.ndarray): The raw bytes of the field in every record,
+            as fixed-width byte strings.
+        parser (FERC1FieldParser): The parser to use for the field types
+            which aren't vectorized.
+
+    Returns:
+        numpy.ndarray: The parsed values.
+
+    """
+    if field.type == 'C':
+        return np.char.decode(
+            np.char.rstrip(values, b'\x00 '), parser.encoding).astype(object)
+    if field.type in ('N', 'F'):
+        if field.type == 'N':
+            values = _clean_ferc1_numeric(values)
+        else:
+            values = np.char.strip(np.char.strip(values), b'*')
+        nulls = values == b''
+        if nulls.all():
+            return np.full(len(values), None, dtype=object)
+        if field.type == 'N' and not nulls.any():
+            # dbfread returns ints for numeric fields when it can.
+            try:
+                return values.astype(np.int64)
+            except ValueError:
+                pass
+        parsed = np.full(len(values), np.nan)
+        parsed[~nulls] = values[~nulls].astype(np.float64)
+        return parsed
+    if field.type == 'I':
+        return values.view('<i4').astype(np.int64)
+    # The remaining types have only a few distinct values in each column, so
+    # they are parsed once per distinct value using the dbfread parser. Byte
+    # strings in NumPy drop trailing nulls, so compare the raw bytes instead.
+    uniques, codes = np.unique(
+        values.view(np.uint8).reshape(len(values), field.length),
+        axis=0, return_inverse=True)
+    parsed = np.empty(len(uniques), dtype=object)
+    parsed[:] = [parser.parse(field, value.tobytes()) for value in uniques]
+    return parsed[codes.ravel()]
+
+
+def read_dbf_numpy(dbf_path, encoding='latin1'):
+    """
+    Read a FERC Form 1 DBF file into a dataframe, a column at a time.
+
+    Rather than iterating over the records and parsing every field value
+    separately, as :mod:`dbfread` does, the file is memory-mapped and viewed
+    as a 2D array of bytes, with one row per record. Each field is then sliced
+    out of every record at once, and parsed with vectorized NumPy operations.
+    The resulting dataframe is the same as the one produced by reading the
+    file with :class:`dbfread.DBF` and :class:`FERC1FieldParser`.
+
+    Tables with field types that we don't parse here (memo fields, mostly)
+    are read using :mod:`dbfread` instead.
+
+    Args:
+        dbf_path (path-like): Path to the DBF file to read.
+        encoding (str): The character encoding of the text fields.
+
+    Returns:
+        :class:`pandas.DataFrame`: The records from the DBF file, excluding
+        those marked as deleted, with their original column names.
+
+    """
+    # Reading the header and field descriptors is cheap, so let dbfread do it.
+    dbf = dbfread.DBF(dbf_path, encoding=encoding,
+                      parserclass=FERC1FieldParser)
+    if any(field.type not in 'CNFIDL0' for field in dbf.fields):
+        logger.debug(f"Reading {dbf_path} using dbfread.")
+        return pd.DataFrame(iter(dbf))
+
+    header = dbf.header
+    mm = np.memmap(dbf_path, dtype=np.uint8, mode='r')
+    n_records = (len(mm) - header.headerlen) // header.recordlen
+    records = mm[header.headerlen:header.headerlen +
+                 n_records * header.recordlen].reshape(
+                     n_records, header.recordlen)
+    # Like dbfread, stop at the end of file marker and skip deleted records.
+    end_of_file = np.flatnonzero(records[:, 0] == 0x1A)
+    if len(end_of_file):
+        records = records[:end_of_file[0]]
+    records = records[records[:, 0] == ord(' ')]
+    if not len(records):
+        return pd.DataFrame()
+
+    parser = FERC1FieldParser(dbf)
+    columns = {}
+    # Field values are stored one after another, following the deleted flag.
+    offset = 1
+    for field in dbf.fields:
+        values = np.ascontiguousarray(
+            records[:, offset:offset + field.length]
+        ).view(f"S{field.length}").ravel()
+        columns[field.name] = _parse_dbf_column(field, values, parser)
+        offset += field.length
+    return pd.DataFrame(columns)
+
+
+def read_dbf(table, year, data_dir, reader='dbfread'):
+    """Read a single year of a FERC Form 1 DBF table into a dataframe.
+
+    This is a module level function so that it can be run in worker processes
+    when cloning several tables and years at once.
+
+    Args:
+        table (string): The name of the FERC Form 1 table from which data is
+            read.
+        year (int): The year of data to read.
+        data_dir (str): A string representing the full path to the top level of
+            the PUDL datastore containing the FERC Form 1 data to be used.
+        reader (str): Either "dbfread", to parse the file one record at a time
+            using :mod:`dbfread`, or "numpy" to use :func:`read_dbf_numpy`.
+
+    Returns:
+        :class:`pandas.DataFrame`: The records from the DBF file, with their
+        original truncated column names, or None if there is no DBF file for
+        the given table and year.
+
+    """
+    if reader not in pc.ferc1_dbf_readers:
+        raise ValueError(
+            f"Unrecognized FERC Form 1 DBF reader: {reader}. Valid readers "
+            f"are {pc.ferc1_dbf_readers}.")
+    dbf_path = get_dbf_path(table, year, data_dir=data_dir)
+    if not os.path.exists(dbf_path):
+        return None
+    if reader == 'numpy':
+        return read_dbf_numpy(dbf_path, encoding='latin1')
+    return pd.DataFrame(
+        iter(dbfread.DBF(dbf_path,
+                         encoding='latin1',
+                         parserclass=FERC1FieldParser)))
+
+
+def _combine_raw_dfs(table, raw_dfs, dbc_map):
+    """Concatenate the yearly dataframes of a table and rename its columns."""
+    raw_dfs = [df for df in raw_dfs if df is not None]
+    if raw_dfs:
+        return (
+            pd.concat(raw_dfs, sort=True).
+            drop('_NullFlags', axis=1, errors='ignore').
+            rename(dbc_map[table], axis=1)
+        )
+
+
+def get_raw_df(table, dbc_map, data_dir, years=pc.data_years['ferc1'],
+               reader='dbfread'):
     """Combine several years of a given FERC Form 1 DBF table into a dataframe.
 
     Args:
@@ -404,39 +769,181 @@ def get_raw_df(table, dbc_map, data_dir, years=pc.data_years['ferc1']):
             stored within the FERC Form 1 FoxPro database files.
         data_dir (str): A string representing the full path to the top level of
             the PUDL datastore containing the FERC Form 1 data to be used.
-        min_length (int): The minimum number of consecutive printable
         years (list): Range of years to be combined into a single DataFrame.
+        reader (str): How to read the DBF files. See :func:`read_dbf`.
 
     Returns:
         :class:`pandas.DataFrame`: A DataFrame containing several years of FERC
         Form 1 data for the given table.
 
     """
-    dbf_name = pc.ferc1_tbl2dbf[table]
+    return _combine_raw_dfs(
+        table, [read_dbf(table, yr, data_dir, reader=reader) for yr in years],
+        dbc_map)
 
-    raw_dfs = []
-    for yr in years:
-        ferc1_dir = datastore.path(
-            'ferc1', year=yr, file=False, data_dir=data_dir)
-        dbf_path = os.path.join(ferc1_dir, f"{dbf_name}.DBF")
 
-        if os.path.exists(dbf_path):
-            new_df = pd.DataFrame(
-                iter(dbfread.DBF(dbf_path,
-                                 encoding='latin1',
-                                 parserclass=FERC1FieldParser)))
-            raw_dfs = raw_dfs + [new_df, ]
+def _get_raw_dfs_parallel(tables, dbc_map, data_dir, years, workers,
+                          reader='dbfread'):
+    """
+    Read FERC Form 1 DBF tables using a pool of worker processes.
 
-    if raw_dfs:
-        return (
-            pd.concat(raw_dfs, sort=True).
-            drop('_NullFlags', axis=1, errors='ignore').
-            rename(dbc_map[table], axis=1)
-        )
+    Every table-year is parsed in its own task, but the combined dataframes
+    are yielded one table at a time, in the order the tables were given, so
+    that they can all be written to the database by a single connection.
+
+    Args:
+        tables (iterable): Names of the FERC Form 1 tables to read.
+        dbc_map (dict of dicts): A dictionary of dictionaries, of the kind
+            returned by get_dbc_map(), describing the table and column names
+            stored within the FERC Form 1 FoxPro database files.
+        data_dir (str): A string representing the full path to the top level of
+            the PUDL datastore containing the FERC Form 1 data to be used.
+        years (iterable): Years of data to read for each table.
+        workers (int): Number of worker processes to use.
+        reader (str): How to read the DBF files. See :func:`read_dbf`.
+
+    Yields:
+        tuple: The name of each table, and a :class:`pandas.DataFrame` with
+        all years of its data (or None if there was no data).
+
+    """
+    with concurrent.futures.ProcessPoolExecutor(max_workers=workers) as pool:
+        futures = {
+            table: [pool.submit(read_dbf, table, yr, data_dir, reader)
+                    for yr in years]
+            for table in tables
+        }
+        for table in tables:
+            # Let go of each table's records as soon as they're combined.
+            table_futures = futures.pop(table)
+            yield table, _combine_raw_dfs(
+                table, [f.result() for f in table_futures], dbc_map)
+
+
+def _bulk_insert(table, df, dbapi_conn, chunksize=100000,
+                 replace_years=None):
+    """
+    Insert a dataframe into an SQLite table using a single transaction.
+
+    This bypasses pandas and SQLAlchemy, handing plain tuples of Python values
+    straight to the sqlite3 ``executemany`` method, which is much faster than
+    :meth:`pandas.DataFrame.to_sql` for large tables.
+
+    Args:
+        table (str): Name of the table to insert the records into.
+        df (pandas.DataFrame): The records to insert. All of its columns must
+            exist in the table.
+        dbapi_conn (sqlite3.Connection): A raw DBAPI connection to the SQLite
+            database.
+        chunksize (int): Number of records to convert to Python values and
+            insert at a time.
+        replace_years (iterable): If not None, delete any existing records
+            with these report_year values in the same transaction, before
+            inserting the new records.
+
+    Returns:
+        None
+
+    """
+    col_names = ", ".join(f'"{col}"' for col in df.columns)
+    placeholders = ", ".join("?" for _ in df.columns)
+    sql = f'INSERT INTO "{table}" ({col_names}) VALUES ({placeholders})'
+    cursor = dbapi_conn.cursor()
+    try:
+        if replace_years is not None:
+            replace_years = [int(yr) for yr in replace_years]
+            cursor.execute(
+                f'DELETE FROM "{table}" WHERE report_year IN '
+                f'({", ".join("?" for _ in replace_years)})',
+                replace_years)
+        for start in range(0, len(df), chunksize):
+            chunk = df.iloc[start:start + chunksize].astype(object)
+            # sqlite3 can't bind NumPy scalars or NaN, so use Python values.
+            chunk = chunk.where(chunk.notna(), None)
+            cursor.executemany(sql, chunk.itertuples(index=False, name=None))
+        dbapi_conn.commit()
+    except Exception:
+        dbapi_conn.rollback()
+        raise
+    finally:
+        cursor.close()
+
+
+def _load_sqlite_table(table, new_df, sqlite_engine, sqlite_meta,
+                       dbapi_conn=None, replace_years=None):
+    """Write all years of a FERC Form 1 table into the cloned SQLite DB.
+
+    If a raw DBAPI connection is given, the records are bulk loaded through it
+    using :func:`_bulk_insert`. Otherwise :meth:`pandas.DataFrame.to_sql` is
+    used. If ``replace_years`` is given, any existing records for those report
+    years are deleted in the same transaction as the new records are loaded.
+    The f1_respondent_id table has no report_year, and instead relies on its
+    primary key to replace existing respondents.
+
+    """
+    # Because this table has no year in it, existing respondents are replaced
+    # by primary key rather than by year, and there would be multiple
+    # definitions of respondents if we didn't drop duplicates.
+    if table == 'f1_respondent_id':
+        replace_years = None
+        new_df = new_df.drop_duplicates(
+            subset='respondent_id', keep='last')
+    n_recs = len(new_df)
+    logger.debug(f"    {table}: N = {n_recs}")
+    # Only try and load the table if there are some actual records:
+    if n_recs <= 0:
+        return
+
+    # Write the records out to the SQLite database, and make sure that
+    # the inferred data types are being enforced during loading.
+    # if_exists='append' is being used because we defined the tables
+    # above, but left them empty. Becaue the DB is reset at the beginning
+    # of the function, this shouldn't ever result in duplicate records.
+    coltypes = {col.name: col.type for col in sqlite_meta.tables[table].c}
+    logger.info(f"SQLite: loading {n_recs} rows into {table}.")
+    if dbapi_conn is not None:
+        _bulk_insert(table, new_df, dbapi_conn, replace_years=replace_years)
+    else:
+        with sqlite_engine.begin() as conn:
+            if replace_years is not None:
+                sa_table = sqlite_meta.tables[table]
+                conn.execute(sa_table.delete().where(
+                    sa_table.c.report_year.in_(
+                        [int(yr) for yr in replace_years])))
+            new_df.to_sql(table, conn,
+                          if_exists='append', chunksize=100000,
+                          dtype=coltypes, index=False)
+    # add the missing respondents into the respondent_id table.
+    if table == 'f1_respondent_id':
+        logger.debug(f'inserting missing respondents into {table}')
+        sa.insert(sqlite_meta.tables['f1_respondent_id'],
+                  # we can insert info info into any of the columns for this
+                  # table through the following dictionary, but each of the
+                  # records need to have all of the same columns (you can't
+                  # add a column for one respondent without adding it to all).
+                  values=[
+                  {'respondent_id': 514,
+                   'respondent_name': 'AEP, Texas (PUDL determined)'},
+                  {'respondent_id': 515,
+                   'respondent_name': 'respondent_515'},
+                  {'respondent_id': 516,
+                   'respondent_name': 'respondent_516'},
+                  {'respondent_id': 517,
+                   'respondent_name': 'respondent_517'},
+                  {'respondent_id': 518,
+                   'respondent_name': 'respondent_518'},
+                  {'respondent_id': 519,
+                   'respondent_name': 'respondent_519'},
+                  {'respondent_id': 522,
+                   'respondent_name':
+                   'Luning Energy Holdings LLC, Invenergy Investments (PUDL determined)'},
+        ]).execute()
 
 
 def dbf2sqlite(tables, years, refyear, pudl_settings,
-               bad_cols=(), clobber=False):
+               bad_cols=(), clobber=False, workers=1, reader='dbfread',
+               bulk_load=False, update=False,
+               indexes=pc.ferc1_sqlite_indexes):
     """Clone the FERC Form 1 Databsae to SQLite.
 
     Args:
@@ -449,81 +956,117 @@ def dbf2sqlite(tables, years, refyear, pudl_settings,
             indicating columns that should be skipped during the cloning
             process. Both table and column are strings in this case, the
             names of their respective entities within the database metadata.
+        clobber (bool): Whether to replace an existing FERC Form 1 DB.
+        workers (int): Number of worker processes to use for parsing the DBF
+            files. Each table-year is parsed separately, but all of the data
+            is still written to the database by this process. If 1, the
+            tables are read one after another without any worker processes.
+        reader (str): How to read the DBF files. See :func:`read_dbf`.
+        bulk_load (bool): If True, load each table in a single transaction
+            using sqlite3's executemany, with journaling and disk syncing
+            turned off. An interrupted bulk load can leave a corrupt
+            database behind, which will need to be re-created from scratch.
+            When updating an existing database, write-ahead logging is used
+            instead, so that each table is still updated atomically.
+        update (bool): If True, rather than re-creating the database from
+            scratch, load only the given years into the existing database,
+            replacing any records it already has for those years. The schema
+            of the existing database must match the one inferred from
+            ``refyear``. Respondent names are replaced by those found in the
+            loaded years.
+        indexes (dict): FERC Form 1 table names (keys) and iterables of the
+            column names of each index to create on that table (values). The
+            indexes are created after all the data has been loaded. See
+            :data:`pudl.constants.ferc1_sqlite_indexes`.
 
     Returns:
         None
 
     """
-    # Read in the structure of the DB, if it exists
-    logger.info("Dropping the old FERC Form 1 SQLite DB if it exists.")
-    sqlite_engine = sa.create_engine(pudl_settings["ferc1_db"])
-    try:
-        # So that we can wipe it out
-        pudl.helpers.drop_tables(sqlite_engine, clobber=clobber)
-    except sa.exc.OperationalError:
-        pass
-
-    # And start anew
-    sqlite_engine = sa.create_engine(pudl_settings["ferc1_db"])
-    sqlite_meta = sa.MetaData(bind=sqlite_engine)
-
-    # Get the mapping of filenames to table names and fields
-    logger.info(f"Creating a new database schema based on {refyear}.")
-    dbc_map = get_dbc_map(refyear, data_dir=pudl_settings['data_dir'])
-    define_sqlite_db(sqlite_meta, dbc_map, tables=tables,
-                     refyear=refyear, bad_cols=bad_cols,
-                     data_dir=pudl_settings['data_dir'])
-
-    for table in tables:
-        logger.info(f"Pandas: reading {table} into a DataFrame.")
-        new_df = get_raw_df(table, dbc_map, years=years,
+    if workers < 1:
+        raise ValueError(
+            f"workers must be a positive integer, but got {workers}.")
+    if update:
+        sqlite_engine = sa.create_engine(pudl_settings["ferc1_db"])
+        sqlite_meta = sa.MetaData(bind=sqlite_engine)
+        sqlite_meta.reflect()
+        logger.info(
+            f"Checking the existing FERC Form 1 DB schema against {refyear}.")
+        dbc_map = get_dbc_map(refyear, data_dir=pudl_settings['data_dir'])
+        check_sqlite_schema(sqlite_meta, dbc_map, tables=tables,
+                            refyear=refyear, bad_cols=bad_cols,
                             data_dir=pudl_settings['data_dir'])
-        # Because this table has no year in it, there would be multiple
-        # definitions of respondents if we didn't drop duplicates.
-        if table == 'f1_respondent_id':
-            new_df = new_df.drop_duplicates(
-                subset='respondent_id', keep='last')
-        n_recs = len(new_df)
-        logger.debug(f"    {table}: N = {n_recs}")
-        # Only try and load the table if there are some actual records:
-        if n_recs <= 0:
-            continue
+        replace_years = list(years)
+    else:
+        # Read in the structure of the DB, if it exists
+        logger.info("Dropping the old FERC Form 1 SQLite DB if it exists.")
+        sqlite_engine = sa.create_engine(pudl_settings["ferc1_db"])
+        try:
+            # So that we can wipe it out
+            pudl.helpers.drop_tables(sqlite_engine, clobber=clobber)
+        except sa.exc.OperationalError:
+            pass
+
+        # And start anew
+        sqlite_engine = sa.create_engine(pudl_settings["ferc1_db"])
+        sqlite_meta = sa.MetaData(bind=sqlite_engine)
+
+        # Get the mapping of filenames to table names and fields
+        logger.info(f"Creating a new database schema based on {refyear}.")
+        dbc_map = get_dbc_map(refyear, data_dir=pudl_settings['data_dir'])
+        define_sqlite_db(sqlite_meta, dbc_map, tables=tables,
+                         refyear=refyear, bad_cols=bad_cols,
+                         data_dir=pudl_settings['data_dir'])
+        replace_years = None
+
+    if workers == 1:
+        raw_dfs = (
+            (table, get_raw_df(table, dbc_map, years=years,
+                               data_dir=pudl_settings['data_dir'],
+                               reader=reader))
+            for table in tables
+        )
+    else:
+        logger.info(
+            f"Reading FERC Form 1 DBF files using {workers} worker processes.")
+        raw_dfs = _get_raw_dfs_parallel(
+            tables, dbc_map, data_dir=pudl_settings['data_dir'],
+            years=years, workers=workers, reader=reader)
+
+    dbapi_conn = None
+    if bulk_load:
+        dbapi_conn = sqlite_engine.raw_connection()
+        cursor = dbapi_conn.cursor()
+        if update:
+            # Without a journal transactions can't be rolled back, and a
+            # failed update could leave some years half replaced.
+            cursor.execute("PRAGMA journal_mode = WAL")
+            cursor.execute("PRAGMA synchronous = NORMAL")
+        else:
+            cursor.execute("PRAGMA journal_mode = OFF")
+            cursor.execute("PRAGMA synchronous = OFF")
+        cursor.close()
 
-        # Write the records out to the SQLite database, and make sure that
-        # the inferred data types are being enforced during loading.
-        # if_exists='append' is being used because we defined the tables
-        # above, but left them empty. Becaue the DB is reset at the beginning
-        # of the function, this shouldn't ever result in duplicate records.
-        coltypes = {col.name: col.type for col in sqlite_meta.tables[table].c}
-        logger.info(f"SQLite: loading {n_recs} rows into {table}.")
-        new_df.to_sql(table, sqlite_engine,
-                      if_exists='append', chunksize=100000,
-                      dtype=coltypes, index=False)
-        # add the missing respondents into the respondent_id table.
-        if table == 'f1_respondent_id':
-            logger.debug(f'inserting missing respondents into {table}')
-            sa.insert(sqlite_meta.tables['f1_respondent_id'],
-                      # we can insert info info into any of the columns for this
-                      # table through the following dictionary, but each of the
-                      # records need to have all of the same columns (you can't
-                      # add a column for one respondent without adding it to all).
-                      values=[
-                      {'respondent_id': 514,
-                       'respondent_name': 'AEP, Texas (PUDL determined)'},
-                      {'respondent_id': 515,
-                       'respondent_name': 'respondent_515'},
-                      {'respondent_id': 516,
-                       'respondent_name': 'respondent_516'},
-                      {'respondent_id': 517,
-                       'respondent_name': 'respondent_517'},
-                      {'respondent_id': 518,
-                       'respondent_name': 'respondent_518'},
-                      {'respondent_id': 519,
-                       'respondent_name': 'respondent_519'},
-                      {'respondent_id': 522,
-                       'respondent_name':
-                       'Luning Energy Holdings LLC, Invenergy Investments (PUDL determined)'},
-            ]).execute()
+    try:
+        for table, new_df in raw_dfs:
+            logger.info(f"Pandas: read {table} into a DataFrame.")
+            if new_df is None:
+                logger.warning(f"No FERC Form 1 data found for {table}.")
+                continue
+            _load_sqlite_table(table, new_df, sqlite_engine, sqlite_meta,
+                               dbapi_conn=dbapi_conn,
+                               replace_years=replace_years)
+    finally:
+        if dbapi_conn is not None:
+            if update:
+                # Fold the write-ahead log back into the database file.
+                cursor = dbapi_conn.cursor()
+                cursor.execute("PRAGMA journal_mode = DELETE")
+                cursor.close()
+            dbapi_conn.close()
+
+    # Indexes are much faster to build once, after all the data is in.
+    create_sqlite_indexes(sqlite_meta, indexes=indexes)
 
 
 ###########################################################################
@@ -665,12 +1208,14 @@ def fuel(ferc1_meta, ferc1_table, ferc1_years):
     # Grab the f1_fuel SQLAlchemy Table object from the metadata object.
     f1_fuel = ferc1_meta.tables[ferc1_table]
     # Generate a SELECT statement that pulls all fields of the f1_fuel table,
-    # but only gets records with plant names and non-zero fuel amounts:
+    # but only gets records with plant names and non-zero fuel amounts.
+    # Non-empty plant names are selected with a range condition rather than
+    # != '' so that SQLite can use the (report_year, plant_name) index.
     f1_fuel_select = (
         sa.sql.select([f1_fuel])
         .where(f1_fuel.c.fuel != '')
         .where(f1_fuel.c.fuel_quantity > 0)
-        .where(f1_fuel.c.plant_name != '')
+        .where(f1_fuel.c.plant_name > '')
         .where(f1_fuel.c.report_year.in_(ferc1_years))
     )
     # Use the above SELECT to pull those records into a DataFrame:
@@ -700,7 +1245,7 @@ def plants_steam(ferc1_meta, ferc1_table, ferc1_years):
     f1_steam_select = (
         sa.sql.select([f1_steam])
         .where(f1_steam.c.report_year.in_(ferc1_years))
-        .where(f1_steam.c.plant_name != '')
+        .where(f1_steam.c.plant_name > '')
         .where(f1_steam.c.tot_capacity > 0.0)
     )
 
@@ -728,7 +1273,7 @@ def plants_small(ferc1_meta, ferc1_table, ferc1_years):
     f1_small_select = (
         sa.sql.select([f1_small, ])
         .where(f1_small.c.report_year.in_(ferc1_years))
-        .where(f1_small.c.plant_name != '')
+        .where(f1_small.c.plant_name > '')
         .where(or_((f1_small.c.capacity_rating != 0),
                    (f1_small.c.net_demand != 0),
                    (f1_small.c.net_generation != 0),
@@ -762,7 +1307,7 @@ def plants_hydro(ferc1_meta, ferc1_table, ferc1_years):
 
     f1_hydro_select = (
         sa.sql.select([f1_hydro])
-        .where(f1_hydro.c.plant_name != '')
+        .where(f1_hydro.c.plant_name > '')
         .where(f1_hydro.c.report_year.in_(ferc1_years))
     )
 
@@ -790,7 +1335,7 @@ def plants_pumped_storage(ferc1_meta, ferc1_table, ferc1_years):
     # This reduces the entries for 2015 from 272 records to 27.
     f1_pumped_storage_select = (
         sa.sql.select([f1_pumped_storage])
-        .where(f1_pumped_storage.c.plant_name != '')
+        .where(f1_pumped_storage.c.plant_name > '')
         .where(f1_pumped_storage.c.report_year.in_(ferc1_years))
     )
 
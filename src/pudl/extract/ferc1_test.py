@@ -0,0 +1,367 @@
+"""Unit tests for pudl.extract.ferc1 module."""
+import os
+import sqlite3
+import string
+import struct
+import tempfile
+import unittest
+import unittest.mock as mock
+
+import dbfread
+import pandas as pd
+import sqlalchemy as sa
+
+import pudl.constants as pc
+import pudl.extract.ferc1 as ferc1
+
+
+def write_dbf(path, fields, records, deleted=()):
+    """Write a minimal Visual FoxPro style DBF file.
+
+    Args:
+        path (str): Where to write the file.
+        fields (list): (name, type, length, decimal_count) tuples.
+        records (list): Tuples of raw byte strings, one for each field.
+        deleted (iterable): Indices of records to mark as deleted.
+
+    """
+    record_len = 1 + sum(length for _, _, length, _ in fields)
+    header_len = 32 + 32 * len(fields) + 1 + 263
+    with open(path, "wb") as f:
+        f.write(struct.pack(
+            "<BBBBLHH20x", 0x30, 120, 1, 1, len(records), header_len,
+            record_len))
+        address = 1
+        for name, field_type, length, decimal_count in fields:
+            f.write(struct.pack(
+                "<11scLBB14x", name.encode(), field_type.encode(), address,
+                length, decimal_count))
+            address += length
+        f.write(b"\r" + b"\x00" * 263)
+        for i, record in enumerate(records):
+            f.write(b"*" if i in deleted else b" ")
+            for (_, _, length, _), value in zip(fields, record):
+                f.write(value.ljust(length)[:length])
+        f.write(b"\x1a")
+
+
+def write_messy_dbf(path):
+    """Write a small DBF file with some messy FERC-style values."""
+    fields = [
+        ("RESPONDENT", "N", 5, 0),
+        ("NAME", "C", 12, 0),
+        ("AMOUNT", "N", 10, 2),
+        ("REPORT_DT", "D", 8, 0),
+        ("FLAG", "L", 1, 0),
+        ("RATIO", "F", 8, 3),
+    ]
+    records = [
+        (b"   12", b"Utility \xe9", b"  1234.50", b"20180101", b"T",
+         b"   0.125"),
+        (b"00034", b"", b"         .", b"        ", b"F", b"        "),
+        (b"   56", b"Deleted", b"      1.00", b"20180102", b"?",
+         b"   1.000"),
+        (b"    0", b"Zeroes\x00\x00", b"*******\x00\x00\x00",
+         b"20180102", b" ", b"  ******"),
+        (b"   78", b"Comma", b"     0,5", b"20181231", b"y", b"  -2.000"),
+    ]
+    write_dbf(path, fields, records, deleted={2})
+
+
+class TestReadDbfNumpy(unittest.TestCase):
+    """Tests that the vectorized DBF reader matches dbfread."""
+
+    def setUp(self):
+        """Writes a small DBF file with some messy FERC-style values."""
+        self._dir = tempfile.TemporaryDirectory()
+        self.dbf_path = os.path.join(self._dir.name, "F1_TEST.DBF")
+        write_messy_dbf(self.dbf_path)
+
+    def tearDown(self):
+        """Removes the test DBF file."""
+        self._dir.cleanup()
+
+    def test_matches_dbfread(self):
+        """The numpy and dbfread readers produce the same dataframe."""
+        expected = pd.DataFrame(iter(dbfread.DBF(
+            self.dbf_path, encoding="latin1",
+            parserclass=ferc1.FERC1FieldParser)))
+        actual = ferc1.read_dbf_numpy(self.dbf_path, encoding="latin1")
+        self.assertEqual(4, len(actual))
+        pd.testing.assert_frame_equal(expected, actual)
+
+
+class TestBulkInsert(unittest.TestCase):
+    """Tests that the bulk load path matches the to_sql path."""
+
+    def setUp(self):
+        """Reads a messy DBF file and defines a table for its records."""
+        self._dir = tempfile.TemporaryDirectory()
+        dbf_path = os.path.join(self._dir.name, "F1_TEST.DBF")
+        write_messy_dbf(dbf_path)
+        dbf = dbfread.DBF(dbf_path, encoding="latin1",
+                          parserclass=ferc1.FERC1FieldParser)
+        self.df = pd.DataFrame(iter(dbf))
+        self.columns = []
+        for field in dbf.fields:
+            col_type = pc.dbf_typemap[field.type]
+            if col_type == sa.String:
+                col_type = sa.String(length=field.length)
+            self.columns.append((field.name, col_type))
+
+    def tearDown(self):
+        """Removes the test DBF file and databases."""
+        self._dir.cleanup()
+
+    def _load(self, name, bulk_load):
+        """Loads the records twice, replacing them the second time."""
+        db_path = os.path.join(self._dir.name, f"{name}.sqlite")
+        engine = sa.create_engine(f"sqlite:///{db_path}")
+        meta = sa.MetaData(bind=engine)
+        sa.Table("f1_test", meta, sa.Column("report_year", sa.Integer),
+                 *[sa.Column(name, col_type)
+                   for name, col_type in self.columns])
+        meta.create_all()
+        df = self.df.assign(report_year=2018)
+        dbapi_conn = engine.raw_connection() if bulk_load else None
+        try:
+            for replace_years in (None, [2018]):
+                ferc1._load_sqlite_table(
+                    "f1_test", df, engine, meta, dbapi_conn=dbapi_conn,
+                    replace_years=replace_years)
+        finally:
+            if dbapi_conn is not None:
+                dbapi_conn.close()
+        select = ", ".join(
+            f'"{col}", typeof("{col}")' for col in df.columns)
+        with sqlite3.connect(db_path) as conn:
+            return conn.execute(
+                f'SELECT {select} FROM f1_test ORDER BY rowid').fetchall()
+
+    def test_same_as_to_sql(self):
+        """Both paths store the same values, with the same SQLite types."""
+        expected = self._load("to_sql", bulk_load=False)
+        self.assertEqual(4, len(expected))
+        self.assertEqual(expected, self._load("bulk", bulk_load=True))
+
+
+def _get_strings_reference(filename, min_length=4):
+    """Yields printable strings a character at a time, like the old code."""
+    with open(filename, errors="ignore") as f:
+        result = ""
+        for c in f.read():
+            if c in string.printable:
+                result += c
+                continue
+            if len(result) >= min_length:
+                yield result
+            result = ""
+        if len(result) >= min_length:
+            yield result
+
+
+class TestGetStrings(unittest.TestCase):
+    """Tests that the strings are found as the Unix strings command would."""
+
+    def setUp(self):
+        """Creates a temporary directory for the DBC files."""
+        self._dir = tempfile.TemporaryDirectory()
+        self.path = os.path.join(self._dir.name, "F1_PUB.DBC")
+
+    def tearDown(self):
+        """Removes the temporary directory."""
+        self._dir.cleanup()
+
+    def _write(self, data):
+        with open(self.path, "wb") as f:
+            f.write(data)
+        return self.path
+
+    def _get_strings(self, data, min_length=4):
+        return list(ferc1.get_strings(self._write(data), min_length))
+
+    def test_undecodable_bytes_are_dropped(self):
+        """Printable runs either side of undecodable bytes are joined."""
+        self.assertEqual(
+            ["Table f1_fuelField abc"],
+            self._get_strings(b"\x00Table f1_fuel\xffField abc\x00"))
+
+    def test_same_as_reference(self):
+        """The regex matches the old character by character scanner."""
+        data = (
+            b"\x00\x01Table f1_fuel\x00\x00Field respondent_id\x03\x00"
+            b"Field  report_year\r\n\xc3\xa9\x8fField fuel\x00abc\x00"
+            b"Table\tf1_steam\xe2\x82Field \x7fplant_name\x1a\x00\x00ab"
+            b"\xf0\x9f\x98\x80Field x\rTable f1_end"
+        )
+        for min_length in (1, 4, 10):
+            self.assertEqual(
+                list(_get_strings_reference(self._write(data), min_length)),
+                self._get_strings(data, min_length=min_length))
+
+
+class TestGetDbcMap(unittest.TestCase):
+    """Tests the on-disk cache of inferred DBC maps."""
+
+    def setUp(self):
+        """Writes a DBC file and a DBF file for a single FERC table."""
+        self._dir = tempfile.TemporaryDirectory()
+        self.dbc_path = os.path.join(self._dir.name, "F1_PUB.DBC")
+        with open(self.dbc_path, "wb") as f:
+            f.write(b"\x00Table f1_fuel\x00Field respondent_id\x00"
+                    b"Field report_year\x00\x00")
+        dbf_path = os.path.join(self._dir.name, "F1_31.DBF")
+        write_dbf(dbf_path, [("RESPONDENT", "N", 5, 0),
+                             ("REPORT_YEA", "N", 4, 0)], [])
+        patches = [
+            mock.patch.object(
+                ferc1, "dbc_filename", lambda year, data_dir: self.dbc_path),
+            mock.patch.object(
+                ferc1, "get_dbf_path",
+                lambda table, year, data_dir: (
+                    dbf_path if table == "f1_fuel" else self.dbc_path + "x")),
+            mock.patch.object(ferc1, "get_strings", wraps=ferc1.get_strings),
+        ]
+        for patch in patches:
+            patch.start()
+            self.addCleanup(patch.stop)
+
+    def tearDown(self):
+        """Removes the test files and the cache."""
+        self._dir.cleanup()
+
+    def _get_dbc_map(self, **kwargs):
+        return ferc1.get_dbc_map(2018, self._dir.name, **kwargs)
+
+    def test_cache_hit(self):
+        """A second call reads the DBC map from the cache."""
+        expected = {"f1_fuel": {"RESPONDENT": "respondent_id",
+                                "REPORT_YEA": "report_year"}}
+        self.assertEqual(expected, self._get_dbc_map())
+        self.assertEqual(expected, self._get_dbc_map())
+        self.assertEqual(1, ferc1.get_strings.call_count)
+        self.assertEqual(expected, self._get_dbc_map(use_cache=False))
+        self.assertEqual(2, ferc1.get_strings.call_count)
+
+    def test_changed_dbc_file(self):
+        """A changed DBC file is parsed again."""
+        self._get_dbc_map()
+        with open(self.dbc_path, "ab") as f:
+            f.write(b"\x00")
+        self._get_dbc_map()
+        self.assertEqual(2, ferc1.get_strings.call_count)
+
+    def test_changed_pudl_version(self):
+        """Maps cached by another version of PUDL are ignored."""
+        self._get_dbc_map()
+        with mock.patch.object(ferc1.pudl, "__version__", "0.0.0"):
+            self._get_dbc_map()
+        self.assertEqual(2, ferc1.get_strings.call_count)
+
+
+class TestDbf2SqliteUpdate(unittest.TestCase):
+    """Tests replacing and adding years of data in an existing clone."""
+
+    def setUp(self):
+        """Writes a few years of respondent and fuel DBF files."""
+        self._dir = tempfile.TemporaryDirectory()
+        self.data_dir = self._dir.name
+        self.pudl_settings = {
+            "data_dir": self.data_dir,
+            "ferc1_db": "sqlite:///" + os.path.join(
+                self.data_dir, "ferc1.sqlite"),
+        }
+        # Number of fuel records for each respondent, by year.
+        self._write_year(2016, {1: "Alpha", 2: "Beta"}, {1: 2, 2: 1})
+        self._write_year(2017, {1: "Alpha", 2: "Beta"}, {1: 3, 2: 3})
+        patch = mock.patch.object(
+            ferc1.datastore, "path",
+            lambda dataset, year, file, data_dir: os.path.join(
+                data_dir, str(year)))
+        patch.start()
+        self.addCleanup(patch.stop)
+
+    def tearDown(self):
+        """Removes the DBF files and the database."""
+        self._dir.cleanup()
+
+    def _write_year(self, year, respondents, n_fuel, extra_field=False):
+        """Writes the DBC and DBF files for a single year."""
+        year_dir = os.path.join(self.data_dir, str(year))
+        os.makedirs(year_dir, exist_ok=True)
+        dbc = (b"\x00Table f1_respondent_id\x00Field respondent_id\x00"
+               b"Field respondent_name\x00Table f1_fuel\x00"
+               b"Field respondent_id\x00Field report_year\x00"
+               b"Field fuel_quantity\x00")
+        fuel_fields = [("RESPONDENT", "N", 5, 0), ("REPORT_YEA", "N", 4, 0),
+                       ("FUEL_QUANT", "N", 10, 2)]
+        if extra_field:
+            dbc += b"Field fuel_unit\x00"
+            fuel_fields.append(("FUEL_UNIT", "C", 8, 0))
+        with open(os.path.join(year_dir, "F1_PUB.DBC"), "wb") as f:
+            f.write(dbc)
+        write_dbf(
+            os.path.join(year_dir, "F1_1.DBF"),
+            [("RESPONDENT", "N", 5, 0), ("RESPONDEN2", "C", 20, 0)],
+            [(b"%5d" % resp_id, name.encode())
+             for resp_id, name in respondents.items()])
+        fuel_records = []
+        for resp_id, n_recs in n_fuel.items():
+            for i in range(n_recs):
+                record = [b"%5d" % resp_id, b"%4d" % year,
+                          b"%10.2f" % (year + i / 4)]
+                fuel_records.append(record + [b"tons"] * extra_field)
+        write_dbf(os.path.join(year_dir, "F1_31.DBF"), fuel_fields,
+                  fuel_records)
+
+    def _dbf2sqlite(self, years, refyear, **kwargs):
+        ferc1.dbf2sqlite(
+            tables=["f1_respondent_id", "f1_fuel"], years=years,
+            refyear=refyear, pudl_settings=self.pudl_settings, indexes={},
+            **kwargs)
+
+    def _query(self, sql):
+        with sqlite3.connect(
+                os.path.join(self.data_dir, "ferc1.sqlite")) as conn:
+            return conn.execute(sql).fetchall()
+
+    def test_update(self):
+        """Replaced years have only their new records, others are kept."""
+        for bulk_load in (True, False):
+            with self.subTest(bulk_load=bulk_load):
+                self._dbf2sqlite([2016, 2017], 2017, bulk_load=bulk_load,
+                                 clobber=True)
+                self._write_year(2017, {1: "Alpha", 3: "Gamma"}, {1: 1, 3: 2})
+                self._write_year(2018, {1: "Alpha Two", 3: "Gamma"}, {3: 4})
+                self._dbf2sqlite([2017, 2018], 2018, bulk_load=bulk_load,
+                                 update=True)
+                self.assertEqual(
+                    [(2016, 1, 2), (2016, 2, 1), (2017, 1, 1), (2017, 3, 2),
+                     (2018, 3, 4)],
+                    self._query(
+                        "SELECT report_year, respondent_id, COUNT(*) "
+                        "FROM f1_fuel GROUP BY report_year, respondent_id "
+                        "ORDER BY report_year, respondent_id"))
+                self.assertEqual(
+                    [(2018.0,), (2018.25,), (2018.5,), (2018.75,)],
+                    self._query("SELECT fuel_quantity FROM f1_fuel "
+                                "WHERE report_year = 2018 ORDER BY 1"))
+                # Respondents which no longer report are kept, and the names of
+                # the others are the most recently loaded ones.
+                self.assertEqual(
+                    [(1, "Alpha Two"), (2, "Beta"), (3, "Gamma")],
+                    self._query("SELECT respondent_id, respondent_name "
+                                "FROM f1_respondent_id "
+                                "WHERE respondent_id < 500 ORDER BY 1"))
+                self._write_year(2017, {1: "Alpha", 2: "Beta"}, {1: 3, 2: 3})
+
+    def test_mismatched_schema(self):
+        """Years with different columns can't be loaded into the clone."""
+        self._dbf2sqlite([2016, 2017], 2017)
+        self._write_year(2019, {1: "Alpha"}, {1: 1}, extra_field=True)
+        with self.assertRaisesRegex(ValueError, "f1_fuel"):
+            self._dbf2sqlite([2019], 2019, update=True)
+        self.assertEqual(
+            [(2016, 3), (2017, 6)],
+            self._query("SELECT report_year, COUNT(*) FROM f1_fuel "
+                        "GROUP BY report_year ORDER BY 1"))
@@ -136,6 +136,8 @@ def get_db_plants_ferc1(pudl_settings, years):
     # iterating over the tables that contain "plants" and grabbing those
     # columns (along with their capacity, since that's useful for matching
     # purposes)
+    # Non-empty plant names are selected with a range condition rather than
+    # != '' so that SQLite can use the indexes on these tables.
     all_plants = pd.DataFrame()
     for tbl in plant_tables:
         plant_select = sa.sql.select([
@@ -146,7 +148,7 @@ def get_db_plants_ferc1(pudl_settings, years):
         ]).distinct().where(
             sa.and_(
                 ferc1_tables[tbl].c.respondent_id == respondent_table.c.respondent_id,
-                ferc1_tables[tbl].c.plant_name != '',
+                ferc1_tables[tbl].c.plant_name > '',
                 ferc1_tables[tbl].c.report_year.in_(years)
             )
         )
@@ -116,7 +116,8 @@ def csv_dump(df, resource_name, keep_index, datapkg_dir):
     Set :func:`pandas.DataFrame.to_csv` arguments appropriately depending on
     what data source we're writing out, and then write it out. In practice
     this means adding a .csv to the end of the resource name, and then, if it's
-    part of epacems, adding a .gz after that.
+    part of epacems, adding a .gz after that. EPA CEMS data is appended to any
+    existing file, so that it can be written out in several chunks.
 
     Args:
         df (pandas.DataFrame): The DataFrame to be dumped to CSV.
@@ -143,6 +144,9 @@ def csv_dump(df, resource_name, keep_index, datapkg_dir):
             args["path_or_buf"].name + ".gz")
         args["mode"] = "a"
         args["date_format"] = '%Y-%m-%dT%H:%M:%SZ'
+        # EPA CEMS may be written out in several chunks, all of which get
+        # appended to the same file, so only the first one gets a header.
+        args["header"] = not args["path_or_buf"].exists()
 
     if keep_index:
         args["index_label"] = "id"
@@ -0,0 +1,238 @@
+"""Functions for loading processed PUDL data tables into Apache Parquet files.
+
+The EPA CEMS hourly data is much too large to work with comfortably as a
+collection of gzipped CSV files, and is usually converted to a Parquet dataset
+partitioned by year and state (see :mod:`pudl.convert.epacems_to_parquet`).
+Rather than writing out CSVs during the ETL and then reading them back in again
+to do that conversion, the functions in this module take the transformed CEMS
+dataframes and write them directly into the partitioned Parquet dataset.
+
+Daily and monthly rollups of the hourly data (see
+:func:`pudl.transform.epacems.rollup`) are written into their own, much
+smaller, Parquet datasets with the same partitioning.
+
+Alongside the dataset we keep a manifest recording the inputs each state-year
+partition was generated from, so that unchanged partitions can be skipped when
+the ETL is re-run incrementally.
+
+"""
+
+import json
+import logging
+import os
+import pathlib
+import shutil
+
+import pyarrow as pa
+import pyarrow.parquet as pq
+
+import pudl
+
+logger = logging.getLogger(__name__)
+
+
+def dict_dump(transformed_dfs, data_source, root_path,
+              compression='snappy', partition_cols=('year', 'state')):
+    """
+    Wrapper for epacems_dump that takes a dictionary of EPA CEMS DataFrames.
+
+    Args:
+        transformed_dfs (dict): A dictionary of transformed EPA CEMS
+            DataFrames, as yielded by :func:`pudl.transform.epacems.transform`.
+            The keys must have the form "hourly_emissions_epacems_YEAR_STATE".
+        data_source (str): The name of the data source we are working with
+            (only used for logging).
+        root_path (path-like): The root directory of the Parquet dataset.
+        compression (str): Compression algorithm to use for the Parquet
+            files, e.g. 'snappy' or 'gzip'.
+        partition_cols (tuple): Columns to partition the dataset by.
+
+    Returns:
+        None
+
+    """
+    for resource_name, df in transformed_dfs.items():
+        logger.info(
+            f"Loading {data_source} {resource_name} dataframe into Parquet")
+        year = int(resource_name.split("_")[-2])
+        epacems_dump(df, year=year, root_path=root_path,
+                     compression=compression, partition_cols=partition_cols)
+
+
+def epacems_dump(df, year, root_path,
+                 compression='snappy', partition_cols=('year', 'state'),
+                 row_group_size=None, use_dictionary=True):
+    """
+    Write a transformed EPA CEMS dataframe into a partitioned Parquet dataset.
+
+    The dataframe is cast to the compact data types defined by
+    :func:`pudl.convert.epacems_to_parquet.create_in_dtypes` and written using
+    the explicit Arrow schema from
+    :func:`pudl.convert.epacems_to_parquet.create_cems_schema`, so the output
+    is identical to that produced by converting the CSV outputs.
+
+    Args:
+        df (pandas.DataFrame): A transformed EPA CEMS dataframe.
+        year (int): The year the data pertains to. CEMS years are based on
+            local plant time rather than operating_datetime_utc, so this can't
+            be inferred from the data.
+        root_path (path-like): The root directory of the Parquet dataset.
+        compression (str): Compression algorithm to use for the Parquet
+            files, e.g. 'snappy' or 'gzip'.
+        partition_cols (tuple): Columns to partition the dataset by.
+        row_group_size (int): Maximum number of records in each Parquet row
+            group. Smaller row groups allow more selective reads, at the cost
+            of larger files. If None, use the pyarrow default.
+        use_dictionary (bool): Whether to dictionary encode the columns.
+
+    Returns:
+        None
+
+    """
+    in_dtypes = pudl.convert.epacems_to_parquet.create_in_dtypes()
+    df = (
+        df.astype({col: dtype for col, dtype in in_dtypes.items()
+                   if col in df.columns})
+        .assign(year=year)
+    )
+    pq.write_to_dataset(
+        pa.Table.from_pandas(
+            df, preserve_index=False,
+            schema=pudl.convert.epacems_to_parquet.create_cems_schema()),
+        root_path=str(root_path), partition_cols=list(partition_cols),
+        compression=compression, row_group_size=row_group_size,
+        use_dictionary=use_dictionary)
+
+
+def epacems_rollup_path(parquet_dir, freq, level):
+    """Root directory of an EPA CEMS rollup Parquet dataset.
+
+    Args:
+        parquet_dir (path-like): The PUDL workspace's Parquet directory.
+        freq (str): The rollup frequency, e.g. "daily" or "monthly".
+        level (str): The rollup level, e.g. "unit" or "plant".
+
+    Returns:
+        pathlib.Path: The root directory of the rollup dataset.
+
+    """
+    return pathlib.Path(parquet_dir, "epacems_rollups", f"{freq}_{level}")
+
+
+def epacems_rollup_dump(df, year, root_path, compression='snappy',
+                        partition_cols=('year', 'state')):
+    """
+    Write a rolled up EPA CEMS dataframe into a partitioned Parquet dataset.
+
+    Args:
+        df (pandas.DataFrame): Rolled up EPA CEMS records, as returned by
+            :func:`pudl.transform.epacems.rollup`.
+        year (int): The year of the state-year partition the records were
+            aggregated from.
+        root_path (path-like): The root directory of the rollup dataset.
+        compression (str): Compression algorithm to use for the Parquet
+            files, e.g. 'snappy' or 'gzip'.
+        partition_cols (tuple): Columns to partition the dataset by.
+
+    Returns:
+        None
+
+    """
+    # Categories differ between chunks and state-years, so store plain
+    # strings to keep the schemas of all the files in the dataset the same.
+    df = df.astype({col: str for col in ("state", "unitid")
+                    if col in df.columns}).assign(year=year)
+    table = pa.Table.from_pandas(df, preserve_index=False)
+    # Use the same timestamp type as the hourly dataset.
+    date_idx = table.schema.get_field_index("operating_date_utc")
+    table = table.set_column(
+        date_idx,
+        pa.field("operating_date_utc", pa.timestamp("ms", tz="utc")),
+        table.column(date_idx).cast(pa.timestamp("ms", tz="utc")))
+    pq.write_to_dataset(
+        table, root_path=str(root_path), partition_cols=list(partition_cols),
+        compression=compression)
+
+
+def remove_epacems_partition(root_path, year, state):
+    """
+    Remove any previously written Parquet files for a single state-year.
+
+    Parquet datasets are appended to, rather than overwritten, so re-running
+    the ETL for a given state-year needs to clear out the old files first.
+
+    Args:
+        root_path (path-like): The root directory of the Parquet dataset.
+        year (int): The year of the partition to remove.
+        state (str): The 2-letter US state code of the partition to remove.
+
+    Returns:
+        None
+
+    """
+    partition_dir = pathlib.Path(
+        root_path, f"year={year}", f"state={state.upper()}")
+    if partition_dir.exists():
+        logger.info(f"Removing existing EPA CEMS partition {partition_dir}")
+        shutil.rmtree(partition_dir)
+
+
+def epacems_manifest_path(root_path):
+    """Path to the EPA CEMS partition manifest within a Parquet dataset.
+
+    The leading underscore ensures Parquet readers ignore the file when
+    reading the dataset.
+
+    """
+    return pathlib.Path(root_path, "_epacems_manifest.json")
+
+
+def read_epacems_manifest(root_path):
+    """
+    Read the EPA CEMS partition manifest, if there is one.
+
+    Args:
+        root_path (path-like): The root directory of the Parquet dataset.
+
+    Returns:
+        dict: Partition keys of the form "YEAR-STATE" (keys) and the
+        fingerprints of the inputs they were generated from (values). Empty if
+        no manifest exists yet.
+
+    """
+    manifest_path = epacems_manifest_path(root_path)
+    if not manifest_path.exists():
+        return {}
+    with manifest_path.open() as f:
+        return json.load(f)
+
+
+def write_epacems_manifest(manifest, root_path):
+    """
+    Write out the EPA CEMS partition manifest.
+
+    The manifest is written to a temporary file which then replaces the old
+    one, so an interrupted ETL run never leaves a truncated manifest behind.
+
+    Args:
+        manifest (dict): Partition keys of the form "YEAR-STATE" (keys) and
+            the fingerprints of the inputs they were generated from (values).
+        root_path (path-like): The root directory of the Parquet dataset.
+
+    Returns:
+        None
+
+    """
+    manifest_path = epacems_manifest_path(root_path)
+    manifest_path.parent.mkdir(parents=True, exist_ok=True)
+    tmp_path = manifest_path.with_suffix(".json.tmp")
+    with tmp_path.open("w") as f:
+        json.dump(manifest, f, indent=2, sort_keys=True)
+    os.replace(tmp_path, manifest_path)
+
+
+def epacems_partition_exists(root_path, year, state):
+    """Whether any Parquet files have been written for a state-year."""
+    partition_dir = pathlib.Path(
+        root_path, f"year={year}", f"state={state.upper()}")
+    return partition_dir.is_dir() and any(partition_dir.iterdir())
@@ -0,0 +1,207 @@
+"""Functions for reading the EPA CEMS hourly data out of its Parquet dataset.
+
+The EPA CEMS hourly emissions data is too large to load into memory all at
+once, so rather than living in the PUDL DB it is stored as an Apache Parquet
+dataset, partitioned by year and state (see
+:mod:`pudl.convert.epacems_to_parquet` and :mod:`pudl.load.parquet`). The
+functions in this module read selected subsets of that dataset, using the
+partitioning to skip entire state-years, only reading the requested columns,
+and using the per row-group statistics stored in the Parquet files to skip
+chunks of records which can't match the requested plants or time window.
+
+The daily and monthly rollups of the hourly data, which are written out by the
+ETL alongside the hourly dataset, can be read in the same way.
+
+"""
+
+import logging
+import pathlib
+
+import pandas as pd
+import pyarrow as pa
+import pyarrow.dataset as ds
+
+import pudl
+
+logger = logging.getLogger(__name__)
+
+
+def _to_utc(timestamp):
+    """Convert a date-like value to a UTC timestamp, assuming naive is UTC."""
+    timestamp = pd.Timestamp(timestamp)
+    if timestamp.tzinfo is None:
+        return timestamp.tz_localize("UTC")
+    return timestamp.tz_convert("UTC")
+
+
+def _epacems_filter(years=None, states=None, plant_ids=None,
+                    start_date=None, end_date=None,
+                    datetime_col="operating_datetime_utc"):
+    """
+    Construct a dataset filter expression for selecting EPA CEMS records.
+
+    Args:
+        years (iterable): Years of data to select. Note that CEMS years are
+            based on local plant time.
+        states (iterable): 2-letter US state codes to select.
+        plant_ids (iterable): EIA plant IDs to select.
+        start_date (date-like): Select records with an operating_datetime_utc
+            on or after this time, which is interpreted as UTC.
+        end_date (date-like): Select records with an operating_datetime_utc
+            on or before this time, which is interpreted as UTC.
+        datetime_col (str): The name of the UTC timestamp column to compare
+            the start and end dates to.
+
+    Returns:
+        pyarrow.dataset.Expression: The filter, or None if no constraints
+        were given.
+
+    """
+    timestamp_type = pa.timestamp("ms", tz="utc")
+    conditions = []
+    if years is not None:
+        conditions.append(ds.field("year").isin([int(y) for y in years]))
+    if states is not None:
+        conditions.append(
+            ds.field("state").isin([s.upper() for s in states]))
+    if plant_ids is not None:
+        conditions.append(
+            ds.field("plant_id_eia").isin([int(p) for p in plant_ids]))
+    # The year partitions are based on local plant time, which is always
+    # within a day of UTC, so we can also use the time window to prune years.
+    if start_date is not None:
+        start_date = _to_utc(start_date)
+        conditions.append(ds.field("year") >= (start_date.year - 1))
+        conditions.append(
+            ds.field(datetime_col) >=
+            pa.scalar(start_date, type=timestamp_type))
+    if end_date is not None:
+        end_date = _to_utc(end_date)
+        conditions.append(ds.field("year") <= (end_date.year + 1))
+        conditions.append(
+            ds.field(datetime_col) <=
+            pa.scalar(end_date, type=timestamp_type))
+
+    expression = None
+    for condition in conditions:
+        expression = (condition if expression is None
+                      else expression & condition)
+    return expression
+
+
+def epacems(years=None, states=None, plant_ids=None, columns=None,
+            start_date=None, end_date=None, epacems_path=None,
+            as_arrow=False):
+    """
+    Read a subset of the EPA CEMS hourly emissions Parquet dataset.
+
+    Only the year/state partitions which could contain the requested records
+    are read, only the requested columns are decoded, and row-groups whose
+    statistics rule out the requested plants or time window are skipped.
+
+    Args:
+        years (iterable): Years of data to read. If None, read all years.
+            Note that CEMS years are based on local plant time, so they may
+            differ from the year of operating_datetime_utc by a few hours.
+        states (iterable): 2-letter US state codes of the data to read. If
+            None, read all states.
+        plant_ids (iterable): EIA plant IDs to read. If None, read all plants.
+        columns (iterable): Names of the columns to read. If None, read all
+            columns, including the year and state partition columns.
+        start_date (date-like): Only read records with operating_datetime_utc
+            on or after this time. Naive times are interpreted as UTC.
+        end_date (date-like): Only read records with operating_datetime_utc
+            on or before this time. Naive times are interpreted as UTC.
+        epacems_path (path-like): The root directory of the EPA CEMS Parquet
+            dataset. If None, use the ``parquet/epacems`` directory in the
+            default PUDL workspace.
+        as_arrow (bool): If True, return a :class:`pyarrow.Table` rather than
+            a :class:`pandas.DataFrame`.
+
+    Returns:
+        pandas.DataFrame or pyarrow.Table: The selected EPA CEMS records.
+
+    """
+    if epacems_path is None:
+        epacems_path = pathlib.Path(
+            pudl.workspace.setup.get_defaults()["parquet_dir"], "epacems")
+    dataset = ds.dataset(
+        str(epacems_path), format="parquet", partitioning="hive")
+    table = dataset.to_table(
+        columns=None if columns is None else list(columns),
+        filter=_epacems_filter(
+            years=years, states=states, plant_ids=plant_ids,
+            start_date=start_date, end_date=end_date),
+    )
+    logger.info(f"Read {table.num_rows} EPA CEMS records.")
+    if as_arrow:
+        return table
+    return table.to_pandas()
+
+
+def epacems_rollup(freq="monthly", level="plant", years=None, states=None,
+                   plant_ids=None, start_date=None, end_date=None,
+                   parquet_dir=None):
+    """
+    Read daily or monthly EPA CEMS totals by unit or plant.
+
+    The rollups are written by the ETL as partial sums for each chunk of each
+    state-year, and the hours at the start of a UTC day or month may fall in
+    the previous local-time year, so the partial sums for each period are
+    added together after they are read.
+
+    Args:
+        freq (str): Either "daily" or "monthly".
+        level (str): Either "unit" or "plant".
+        years (iterable): Years of data to read. If None, read all years.
+            Note that CEMS years are based on local plant time, so a period
+            at the start of a year is only complete if the previous year is
+            also read.
+        states (iterable): 2-letter US state codes of the data to read. If
+            None, read all states.
+        plant_ids (iterable): EIA plant IDs to read. If None, read all plants.
+        start_date (date-like): Only read periods which start on or after
+            this time. Naive times are interpreted as UTC.
+        end_date (date-like): Only read periods which start on or before this
+            time. Naive times are interpreted as UTC.
+        parquet_dir (path-like): The directory containing the EPA CEMS rollup
+            datasets. If None, use the ``parquet`` directory in the default
+            PUDL workspace.
+
+    Returns:
+        pandas.DataFrame: One record for each state, plant (and unit), and
+        period, with an operating_date_utc column giving the start of the
+        period, and the totals listed in
+        :data:`pudl.constants.epacems_rollup_columns`.
+
+    """
+    if freq not in pudl.constants.epacems_rollup_freqs:
+        raise ValueError(
+            f"Unrecognized EPA CEMS rollup frequency: {freq}. Valid "
+            f"frequencies are {list(pudl.constants.epacems_rollup_freqs)}.")
+    if level not in pudl.constants.epacems_rollup_levels:
+        raise ValueError(
+            f"Unrecognized EPA CEMS rollup level: {level}. Valid levels are "
+            f"{list(pudl.constants.epacems_rollup_levels)}.")
+    if parquet_dir is None:
+        parquet_dir = pudl.workspace.setup.get_defaults()["parquet_dir"]
+    rollup_path = pudl.load.parquet.epacems_rollup_path(
+        parquet_dir, freq, level)
+    dataset = ds.dataset(
+        str(rollup_path), format="parquet", partitioning="hive")
+    df = dataset.to_table(
+        filter=_epacems_filter(
+            years=years, states=states, plant_ids=plant_ids,
+            start_date=start_date, end_date=end_date,
+            datetime_col="operating_date_utc"),
+    ).to_pandas()
+    by = ["state", *pudl.constants.epacems_rollup_levels[level],
+          "operating_date_utc"]
+    df = (
+        df.astype({"state": str})
+        .groupby(by, sort=True)[list(pudl.constants.epacems_rollup_columns)]
+        .sum()
+        .reset_index()
+    )
+    logger.info(f"Read {len(df)} {freq} {level} EPA CEMS records.")
+    return df
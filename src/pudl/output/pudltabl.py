@@ -482,6 +482,83 @@ class PudlTabl(object):
                 self.pudl_engine)
         return self._dfs['plant_in_service_ferc1']
 
+    ###########################################################################
+    # EPA CEMS OUTPUTS
+    ###########################################################################
+    def epacems(self, states=None, years=None, plant_ids=None, columns=None,
+                epacems_path=None, as_arrow=False):
+        """
+        Read hourly EPA CEMS records from the Parquet dataset.
+
+        Only records with an operating_datetime_utc between the start and end
+        dates of this object are read. Unlike the other outputs, the result
+        is not cached, since it depends on the selection arguments. See
+        :func:`pudl.output.epacems.epacems` for details.
+
+        Args:
+            states (iterable): 2-letter US state codes of the data to read. If
+                None, read all states.
+            years (iterable): Years of data to read. If None, read all years
+                which fall within the start and end dates.
+            plant_ids (iterable): EIA plant IDs to read. If None, read all
+                plants.
+            columns (iterable): Names of the columns to read. If None, read
+                all columns.
+            epacems_path (path-like): The root directory of the EPA CEMS
+                Parquet dataset. If None, use the default PUDL workspace.
+            as_arrow (bool): If True, return a :class:`pyarrow.Table` rather
+                than a :class:`pandas.DataFrame`.
+
+        Returns:
+            pandas.DataFrame or pyarrow.Table: The selected EPA CEMS records.
+
+        """
+        return pudl.output.epacems.epacems(
+            years=years,
+            states=states,
+            plant_ids=plant_ids,
+            columns=columns,
+            start_date=self.start_date,
+            # CEMS data is hourly, so this includes all of the last day.
+            end_date=self.end_date + pd.Timedelta(hours=23),
+            epacems_path=epacems_path,
+            as_arrow=as_arrow)
+
+    def epacems_rollup(self, freq="monthly", level="plant", states=None,
+                       years=None, plant_ids=None, parquet_dir=None):
+        """
+        Read daily or monthly EPA CEMS totals by unit or plant.
+
+        Only periods starting between the start and end dates of this object
+        are read. The result is not cached. See
+        :func:`pudl.output.epacems.epacems_rollup` for details.
+
+        Args:
+            freq (str): Either "daily" or "monthly".
+            level (str): Either "unit" or "plant".
+            states (iterable): 2-letter US state codes of the data to read. If
+                None, read all states.
+            years (iterable): Years of data to read. If None, read all years
+                which fall within the start and end dates.
+            plant_ids (iterable): EIA plant IDs to read. If None, read all
+                plants.
+            parquet_dir (path-like): The directory containing the EPA CEMS
+                rollup datasets. If None, use the default PUDL workspace.
+
+        Returns:
+            pandas.DataFrame: The selected EPA CEMS totals.
+
+        """
+        return pudl.output.epacems.epacems_rollup(
+            freq=freq,
+            level=level,
+            years=years,
+            states=states,
+            plant_ids=plant_ids,
+            start_date=self.start_date,
+            end_date=self.end_date,
+            parquet_dir=parquet_dir)
+
     ###########################################################################
     # EIA MCOE OUTPUTS
     ###########################################################################
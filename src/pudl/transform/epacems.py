@@ -17,10 +17,46 @@ logger = logging.getLogger(__name__)
 ###############################################################################
 
 
+def _utc_offset_lookup(plant_utc_offset, max_plant_id):
+    """
+    Build an array of UTC offsets indexed by plant_id_eia.
+
+    Args:
+        plant_utc_offset (pandas.DataFrame): A dataframe of plants' timezones,
+            with columns plant_id_eia and utc_offset.
+        max_plant_id (int): The largest plant ID which will be looked up.
+
+    Returns:
+        tuple: Two :class:`numpy.ndarray` objects, both indexed by
+        plant_id_eia. The first contains the UTC offset of each plant in
+        nanoseconds, and the second is a boolean mask indicating which plants
+        have a known UTC offset.
+
+    """
+    plant_ids = plant_utc_offset["plant_id_eia"].to_numpy(dtype="int64")
+    offsets_ns = (
+        pd.to_timedelta(plant_utc_offset["utc_offset"])
+        .to_numpy(dtype="timedelta64[ns]")
+        .astype("int64")
+    )
+    size = max(int(max_plant_id), int(plant_ids.max(initial=0))) + 1
+    offset_lookup = np.zeros(size, dtype="int64")
+    has_offset = np.zeros(size, dtype=bool)
+    offset_lookup[plant_ids] = offsets_ns
+    has_offset[plant_ids] = True
+    return offset_lookup, has_offset
+
+
 def fix_up_dates(df, plant_utc_offset):
     """
     Fix the dates for the CEMS data.
 
+    Rather than merging the UTC offsets onto every record, the offsets are
+    looked up in an array indexed by plant_id_eia, and only the unique values
+    of op_date (at most 366 per state-year) are parsed into dates. This avoids
+    making a copy of the whole dataframe. The op_date and op_hour columns are
+    removed from df in place.
+
     Args:
         df (pandas.DataFrame): A CEMS hourly dataframe for one year-month-state
         plant_utc_offset (pandas.DataFrame): A dataframe of plants' timezones
@@ -30,36 +66,37 @@ def fix_up_dates(df, plant_utc_offset):
         and the op_date and op_hour columns removed
 
     """
-    df = (
-        df.assign(
-            # Convert op_date and op_hour from string and integer to datetime:
-            # Note that doing this conversion, rather than reading the CSV with
-            # `parse_dates=True`, is >10x faster.
-            op_datetime_naive=lambda x:
-            # Read the date as a datetime, so all the dates are midnight
-            # Mark as UTC (it's not true yet, but it will be once we add
-            # utc_offsets, and it's easier to do here)
-            pd.to_datetime(x.op_date, format=r"%m-%d-%Y",
-                           exact=True, cache=True, utc=True) +
-            # Add the hour
-            pd.to_timedelta(x.op_hour, unit="h")
-        )
-        .merge(plant_utc_offset, how="left", on="plant_id_eia")
-    )
+    plant_ids = df["plant_id_eia"].to_numpy(dtype="int64")
+    offset_lookup, has_offset = _utc_offset_lookup(
+        plant_utc_offset, plant_ids.max(initial=0))
 
     # Some of the timezones in the plants_entity_eia table may be missing,
     # but none of the CEMS plants should be.
-    if not df["utc_offset"].notna().all():
-        missing_plants = df.loc[df["utc_offset"].isna(),
-                                "plant_id_eia"].unique()
+    if not has_offset[plant_ids].all():
+        missing_plants = np.unique(plant_ids[~has_offset[plant_ids]])
         raise ValueError(
             f"utc_offset should never be missing for CEMS plants, but was "
-            f"missing for these: {str(list(missing_plants))}"
+            f"missing for these: {missing_plants.tolist()}"
         )
+
+    # Convert op_date and op_hour from string and integer to datetime:
+    # Note that doing this conversion, rather than reading the CSV with
+    # `parse_dates=True`, is >10x faster.
+    date_codes, unique_dates = pd.factorize(df["op_date"])
+    op_date_ns = (
+        pd.to_datetime(unique_dates, format=r"%m-%d-%Y", exact=True)
+        .to_numpy(dtype="datetime64[ns]")
+        .astype("int64")
+    )[date_codes]
+    op_hour_ns = (
+        df["op_hour"].to_numpy(dtype="int64") *
+        np.timedelta64(1, "h").astype("timedelta64[ns]").astype("int64")
+    )
     # Add the offset from UTC. CEMS data don't have DST, so the offset is
     # always the same for a given plant.
-    df["operating_datetime_utc"] = df["op_datetime_naive"] - df["utc_offset"]
-    del df["op_date"], df["op_hour"], df["op_datetime_naive"], df["utc_offset"]
+    df["operating_datetime_utc"] = pd.to_datetime(
+        op_date_ns + op_hour_ns - offset_lookup[plant_ids], utc=True)
+    del df["op_date"], df["op_hour"]
     return df
 
 
@@ -140,7 +177,7 @@ def add_facility_id_unit_id_epa(df):
     if ("facility_id" not in df.columns) or ("unit_id_epa" not in df.columns):
         # Can't just assign np.NaN and get an integer NaN, so make a new array
         # with the right shape:
-        na_col = pd.array(np.full(df.shape[0], np.NaN), dtype="Int64")
+        na_col = pd.array(np.full(df.shape[0], np.NaN), dtype="Int32")
         if "facility_id" not in df.columns:
             df["facility_id"] = na_col
         if "unit_id_epa" not in df.columns:
@@ -176,6 +213,43 @@ def _all_na_or_values(series, values):
     return out
 
 
+def check_categorical_values(df):
+    """
+    Check that no values will be lost when the EPA CEMS dtypes are applied.
+
+    The state and measurement code columns are stored as categoricals with a
+    fixed set of categories. Casting a value which isn't one of them to such a
+    dtype silently turns it into NA, so instead an error is raised.
+
+    Args:
+        df (pandas.DataFrame): A raw CEMS dataframe.
+
+    Returns:
+        pandas.DataFrame: The same dataframe.
+
+    Raises:
+        ValueError: If any column contains values that aren't among the
+            categories of its dtype.
+
+    """
+    unexpected = {}
+    for col, dtype in pudl.constants.column_dtypes["epacems"].items():
+        if (col not in df.columns
+                or not isinstance(dtype, pd.CategoricalDtype)
+                or dtype.categories is None):
+            continue
+        values = set(df[col].dropna().unique())
+        bad_values = values.difference(dtype.categories)
+        if bad_values:
+            unexpected[col] = sorted(bad_values)
+    if unexpected:
+        raise ValueError(
+            f"Unexpected values found in EPA CEMS categorical columns, which "
+            f"would be lost: {unexpected}"
+        )
+    return df
+
+
 def correct_gross_load_mw(df):
     """
     Fix values of gross load that are wrong by orders of magnitude.
@@ -199,17 +273,97 @@ def correct_gross_load_mw(df):
     return df
 
 
-def transform(epacems_raw_dfs, datapkg_dir):
+def rollup(df, freq, level):
+    """
+    Aggregate transformed hourly EPA CEMS records into daily or monthly totals.
+
+    The records are grouped by the UTC day or month they fall within, since
+    that is the only timestamp the transformed data has. Gross load is a rate,
+    which is turned into gross generation by weighting it with the operating
+    time of each hour. Missing values contribute nothing to the totals.
+
+    Because the totals are simple sums, rollups of separate chunks of the same
+    state-year can be combined by summing them again, which is what
+    :func:`pudl.output.epacems.epacems_rollup` does when reading them.
+
+    Args:
+        df (pandas.DataFrame): Transformed hourly EPA CEMS records, as yielded
+            by :func:`transform`.
+        freq (str): The period to aggregate over. One of the keys of
+            :data:`pudl.constants.epacems_rollup_freqs`.
+        level (str): Whether to aggregate by "unit" or by "plant". One of the
+            keys of :data:`pudl.constants.epacems_rollup_levels`.
+
+    Returns:
+        pandas.DataFrame: One record for each state, plant (and unit), and
+        period, with an operating_date_utc column giving the start of the
+        period, and the totals listed in
+        :data:`pudl.constants.epacems_rollup_columns`.
+
+    """
+    if freq not in pudl.constants.epacems_rollup_freqs:
+        raise ValueError(
+            f"Unrecognized EPA CEMS rollup frequency: {freq}. Valid "
+            f"frequencies are {list(pudl.constants.epacems_rollup_freqs)}.")
+    if level not in pudl.constants.epacems_rollup_levels:
+        raise ValueError(
+            f"Unrecognized EPA CEMS rollup level: {level}. Valid levels are "
+            f"{list(pudl.constants.epacems_rollup_levels)}.")
+    by = ["state", *pudl.constants.epacems_rollup_levels[level]]
+    utc = df["operating_datetime_utc"]
+    if utc.dt.tz is not None:
+        utc = utc.dt.tz_convert(None)
+    # Sum in float64, since the totals are much larger than the hourly values.
+    operating_time = df["operating_time_hours"].astype("float64").fillna(0.0)
+    out = df[by].assign(
+        operating_date_utc=pd.to_datetime(
+            utc.to_numpy(dtype="datetime64[ns]")
+            .astype(pudl.constants.epacems_rollup_freqs[freq])
+            .astype("datetime64[ns]"),
+            utc=True),
+        operating_time_hours=operating_time,
+        gross_load_mwh=df["gross_load_mw"].astype("float64") * operating_time,
+        heat_content_mmbtu=df["heat_content_mmbtu"].astype("float64"),
+        so2_mass_lbs=df["so2_mass_lbs"].astype("float64"),
+        nox_mass_lbs=df["nox_mass_lbs"].astype("float64"),
+        co2_mass_tons=df["co2_mass_tons"].astype("float64"),
+    )
+    return (
+        out.groupby(by + ["operating_date_utc"], observed=True, sort=True)
+        [list(pudl.constants.epacems_rollup_columns)]
+        .sum()
+        .reset_index()
+    )
+
+
+def transform(epacems_raw_dfs, datapkg_dir, plant_utc_offset=None):
     """
     Transform EPA CEMS hourly data for use in datapackage export.
 
-    Todo:
-        Incomplete docstring.
+    All of the transformations operate on individual records, so each raw
+    dataframe may contain either a whole state-year, or just one chunk of it,
+    as yielded by :func:`pudl.extract.epacems.extract` when a chunksize is
+    given. Each chunk is transformed as soon as it is pulled from the
+    generator, so only one chunk needs to be held in memory at a time.
+
+    Args:
+        epacems_raw_dfs (iterable): A generator of one-item dictionaries, as
+            yielded by :func:`pudl.extract.epacems.extract`.
+        datapkg_dir (path-like): Path to the directory of the datapackage
+            which is currently being assembled.
+        plant_utc_offset (pandas.DataFrame): The UTC offset of each EIA plant,
+            as returned by :func:`_load_plant_utc_offset`. If None, it will be
+            loaded from the plants_entity_eia table in ``datapkg_dir``.
+
+    Yields:
+        dict: a one-item dictionary mapping the EPA CEMS resource name to the
+        transformed :class:`pandas.DataFrame`.
 
     """
     # epacems_raw_dfs is a generator. Pull out one dataframe, run it through
     # a transformation pipeline, and yield it back as another generator.
-    plant_utc_offset = _load_plant_utc_offset(datapkg_dir)
+    if plant_utc_offset is None:
+        plant_utc_offset = _load_plant_utc_offset(datapkg_dir)
     for raw_df_dict in epacems_raw_dfs:
         # There's currently only one dataframe in this dict at a time, but
         # that could be changed if you want.
@@ -222,6 +376,10 @@ def transform(epacems_raw_dfs, datapkg_dir):
                     "gross_load_mw": 0.0,
                     "heat_content_mmbtu": 0.0
                 })
+                # Compact the data types right away, so that the rest of the
+                # transform steps work on the smaller dataframe.
+                .pipe(check_categorical_values)
+                .pipe(pudl.helpers.convert_cols_dtypes, "epacems")
                 .pipe(harmonize_eia_epa_orispl)
                 .pipe(fix_up_dates, plant_utc_offset=plant_utc_offset)
                 .pipe(add_facility_id_unit_id_epa)
@@ -0,0 +1,135 @@
+"""Unit tests for pudl.transform.epacems module."""
+import unittest
+
+import numpy as np
+import pandas as pd
+
+import pudl.helpers
+import pudl.transform.epacems as epacems
+
+
+def _raw_cems_df():
+    """Returns a few raw CEMS records, as read by pudl.extract.epacems."""
+    return pd.DataFrame({
+        "state": ["ID", "ID", "ID"],
+        "plant_id_eia": [7000, 7000, 3],
+        "unitid": ["CT1", "CT1", "2"],
+        "op_date": ["01-01-2018", "01-01-2018", "12-31-2018"],
+        "op_hour": [0, 1, 23],
+        "operating_time_hours": [1.0, 0.5, np.nan],
+        "gross_load_mw": [100.0, np.nan, 5000.0],
+        "so2_mass_lbs": [1.5, 2.5, np.nan],
+        "so2_mass_measurement_code": ["Measured", "LME", np.nan],
+        "nox_mass_lbs": [1.0, 2.0, 3.0],
+        "nox_mass_measurement_code": ["Calculated", "Other", "Substitute"],
+        "co2_mass_tons": [1.0, 2.0, 3.0],
+        "co2_mass_measurement_code": ["Measured", "Measured", "Measured"],
+        "heat_content_mmbtu": [10.0, 20.0, np.nan],
+        "facility_id": [1, 1, 2],
+        "unit_id_epa": [10, 10, 20],
+    }).astype({
+        "state": pd.StringDtype(),
+        "plant_id_eia": pd.Int64Dtype(),
+        "unitid": pd.StringDtype(),
+        "op_date": pd.StringDtype(),
+        "op_hour": pd.Int64Dtype(),
+        "so2_mass_measurement_code": pd.StringDtype(),
+        "nox_mass_measurement_code": pd.StringDtype(),
+        "co2_mass_measurement_code": pd.StringDtype(),
+        "facility_id": pd.Int64Dtype(),
+        "unit_id_epa": pd.Int64Dtype(),
+    })
+
+
+class TestCheckCategoricalValues(unittest.TestCase):
+    """Tests that the categorical dtypes don't silently drop values."""
+
+    def test_known_values_kept(self):
+        """Known codes and missing values survive the dtype conversion."""
+        raw_df = _raw_cems_df()
+        df = pudl.helpers.convert_cols_dtypes(
+            epacems.check_categorical_values(raw_df.copy()), "epacems")
+        for col in ("state", "so2_mass_measurement_code",
+                    "nox_mass_measurement_code", "co2_mass_measurement_code"):
+            self.assertIsInstance(df[col].dtype, pd.CategoricalDtype)
+            pd.testing.assert_series_equal(
+                raw_df[col], df[col].astype(pd.StringDtype()))
+
+    def test_unexpected_values(self):
+        """Unknown measurement codes and states are an error."""
+        for col, value in (("co2_mass_measurement_code", "Weird"),
+                           ("nox_mass_measurement_code", "Weird"),
+                           ("state", "XX")):
+            raw_df = _raw_cems_df()
+            raw_df.loc[1, col] = value
+            with self.assertRaisesRegex(ValueError, f"{col}.*{value}"):
+                epacems.check_categorical_values(raw_df)
+
+
+def _fix_up_dates_reference(df, plant_utc_offset):
+    """Fixes the dates by merging on the UTC offsets, like the old code."""
+    df = (
+        df.assign(
+            op_datetime_naive=lambda x:
+            pd.to_datetime(x.op_date, format=r"%m-%d-%Y",
+                           exact=True, cache=True, utc=True) +
+            pd.to_timedelta(x.op_hour, unit="h")
+        )
+        .merge(plant_utc_offset, how="left", on="plant_id_eia")
+    )
+    if not df["utc_offset"].notna().all():
+        missing_plants = df.loc[df["utc_offset"].isna(),
+                                "plant_id_eia"].unique()
+        raise ValueError(
+            f"utc_offset should never be missing for CEMS plants, but was "
+            f"missing for these: {str(list(missing_plants))}"
+        )
+    df["operating_datetime_utc"] = (
+        df["op_datetime_naive"] - df["utc_offset"]
+    ).astype("datetime64[ns, UTC]")
+    del df["op_date"], df["op_hour"], df["op_datetime_naive"], df["utc_offset"]
+    return df
+
+
+class TestFixUpDates(unittest.TestCase):
+    """Tests that looking up the UTC offsets matches merging them."""
+
+    def setUp(self):
+        """Builds CEMS records and offsets for plants in several timezones."""
+        rng = np.random.default_rng(0)
+        n_records = 500
+        self.plant_utc_offset = pd.DataFrame({
+            "plant_id_eia": [3, 10, 7000, 55000, 60000],
+            "utc_offset": pd.to_timedelta(
+                ["-5h", "-10h", "-7h", "-6h", "-9h"]),
+        })
+        dates = pd.date_range("2016-01-01", "2016-12-31", freq="D")
+        self.df = pd.DataFrame({
+            "plant_id_eia": rng.choice([3, 10, 7000, 55000], n_records),
+            "op_date": rng.choice(dates.strftime("%m-%d-%Y"), n_records),
+            "op_hour": rng.integers(0, 24, n_records),
+            "gross_load_mw": rng.uniform(0, 100, n_records),
+        }).astype({"op_date": pd.StringDtype(), "op_hour": pd.Int64Dtype(),
+                   "plant_id_eia": "uint32"})
+
+    def test_same_as_merge(self):
+        """The operating times and other columns are unchanged."""
+        expected = _fix_up_dates_reference(
+            self.df.copy(), self.plant_utc_offset)
+        actual = epacems.fix_up_dates(self.df.copy(), self.plant_utc_offset)
+        pd.testing.assert_frame_equal(expected, actual)
+        self.assertEqual(
+            pd.Timestamp("2016-01-01 05:00", tz="UTC"),
+            epacems.fix_up_dates(
+                self.df.head(1).assign(
+                    plant_id_eia=3, op_date="01-01-2016", op_hour=0),
+                self.plant_utc_offset)["operating_datetime_utc"].iloc[0])
+
+    def test_missing_offset(self):
+        """Plants without a UTC offset are an error, as they were before."""
+        df = self.df.copy()
+        df.loc[[3, 7], "plant_id_eia"] = np.array([8, 70000], dtype="uint32")
+        with self.assertRaises(ValueError):
+            _fix_up_dates_reference(df.copy(), self.plant_utc_offset)
+        with self.assertRaisesRegex(ValueError, r"\[8, 70000\]"):
+            epacems.fix_up_dates(df.copy(), self.plant_utc_offset)
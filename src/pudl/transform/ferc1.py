@@ -10,22 +10,28 @@ with the appropriate NA values.
 
 """
 
+import concurrent.futures
 import importlib.resources
+import inspect
+import itertools
 import logging
 import re
+import time
 from difflib import SequenceMatcher
 
 # NetworkX is used to knit incomplete ferc plant time series together.
 import networkx as nx
 import numpy as np
 import pandas as pd
+import scipy.sparse as sp
 from sklearn.base import BaseEstimator, ClassifierMixin
 from sklearn.compose import ColumnTransformer
 from sklearn.feature_extraction.text import TfidfVectorizer
 # These modules are required for the FERC Form 1 Plant ID & Time Series
-from sklearn.metrics.pairwise import cosine_similarity
 from sklearn.pipeline import Pipeline
-from sklearn.preprocessing import MinMaxScaler, Normalizer, OneHotEncoder
+from sklearn.preprocessing import (MinMaxScaler, Normalizer, OneHotEncoder,
+                                   normalize)
+from sklearn.utils.extmath import safe_sparse_dot
 
 import pudl
 import pudl.constants as pc
@@ -70,19 +76,25 @@ def unpack_table(ferc1_df, table_name, data_cols, data_rows):
     )
     row_map.index = row_map.index.astype(int)
 
-    # For each year, rename row numbers to variable names based on row_map.
-    rename_dict = {}
-    out_df = pd.DataFrame()
-    for year in row_map.index:
-        rename_dict = {v: k for k, v in dict(row_map.loc[year, :]).items()}
-        _ = rename_dict.pop(-1, None)
-        df = ferc1_df.loc[ferc1_df.report_year == year].copy()
-        df.loc[:, "row_name"] = (
-            df.loc[:, "row_number"]
-            .replace(rename_dict, value=None)
-        )
-        # The concatenate according to row_name
-        out_df = pd.concat([out_df, df], axis="index")
+    # Long form (report_year, row_number) -> row_name lookup table. Rows which
+    # don't appear in a given year have a row_number of -1. If several rows
+    # share a row_number within a year, the last one in the row map wins.
+    row_names = (
+        row_map.rename_axis(index="report_year", columns="row_name")
+        .stack()
+        .rename("row_number")
+        .reset_index()
+        .query("row_number != -1")
+        .drop_duplicates(subset=["report_year", "row_number"], keep="last")
+    )
+    # Rename row numbers to variable names for all years at once. Any row
+    # numbers missing from the row map are left as they are.
+    out_df = (
+        ferc1_df.loc[ferc1_df.report_year.isin(row_map.index)]
+        .drop(columns="row_name", errors="ignore")
+        .merge(row_names, on=["report_year", "row_number"], how="left")
+    )
+    out_df["row_name"] = out_df.row_name.fillna(out_df.row_number)
 
     # Is this list of index columns universal? Or should they be an argument?
     idx_cols = [
@@ -133,12 +145,10 @@ def cols_to_cats(df, cat_name, col_cats):
         containing the assigned labels.
 
     """
-    out_df = pd.DataFrame()
-    for col, cat in col_cats.items():
-        logger.info(f"Col: {col}, Cat: {cat}")
-        tmp_df = df.loc[:, col].copy().dropna(how='all')
-        tmp_df.loc[:, cat_name] = cat
-        out_df = pd.concat([out_df, tmp_df])
+    out_df = pd.concat([
+        df.loc[:, col].dropna(how='all').assign(**{cat_name: cat})
+        for col, cat in col_cats.items()
+    ])
     return out_df.reset_index()
 
 
@@ -381,15 +391,22 @@ def _plants_steam_clean(ferc1_steam_df):
     return ferc1_steam_df
 
 
-def _plants_steam_assign_plant_ids(ferc1_steam_df, ferc1_fuel_df):
-    """Assign IDs to the large steam plants."""
-    ###########################################################################
-    # FERC PLANT ID ASSIGNMENT
-    ###########################################################################
-    # Now we need to assign IDs to the large steam plants, since FERC doesn't
-    # do this for us.
-    logger.info("Identifying distinct large FERC plants for ID assignment.")
+def _plants_steam_clf_input(ferc1_steam_df, ferc1_fuel_df):
+    """Prepare the large steam plants for use with the FERC plant classifier.
 
+    Args:
+        ferc1_steam_df (pandas.DataFrame): Cleaned FERC Form 1 large steam
+            plant records.
+        ferc1_fuel_df (pandas.DataFrame): Transformed FERC Form 1 fuel
+            records, used to calculate each plant's fuel consumption
+            proportions.
+
+    Returns:
+        pandas.DataFrame: The steam plant records, with a column for the
+        fraction of the heat content from each fuel, and construction_year
+        converted to a string.
+
+    """
     # scikit-learn still doesn't deal well with NA values (this will be fixed
     # eventually) We need to massage the type and missing data for the
     # Classifier to work.
@@ -409,6 +426,19 @@ def _plants_steam_assign_plant_ids(ferc1_steam_df, ferc1_fuel_df):
         )
     )
     ferc1_steam_df[ffc] = ferc1_steam_df[ffc].fillna(value=0.0)
+    return ferc1_steam_df
+
+
+def _plants_steam_assign_plant_ids(ferc1_steam_df, ferc1_fuel_df):
+    """Assign IDs to the large steam plants."""
+    ###########################################################################
+    # FERC PLANT ID ASSIGNMENT
+    ###########################################################################
+    # Now we need to assign IDs to the large steam plants, since FERC doesn't
+    # do this for us.
+    logger.info("Identifying distinct large FERC plants for ID assignment.")
+    ferc1_steam_df = _plants_steam_clf_input(ferc1_steam_df, ferc1_fuel_df)
+    ffc = list(ferc1_steam_df.filter(regex='.*_fraction_mmbtu$').columns)
 
     # Train the classifier using DEFAULT weights, parameters not listed here.
     ferc1_clf = pudl.transform.ferc1.make_ferc1_clf(ferc1_steam_df)
@@ -464,13 +494,13 @@ def _plants_steam_assign_plant_ids(ferc1_steam_df, ferc1_fuel_df):
 
     # Now we'll iterate through the connected components and assign each of
     # them a FERC Plant ID, and pull the results back out into a dataframe:
-    plants_w_ids = pd.DataFrame()
+    plant_dfs = []
     for plant_id_ferc1, plant in enumerate(ferc1_plants):
         nx.set_edge_attributes(plant,
                                plant_id_ferc1 + 1,
                                name='plant_id_ferc1')
-        new_plant_df = nx.to_pandas_edgelist(plant)
-        plants_w_ids = plants_w_ids.append(new_plant_df)
+        plant_dfs.append(nx.to_pandas_edgelist(plant))
+    plants_w_ids = pd.concat(plant_dfs)
     logger.info(
         f"Successfully Identified {plant_id_ferc1+1-len(orphan_record_ids)} "
         f"multi-year plant entities.")
@@ -505,7 +535,7 @@ def _plants_steam_assign_plant_ids(ferc1_steam_df, ferc1_fuel_df):
     )
     steam_rids = ferc1_steam_df.record_id.values
     pwids_rids = plants_w_ids.record_id.values
-    missing_ids = [rid for rid in steam_rids if rid not in pwids_rids]
+    missing_ids = list(steam_rids[~np.isin(steam_rids, pwids_rids)])
     if missing_ids:
         raise AssertionError(
             f"Uh oh, we lost {abs(len(steam_rids)-len(pwids_rids))} FERC "
@@ -1233,7 +1263,7 @@ class FERCPlantClassifier(BaseEstimator, ClassifierMixin):
 
     """
 
-    def __init__(self, min_sim=0.75, plants_df=None):
+    def __init__(self, min_sim=0.75, plants_df=None, block_size=1000):
         """
         Initialize the classifier.
 
@@ -1247,6 +1277,9 @@ class FERCPlantClassifier(BaseEstimator, ClassifierMixin):
                 Needed in order to calculate the distance metrics between all
                 of the records so we can group the plants in the fit() step, so
                 we can check how well they are categorized later...
+            block_size : The number of records whose similarities to all of
+                the records from a single year are calculated at once. Limits
+                the memory used in the fit() step.
 
         Todo:
             Zane revisit plants_df
@@ -1254,6 +1287,7 @@ class FERCPlantClassifier(BaseEstimator, ClassifierMixin):
         """
         self.min_sim = min_sim
         self.plants_df = plants_df
+        self.block_size = block_size
         self._years = self.plants_df.report_year.unique()
 
     def fit(self, X, y=None):  # noqa: N803 Canonical capital letter...
@@ -1261,10 +1295,10 @@ class FERCPlantClassifier(BaseEstimator, ClassifierMixin):
         Use weighted FERC plant features to group records into time series.
 
         The fit method takes the vectorized, normalized, weighted FERC plant
-        features (X) as input, calculates the pairwise cosine similarity matrix
-        between all records, and groups the records in their best time series.
-        The similarity matrix and best time series are stored as data members
-        in the object for later use in scoring & predicting.
+        features (X) as input, calculates the cosine similarity between each
+        record and all the records from each year, and groups the records in
+        their best time series. The best time series are stored as a data
+        member in the object for later use in scoring & predicting.
 
         This isn't quite the way a fit method would normally work.
 
@@ -1278,12 +1312,7 @@ class FERCPlantClassifier(BaseEstimator, ClassifierMixin):
         TODO:
             Zane revisit args and returns
         """
-        self._cossim_df = pd.DataFrame(cosine_similarity(X))
-        self._best_of = self._best_by_year()
-        # Make the best match indices integers rather than floats w/ NA values.
-        self._best_of[self._years] = self._best_of[self._years].fillna(
-            -1).astype(int)
-
+        self._best_of = self._best_by_year(X)
         return self
 
     def transform(self, X, y=None):  # noqa: N803
@@ -1304,75 +1333,79 @@ class FERCPlantClassifier(BaseEstimator, ClassifierMixin):
 
         Row index is the seed record IDs. Column index is years.
 
-        TODO:
-        * This method is hideously inefficient. It should be vectorized.
-        * There's a line that throws a FutureWarning that needs to be fixed.
+        Only record IDs whose groupings are internally consistent are included
+        in the output. The consistency of every record is checked at once,
+        using an inverse index of the best matches in the _best_of table.
 
         """
         try:
-            getattr(self, "_cossim_df")
+            getattr(self, "_best_of")
         except AttributeError:
             raise RuntimeError(
                 "You must train classifer before predicting data!")
 
-        out_df = pd.DataFrame(
-            data=[],
-            index=pd.Index([], name="seed_id"),
-            columns=self._years)
-        tmp_best = (
-            self._best_of.loc[:, ["record_id"] + list(self._years)]
-            .append(pd.DataFrame(data=[""], index=[-1], columns=["record_id"]))
+        best = self._best_of.loc[:, list(self._years)].to_numpy()
+        record_ids = self._best_of.record_id.to_numpy()
+        n_records = len(record_ids)
+
+        # The indices of the records which best match each record, in year
+        # order. When no sufficiently good match is found the "index" in the
+        # _best_of array is set to -1, which screens out those no-match cases.
+        b_idx, b_year = np.nonzero(best >= 0)
+        b_val = best[b_idx, b_year]
+        # The inverse index: the indices of the *other* records which found
+        # each record to be one of their best matches, in index order.
+        w_pairs = np.unique(b_val * n_records + b_idx)
+        w_idx, w_val = np.divmod(w_pairs, n_records)
+
+        b_count = np.bincount(b_idx, minlength=n_records)
+        w_count = np.bincount(w_idx, minlength=n_records)
+        b_first = np.full(n_records, -1)
+        b_first[b_count > 0] = b_val[(np.cumsum(b_count) - b_count)[
+            b_count > 0]]
+        w_first = np.full(n_records, -1)
+        w_first[w_count > 0] = w_val[(np.cumsum(w_count) - w_count)[
+            w_count > 0]]
+
+        def any_by_record(idx, mask):
+            return np.bincount(idx[mask], minlength=n_records) > 0
+
+        # Here we require that there is no conflict between the two sets
+        # of indices -- that every time a record shows up in a grouping,
+        # that grouping is either the same, or a subset of the other
+        # groupings that it appears in. This is okay -- we're just trying to
+        # require that the groupings be internally self-consistent, not that
+        # they are completely identical. Being flexible on this dramatically
+        # increases the number of records that get assigned a plant ID.
+        # As with numpy.array_equiv, the two sets of indices are consistent
+        # if they are identical, or if either one contains a single index
+        # which is the only value in the other.
+        same_len = w_count == b_count
+        consistent = (
+            (same_len & ~any_by_record(
+                w_idx[same_len[w_idx]],
+                w_val[same_len[w_idx]] != b_val[same_len[b_idx]]))
+            | ((w_count == 1) & ~any_by_record(b_idx, b_val != w_first[b_idx]))
+            | ((b_count == 1) & ~any_by_record(w_idx, w_val != b_first[w_idx]))
         )
-        # For each record_id we've been given:
-        for x in X:
-            # Find the index associated with the record ID we are predicting
-            # a grouping for:
-            idx = tmp_best[tmp_best.record_id == x].index.values[0]
-
-            # Mask the best_of dataframe, keeping only those entries where
-            # the index of the chosen record_id appears -- this results in a
-            # huge dataframe almost full of NaN values.
-            w_m = (
-                tmp_best[self._years][tmp_best[self._years] == idx]
-                # Grab the index values of the rows in the masked dataframe which
-                # are NOT all NaN -- these are the indices of the *other* records
-                # which found the record x to be one of their best matches.
-                .dropna(how="all").index.values
-            )
 
-            # Now look up the indices of the records which were found to be
-            # best matches to the record x.
-            b_m = tmp_best.loc[idx, self._years].astype(int)
-
-            # Here we require that there is no conflict between the two sets
-            # of indices -- that every time a record shows up in a grouping,
-            # that grouping is either the same, or a subset of the other
-            # groupings that it appears in. When no sufficiently good match
-            # is found the "index" in the _best_of array is set to -1, so
-            # requiring that the b_m value be >=0 screens out those no-match
-            # cases. This is okay -- we're just trying to require that the
-            # groupings be internally self-consistent, not that they are
-            # completely identical. Being flexible on this dramatically
-            # increases the number of records that get assigned a plant ID.
-            if np.array_equiv(w_m, b_m[b_m >= 0].values):
-                # This line is causing a warning. In cases where there are
-                # some years no sufficiently good match exists, and so b_m
-                # doesn't contain an index. Instead, it has a -1 sentinel
-                # value, which isn't a label for which a record exists, which
-                # upsets .loc. Need to find some way around this... but for
-                # now it does what we want. We could use .iloc instead, but
-                # then the -1 sentinel value maps to the last entry in the
-                # dataframe, which also isn't what we want.  Blargh.
-                new_grp = tmp_best.loc[b_m, "record_id"]
-
-                # Stack the new list of record_ids on our output DataFrame:
-                out_df = out_df.append(
-                    pd.DataFrame(
-                        data=new_grp.values.reshape(1, len(self._years)),
-                        index=pd.Index(
-                            [tmp_best.loc[idx, "record_id"]],
-                            name="seed_id"),
-                        columns=self._years))
+        # Find the index of the (first) record with each of the given IDs:
+        seed_ids = pd.Series(np.asarray(X).ravel())
+        id_index = pd.Index(record_ids)
+        first_pos = np.flatnonzero(~id_index.duplicated())
+        positions = id_index[first_pos].get_indexer(seed_ids)
+        if (positions < 0).any():
+            raise KeyError(
+                f"Unknown FERC record IDs: {list(seed_ids[positions < 0])}")
+        positions = first_pos[positions]
+        positions = positions[consistent[positions]]
+
+        # The -1 sentinel value picks out the empty record ID at the end.
+        grp_ids = np.append(record_ids, "")[best[positions]]
+        out_df = pd.DataFrame(
+            data=grp_ids,
+            index=pd.Index(record_ids[positions], name="seed_id"),
+            columns=self._years)
         return out_df
 
     def score(self, X, y=None):  # noqa: N803
@@ -1380,7 +1413,9 @@ class FERCPlantClassifier(BaseEstimator, ClassifierMixin):
 
         For every record ID in X, predict its record group and calculate
         a metric of similarity between the prediction and the "ground
-        truth" group that was passed in for that value of X.
+        truth" group that was passed in for that value of X. The record
+        groups are all predicted at once. Records which could not be assigned
+        a consistent group are compared to an empty group.
 
         Args:
             X (pandas.DataFrame): an n_samples x 1 pandas dataframe of FERC
@@ -1392,50 +1427,112 @@ class FERCPlantClassifier(BaseEstimator, ClassifierMixin):
             numpy.ndarray: The average of all the similarity metrics as the
             score.
         """
+        true_groups = [
+            [s for s in str.split(true_group, sep=',') if s != '']
+            for true_group in y
+        ]
+        predicted_groups = self.predict(
+            pd.unique(pd.Series([s for g in true_groups for s in g])))
+        predicted_groups = dict(zip(
+            predicted_groups.index, predicted_groups.to_numpy().tolist()))
+
         scores = []
-        for true_group in y:
-            true_group = str.split(true_group, sep=',')
-            true_group = [s for s in true_group if s != '']
-            predicted_groups = self.predict(pd.DataFrame(true_group))
+        for true_group in true_groups:
             for rec_id in true_group:
                 sm = SequenceMatcher(None, true_group,
-                                     predicted_groups.loc[rec_id])
-                scores = scores + [sm.ratio()]
+                                     predicted_groups.get(rec_id, []))
+                scores.append(sm.ratio())
 
         return np.mean(scores)
 
-    def _best_by_year(self):
-        """Finds the best match for each plant record in each other year."""
-        # only keep similarity matrix entries above our minimum threshold:
+    def _best_by_year(self, X):  # noqa: N803
+        """
+        Finds the best match for each plant record in each other year.
+
+        Rather than calculating the full pairwise cosine similarity matrix
+        between all of the records, which grows with the square of the number
+        of records, the similarities between a block of records and all the
+        records from a single year are calculated at a time, and only the
+        index of the best match above min_sim is kept.
+
+        Args:
+            X (): a sparse matrix of size n_samples x n_features.
+
+        Returns:
+            pandas.DataFrame: plants_df, with an additional column for each
+            year, containing the index of the record from that year which is
+            most similar to each record, or -1 if no record from that year is
+            at least min_sim similar.
+
+        """
         out_df = self.plants_df.copy()
-        sim_df = self._cossim_df[self._cossim_df >= self.min_sim]
-
-        # Add a column for each of the years, in which we will store indices
-        # of the records which best match the record in question:
-        for yr in self._years:
-            newcol = yr
-            out_df[newcol] = -1
-
-        # seed_yr is the year we are matching *from* -- we do the entire
-        # matching process from each year, since it may not be symmetric:
-        for seed_yr in self._years:
-            seed_idx = self.plants_df.index[
-                self.plants_df.report_year == seed_yr]
-            # match_yr is all the other years, in which we are finding the best
-            # match
-            for match_yr in self._years:
-                best_of_yr = match_yr
-                match_idx = self.plants_df.index[
-                    self.plants_df.report_year == match_yr]
-                # For each record specified by seed_idx, obtain the index of
-                # the record within match_idx that that is the most similar.
-                best_idx = sim_df.iloc[seed_idx, match_idx].idxmax(axis=1)
-                out_df.iloc[seed_idx,
-                            out_df.columns.get_loc(best_of_yr)] = best_idx
+        # With unit length rows, cosine similarities are just dot products.
+        X = normalize(X)  # noqa: N806
+        report_years = self.plants_df.report_year.to_numpy()
+        n_records = X.shape[0]
+
+        # match_yr is the year in which we are finding the best match for each
+        # record. Matching is done from every record, since it may not be
+        # symmetric:
+        for match_yr in self._years:
+            match_idx = np.flatnonzero(report_years == match_yr)
+            match_X = X[match_idx].T  # noqa: N806
+            best_idx = np.full(n_records, -1)
+            for start in range(0, n_records, self.block_size):
+                stop = min(start + self.block_size, n_records)
+                sim = safe_sparse_dot(
+                    X[start:stop], match_X, dense_output=True)
+                # only keep similarities above our minimum threshold:
+                sim[sim < self.min_sim] = np.nan
+                matched = ~np.isnan(sim).all(axis=1)
+                best_idx[start:stop][matched] = match_idx[
+                    np.nanargmax(sim[matched], axis=1)]
+            out_df[match_yr] = best_idx
 
         return out_df
 
 
+def _ferc1_clf_transformers(plants_df, ngram_min, ngram_max):
+    """
+    Define the transformers that turn FERC plant records into features.
+
+    Args:
+        plants_df (pandas.DataFrame): FERC steam plant records, including fuel
+            consumption fractions.
+        ngram_min (int): the minimum lengths to consider in the vectorization
+            of the plant_name feature.
+        ngram_max (int): the maximum n-gram lengths to consider in the
+            vectorization of the plant_name feature.
+
+    Returns:
+        list: (name, transformer, columns) tuples, as used by
+        :class:`sklearn.compose.ColumnTransformer`.
+
+    """
+    # Make a list of all the fuel fraction columns for use as one feature.
+    fuel_cols = list(plants_df.filter(regex='.*_fraction_mmbtu$').columns)
+
+    return [
+        ('plant_name_ferc1', TfidfVectorizer(
+            analyzer='char',
+            ngram_range=(ngram_min, ngram_max)),
+         'plant_name_ferc1'),
+        ('plant_type', OneHotEncoder(
+            categories='auto'), ['plant_type']),
+        ('construction_type', OneHotEncoder(
+            categories='auto'), ['construction_type']),
+        ('capacity_mw', MinMaxScaler(), ['capacity_mw']),
+        ('construction_year', OneHotEncoder(
+            categories='auto'), ['construction_year']),
+        ('utility_id_ferc1', OneHotEncoder(
+            categories='auto'), ['utility_id_ferc1']),
+        ('fuel_fraction', Pipeline([
+            ('scaler', MinMaxScaler()),
+            ('norm', Normalizer())
+        ]), fuel_cols),
+    ]
+
+
 def make_ferc1_clf(plants_df,
                    ngram_min=2,
                    ngram_max=10,
@@ -1511,30 +1608,10 @@ def make_ferc1_clf(plants_df,
         reprocessing and classification with a FERCPlantClassifier object.
 
     """
-    # Make a list of all the fuel fraction columns for use as one feature.
-    fuel_cols = list(plants_df.filter(regex='.*_fraction_mmbtu$').columns)
-
     ferc1_pipe = Pipeline([
         ('preprocessor', ColumnTransformer(
-            transformers=[
-                ('plant_name_ferc1', TfidfVectorizer(
-                    analyzer='char',
-                    ngram_range=(ngram_min, ngram_max)),
-                 'plant_name_ferc1'),
-                ('plant_type', OneHotEncoder(
-                    categories='auto'), ['plant_type']),
-                ('construction_type', OneHotEncoder(
-                    categories='auto'), ['construction_type']),
-                ('capacity_mw', MinMaxScaler(), ['capacity_mw']),
-                ('construction_year', OneHotEncoder(
-                    categories='auto'), ['construction_year']),
-                ('utility_id_ferc1', OneHotEncoder(
-                    categories='auto'), ['utility_id_ferc1']),
-                ('fuel_fraction_mmbtu', Pipeline([
-                    ('scaler', MinMaxScaler()),
-                    ('norm', Normalizer())
-                ]), fuel_cols),
-            ],
+            transformers=_ferc1_clf_transformers(
+                plants_df, ngram_min=ngram_min, ngram_max=ngram_max),
 
             transformer_weights={
                 'plant_name_ferc1': plant_name_ferc1_wt,
@@ -1543,7 +1620,7 @@ def make_ferc1_clf(plants_df,
                 'capacity_mw': capacity_mw_wt,
                 'construction_year': construction_year_wt,
                 'utility_id_ferc1': utility_id_ferc1_wt,
-                'fuel_fraction_mmbtu': fuel_fraction_wt,
+                'fuel_fraction': fuel_fraction_wt,
             })
          ),
         ('classifier', pudl.transform.ferc1.FERCPlantClassifier(
@@ -1552,6 +1629,163 @@ def make_ferc1_clf(plants_df,
     return ferc1_pipe
 
 
+def ferc1_clf_features(plants_df, ngram_min=2, ngram_max=10):
+    """
+    Calculate each of the unweighted features used by the FERC classifier.
+
+    Computing the plant name feature (TF-IDF over character n-grams) is by far
+    the most expensive part of building the classifier, and it doesn't depend
+    on the feature weights. Calculating each feature once allows many sets of
+    weights to be tried using :func:`weight_ferc1_clf_features`.
+
+    Args:
+        plants_df (pandas.DataFrame): FERC steam plant records, including fuel
+            consumption fractions.
+        ngram_min (int): the minimum lengths to consider in the vectorization
+            of the plant_name feature.
+        ngram_max (int): the maximum n-gram lengths to consider in the
+            vectorization of the plant_name feature.
+
+    Returns:
+        dict: feature names (keys) and sparse matrices of size n_samples x
+        n_features containing the unweighted features (values).
+
+    """
+    return {
+        name: sp.csr_matrix(transformer.fit_transform(plants_df[columns]))
+        for name, transformer, columns in _ferc1_clf_transformers(
+            plants_df, ngram_min=ngram_min, ngram_max=ngram_max)
+    }
+
+
+def weight_ferc1_clf_features(features, weights):
+    """
+    Combine weighted FERC classifier features into a single feature matrix.
+
+    This is equivalent to the output of the ColumnTransformer used in
+    :func:`make_ferc1_clf` with the same weights.
+
+    Args:
+        features (dict): feature names (keys) and unweighted feature matrices
+            (values), as returned by :func:`ferc1_clf_features`.
+        weights (dict): feature names (keys) and the weight to apply to that
+            feature (values). The names are those of the weight arguments of
+            :func:`make_ferc1_clf`, without the ``_wt`` suffix. Features
+            without a weight are weighted 1.0.
+
+    Returns:
+        scipy.sparse.csr_matrix: The weighted feature matrix.
+
+    Raises:
+        ValueError: if a weight is given for a feature which doesn't exist.
+
+    """
+    unknown = set(weights) - set(features)
+    if unknown:
+        raise ValueError(f"Unknown FERC classifier features: {unknown}")
+    return sp.hstack([
+        weights.get(name, 1.0) * feature
+        for name, feature in features.items()
+    ], format='csr')
+
+
+def _score_ferc1_clf(features, plants_df, true_groups, params):
+    """Fit and score FERC plant classifiers for several sets of parameters."""
+    results = []
+    for weights, min_sim in params:
+        start = time.perf_counter()
+        clf = FERCPlantClassifier(min_sim=min_sim, plants_df=plants_df).fit(
+            weight_ferc1_clf_features(features, weights))
+        score = clf.score(plants_df.record_id, true_groups)
+        n_grouped = len(clf.predict(plants_df.record_id))
+        results.append({
+            **{f"{name}_wt": wt for name, wt in weights.items()},
+            "min_sim": min_sim,
+            "score": score,
+            "grouped_fraction": n_grouped / len(plants_df),
+            "seconds": time.perf_counter() - start,
+        })
+    return results
+
+
+def sweep_ferc1_clf(plants_df, true_groups, weights, min_sims=(0.75,),
+                    ngram_min=2, ngram_max=10, workers=1):
+    """
+    Score FERC plant classifiers over a grid of weights and similarities.
+
+    Each of the features is calculated only once. For each combination of
+    parameters, they are weighted and combined, and a
+    :class:`FERCPlantClassifier` is fit to them and scored against a set of
+    hand classified FERC plant record groups.
+
+    Args:
+        plants_df (pandas.DataFrame): FERC steam plant records, including fuel
+            consumption fractions.
+        true_groups (iterable): "ground truth" FERC Form 1 record groups. Each
+            group is a string of comma separated record IDs. See
+            :meth:`FERCPlantClassifier.score`.
+        weights (dict): feature names (keys) and lists of the weights to try
+            for that feature (values). Features which aren't listed use the
+            default weights of :func:`make_ferc1_clf`.
+        min_sims (iterable): minimum cosine similarities to try.
+        ngram_min (int): the minimum lengths to consider in the vectorization
+            of the plant_name feature.
+        ngram_max (int): the maximum n-gram lengths to consider in the
+            vectorization of the plant_name feature.
+        workers (int): Number of worker processes to use for fitting and
+            scoring the classifiers. If 1, they are all fit in this process.
+
+    Returns:
+        pandas.DataFrame: one row for each combination of parameters, with
+        the weight of each feature, min_sim, the score, the fraction of
+        records which were grouped, and the number of seconds it took to fit
+        and score the classifier. Sorted by descending score.
+
+    """
+    default_weights = {
+        name[:-len('_wt')]: param.default
+        for name, param in inspect.signature(make_ferc1_clf).parameters.items()
+        if name.endswith('_wt')
+    }
+    unknown = set(weights) - set(default_weights)
+    if unknown:
+        raise ValueError(f"Unknown FERC classifier features: {unknown}")
+    grid = {name: weights.get(name, [wt])
+            for name, wt in default_weights.items()}
+    params = [
+        (dict(zip(grid, wts)), min_sim)
+        for wts in itertools.product(*grid.values())
+        for min_sim in min_sims
+    ]
+
+    logger.info("Calculating FERC plant classifier features.")
+    plants_df = plants_df.reset_index(drop=True)
+    features = ferc1_clf_features(
+        plants_df, ngram_min=ngram_min, ngram_max=ngram_max)
+    true_groups = list(true_groups)
+
+    logger.info(f"Scoring {len(params)} FERC plant classifiers.")
+    if workers == 1:
+        results = _score_ferc1_clf(features, plants_df, true_groups, params)
+    else:
+        # Each worker gets a copy of the features, and an equal share of the
+        # parameter combinations to try.
+        with concurrent.futures.ProcessPoolExecutor(workers) as executor:
+            futures = [
+                executor.submit(_score_ferc1_clf, features, plants_df,
+                                true_groups, params[i::workers])
+                for i in range(workers)
+            ]
+            results = [
+                result for future in futures for result in future.result()]
+
+    return (
+        pd.DataFrame(results)
+        .sort_values("score", ascending=False)
+        .reset_index(drop=True)
+    )
+
+
 def fuel_by_plant_ferc1(fuel_df, thresh=0.5):
     """Calculates useful FERC Form 1 fuel metrics on a per plant-year basis.
 
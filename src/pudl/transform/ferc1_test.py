@@ -0,0 +1,333 @@
+"""Unit tests for the FERC plant classifier in pudl.transform.ferc1."""
+import importlib.resources
+import inspect
+import io
+import unittest
+import unittest.mock as mock
+
+import numpy as np
+import pandas as pd
+import scipy.sparse as sp
+from sklearn.metrics.pairwise import cosine_similarity
+
+import pudl.transform.ferc1 as ferc1
+
+
+def _plants_df():
+    """Returns a few FERC steam plant records, from three years."""
+    plants = [
+        ('big river', 'steam', 'outdoor', 500.0, 1970, 1, 0.9, 0.1),
+        ('lake hill', 'steam', 'indoor', 250.0, 1982, 1, 0.2, 0.8),
+        ('north creek', 'gt', 'outdoor', 80.0, 2001, 2, 0.0, 1.0),
+        ('south station', 'nuke', 'indoor', 1100.0, 1975, 3, 0.0, 0.0),
+    ]
+    records = []
+    for year in (2016, 2017, 2018):
+        for i, plant in enumerate(plants):
+            name, ptype, ctype, cap, cyear, util_id, coal, gas = plant
+            if year == 2017:
+                name = name.replace(' ', '')
+            records.append({
+                'record_id': f'f1_steam_{year}_12_{util_id}_{i}',
+                'report_year': year,
+                'plant_name_ferc1': name,
+                'plant_type': ptype,
+                'construction_type': ctype,
+                'capacity_mw': cap + year - 2016,
+                'construction_year': cyear,
+                'utility_id_ferc1': util_id,
+                'coal_fraction_mmbtu': coal,
+                'gas_fraction_mmbtu': gas,
+            })
+    return pd.DataFrame(records)
+
+
+class TestWeightFerc1ClfFeatures(unittest.TestCase):
+    """Test that the cached features match the classifier pipeline."""
+
+    def test_same_as_pipeline(self):
+        """Checks weighted features against the pipeline's preprocessor."""
+        plants_df = _plants_df()
+        features = ferc1.ferc1_clf_features(plants_df)
+        # Every weight argument of make_ferc1_clf has a cached feature.
+        self.assertEqual(set(features), {
+            name[:-len('_wt')]
+            for name in inspect.signature(ferc1.make_ferc1_clf).parameters
+            if name.endswith('_wt')
+        })
+        weights = {
+            'plant_name_ferc1': 3.0,
+            'plant_type': 0.5,
+            'construction_type': 2.0,
+            'capacity_mw': 4.0,
+            'construction_year': 0.25,
+            'utility_id_ferc1': 1.5,
+            'fuel_fraction': 5.0,
+        }
+        for wts in (weights, dict(weights, fuel_fraction=0.0)):
+            expected = ferc1.make_ferc1_clf(
+                plants_df, **{f'{name}_wt': wt for name, wt in wts.items()}
+            )[0].fit_transform(plants_df)
+            if sp.issparse(expected):
+                expected = expected.toarray()
+            np.testing.assert_allclose(
+                expected,
+                ferc1.weight_ferc1_clf_features(features, wts).toarray())
+
+    def test_unknown_feature(self):
+        """Checks that weights for unknown features aren't ignored."""
+        features = ferc1.ferc1_clf_features(_plants_df())
+        with self.assertRaises(ValueError):
+            ferc1.weight_ferc1_clf_features(
+                features, {'fuel_fraction_mmbtu': 2.0})
+
+
+def _random_plants(n_records=40, seed=0):
+    """Returns random plant records and features, from three years."""
+    rng = np.random.default_rng(seed)
+    plants_df = pd.DataFrame({
+        'record_id': [f'f1_steam_{i}' for i in range(n_records)],
+        'report_year': np.resize([2016, 2017, 2018], n_records),
+    })
+    X = sp.random(  # noqa: N806
+        n_records, 6, density=0.6, format='lil', random_state=seed)
+    # A record without any features doesn't match anything, not even itself.
+    X[5] = 0
+    return plants_df, X.tocsr()
+
+
+class TestFERCPlantClassifierFit(unittest.TestCase):
+    """Test that the best matches are found without the full matrix."""
+
+    @staticmethod
+    def _dense_best_of(plants_df, X, min_sim):  # noqa: N803
+        """Finds the best matches using the full cosine similarity matrix."""
+        sim = pd.DataFrame(cosine_similarity(X))
+        sim = sim.where(sim >= min_sim)
+        best_of = plants_df.copy()
+        for year in plants_df.report_year.unique():
+            year_sim = sim.loc[:, plants_df.report_year == year]
+            matched = year_sim.notna().any(axis=1)
+            best_of[year] = -1
+            best_of.loc[matched, year] = year_sim[matched].idxmax(axis=1)
+        return best_of
+
+    def test_same_as_dense(self):
+        """Checks the best matches against the full similarity matrix."""
+        plants_df, X = _random_plants()  # noqa: N806
+        for min_sim in (0.5, 0.9):
+            expected = self._dense_best_of(plants_df, X, min_sim)
+            self.assertTrue((expected[[2016, 2017, 2018]] == -1).any().any())
+            for block_size in (7, 1000):
+                clf = ferc1.FERCPlantClassifier(
+                    min_sim=min_sim, plants_df=plants_df,
+                    block_size=block_size).fit(X)
+                pd.testing.assert_frame_equal(
+                    expected, clf._best_of, check_dtype=False)
+
+
+def _predict_reference(best_of, years, seed_ids):
+    """Predicts groups one record at a time, as predict() used to."""
+    best = best_of.loc[:, years].to_numpy()
+    all_ids = best_of.record_id.to_numpy()
+    group_ids = np.append(all_ids, '')
+    groups = {}
+    for seed_id in seed_ids:
+        idx = np.flatnonzero(all_ids == seed_id)[0]
+        # The records which chose this one, and the ones it chose.
+        w_m = np.flatnonzero((best == idx).any(axis=1))
+        b_m = best[idx]
+        if np.array_equiv(w_m, b_m[b_m >= 0]):
+            groups[seed_id] = list(group_ids[b_m])
+    return groups
+
+
+class TestFERCPlantClassifierPredict(unittest.TestCase):
+    """Test the consistency checks of the vectorized predict()."""
+
+    def setUp(self):
+        """Builds a classifier whose best matches cover the edge cases."""
+        years = [2016, 2017, 2018]
+        best = [
+            [0, 1, 2],  # 0-2: a group which all agree with each other.
+            [0, 1, 2],
+            [0, 1, 2],
+            [-1, -1, -1],  # 3: no matches, chosen by no one.
+            [-1, -1, -1],  # 4: no matches, chosen by one record.
+            [-1, -1, -1],  # 5: no matches, chosen by two records.
+            [-1, 4, 5],  # 6: two best matches, chosen by no one.
+            [-1, -1, 5],  # 7: one best match, chosen by no one.
+            [-1, 8, -1],  # 8: one best match, which is itself.
+            [6, -1, 9],  # 9: two best matches, chosen by itself.
+        ]
+        plants_df = pd.DataFrame({
+            'record_id': [f'r{i}' for i in range(len(best))],
+            'report_year': [2016, 2017, 2018, 2016, 2017, 2018,
+                            2016, 2016, 2017, 2018],
+        })
+        self.clf = ferc1.FERCPlantClassifier(plants_df=plants_df)
+        self.clf._best_of = pd.concat(
+            [plants_df, pd.DataFrame(best, columns=years)], axis=1)
+
+    def test_edge_cases(self):
+        """Checks which records are consistent, like numpy.array_equiv."""
+        predicted = self.clf.predict(self.clf._best_of.record_id)
+        self.assertEqual(
+            ['r0', 'r1', 'r2', 'r3', 'r4', 'r7', 'r8'],
+            list(predicted.index))
+        self.assertEqual(['r0', 'r1', 'r2'], list(predicted.loc['r1']))
+        self.assertEqual(['', '', ''], list(predicted.loc['r3']))
+        self.assertEqual(['', '', ''], list(predicted.loc['r4']))
+        self.assertEqual(['', '', 'r5'], list(predicted.loc['r7']))
+        self.assertEqual(['', 'r8', ''], list(predicted.loc['r8']))
+
+    def test_same_as_reference(self):
+        """Checks predict() against the record by record consistency check."""
+        seed_ids = ['r9', 'r7', 'r0', 'r5', 'r4', 'r3', 'r8']
+        predicted = self.clf.predict(seed_ids)
+        self.assertEqual(
+            _predict_reference(self.clf._best_of, self.clf._years, seed_ids),
+            dict(zip(predicted.index, predicted.to_numpy().tolist())))
+
+        plants_df, X = _random_plants(n_records=60, seed=1)  # noqa: N806
+        for min_sim in (0.8, 0.9, 0.95):
+            clf = ferc1.FERCPlantClassifier(
+                min_sim=min_sim, plants_df=plants_df).fit(X)
+            predicted = clf.predict(plants_df.record_id)
+            self.assertEqual(
+                _predict_reference(
+                    clf._best_of, clf._years, plants_df.record_id),
+                dict(zip(predicted.index, predicted.to_numpy().tolist())))
+
+    def test_unknown_record(self):
+        """Checks that unknown record IDs aren't silently dropped."""
+        with self.assertRaises(KeyError):
+            self.clf.predict(['r0', 'not_a_record'])
+
+
+def _unpack_table_reference(ferc1_df, table_name, data_cols, data_rows):
+    """Unpacks a FERC table one year at a time, like the old code."""
+    row_map = (
+        pd.read_csv(
+            importlib.resources.open_text(
+                'pudl.package_data.meta.ferc1_row_maps',
+                f'{table_name}.csv'),
+            index_col=0, comment='#')
+        .copy().transpose()
+        .rename_axis(index='year_index', columns=None)
+    )
+    row_map.index = row_map.index.astype(int)
+    out_df = pd.DataFrame()
+    for year in row_map.index:
+        rename_dict = {v: k for k, v in dict(row_map.loc[year, :]).items()}
+        _ = rename_dict.pop(-1, None)
+        df = ferc1_df.loc[ferc1_df.report_year == year].copy()
+        df['row_name'] = (
+            df['row_number'].map(lambda x: rename_dict.get(x, x)))
+        out_df = pd.concat([out_df, df], axis='index')
+    idx_cols = [
+        'respondent_id', 'report_year', 'report_prd', 'spplmnt_num',
+        'row_name'
+    ]
+    return (
+        out_df.loc[:, idx_cols + data_cols]
+        .drop_duplicates(subset=idx_cols)
+        .set_index(idx_cols)
+        .unstack('row_name')
+        .loc[:, (slice(None), data_rows)]
+    )
+
+
+def _row_coded_df(row_numbers, years, n_respondents=3, seed=0):
+    """Returns row-coded FERC records, with a few duplicated records."""
+    rng = np.random.default_rng(seed)
+    df = pd.DataFrame(
+        [(resp, year, 12, 0, row)
+         for resp in range(1, n_respondents + 1)
+         for year in years
+         for row in row_numbers],
+        columns=['respondent_id', 'report_year', 'report_prd',
+                 'spplmnt_num', 'row_number'])
+    df['amount'] = rng.uniform(0, 1000, len(df)).round(2)
+    df['prev_amount'] = rng.uniform(0, 1000, len(df)).round(2)
+    df['row_name'] = ''
+    return pd.concat([df, df.sample(5, random_state=seed)],
+                     ignore_index=True)
+
+
+def _sort_row_names(df):
+    """Sorts the unstacked columns, which may be in a different order."""
+    return df.reindex(
+        columns=sorted(df.columns, key=lambda col: (col[0], str(col[1]))))
+
+
+class TestUnpackTable(unittest.TestCase):
+    """Tests that unpacking row-coded tables matches the old per-year loop."""
+
+    row_map_csv = (
+        '# A small row map, with the quirks of the real ones.\n'
+        'row_name,2017,2018\n'
+        'revenue,1,1\n'
+        'expenses,2,-1\n'
+        'old_total,3,2\n'
+        'new_total,3,3\n'
+    )
+
+    def _unpack(self, unpack, ferc1_df, data_rows=slice(None)):
+        with mock.patch.object(
+                ferc1.importlib.resources, 'open_text',
+                lambda package, resource: io.StringIO(self.row_map_csv)):
+            return unpack(ferc1_df, 'f1_test', ['amount', 'prev_amount'],
+                          data_rows)
+
+    def test_same_as_loop(self):
+        """Row names, duplicates and unmapped rows match the old loop."""
+        ferc1_df = _row_coded_df([1, 2, 3, 4], [2016, 2017, 2018])
+        expected = self._unpack(_unpack_table_reference, ferc1_df)
+        actual = self._unpack(ferc1.unpack_table, ferc1_df)
+        pd.testing.assert_frame_equal(
+            _sort_row_names(expected), _sort_row_names(actual))
+
+    def test_row_names(self):
+        """Checks the -1, duplicate and unmapped row number handling."""
+        ferc1_df = _row_coded_df([1, 2, 3, 4], [2016, 2017, 2018])
+        df = self._unpack(ferc1.unpack_table, ferc1_df)
+        amount = df['amount'].reset_index(
+            ['respondent_id', 'report_prd', 'spplmnt_num'], drop=True)
+        # Years missing from the row map are dropped.
+        self.assertEqual([2017, 2018], sorted(amount.index.unique()))
+        # The last row name sharing a row number wins.
+        self.assertTrue(amount.loc[2017, 'old_total'].isna().all())
+        self.assertTrue(amount.loc[2017, 'new_total'].notna().all())
+        # Row numbers of -1 aren't mapped, and row 2 is old_total in 2018.
+        self.assertTrue(amount.loc[2018, 'expenses'].isna().all())
+        self.assertTrue(amount.loc[2018, 'old_total'].notna().all())
+        # Unmapped row numbers are kept as they are, rather than dropped.
+        self.assertIn(4, amount.columns)
+        self.assertTrue(amount.loc[:, 4].notna().all())
+        selected = self._unpack(
+            ferc1.unpack_table, ferc1_df, data_rows=['revenue', 'new_total'])
+        self.assertEqual(
+            ['revenue', 'new_total'],
+            list(selected['amount'].columns))
+
+    def test_package_row_maps(self):
+        """The real row maps give the same tables as the old loop."""
+        for table_name in ('f1_dacs_epda', 'f1_elc_op_mnt_expn',
+                           'f1_elctrc_oper_rev', 'f1_income_stmnt',
+                           'f1_plant_in_srvce', 'f1_sales_by_sched'):
+            with self.subTest(table_name=table_name):
+                row_map = pd.read_csv(
+                    importlib.resources.open_text(
+                        'pudl.package_data.meta.ferc1_row_maps',
+                        f'{table_name}.csv'),
+                    index_col=0, comment='#')
+                years = [int(year) for year in row_map.columns]
+                row_numbers = range(1, int(row_map.max().max()) + 3)
+                ferc1_df = _row_coded_df(
+                    row_numbers, [years[0] - 1] + years, n_respondents=2)
+                args = (table_name, ['amount', 'prev_amount'], slice(None))
+                pd.testing.assert_frame_equal(
+                    _sort_row_names(
+                        _unpack_table_reference(ferc1_df, *args)),
+                    _sort_row_names(ferc1.unpack_table(ferc1_df, *args)))